@@ -0,0 +1,85 @@
+"""
+Micro-benchmark for the KlAkOAPI JSON codec on a large ChunkAccessor.GetItemsChunk payload.
+
+Compares the stdlib path (response.text + json.loads, json.dumps with KlAkParamsEncoder)
+with the orjson codec (response.content bytes, params unwrapped once).
+
+    PYTHONPATH=src python benchmarks/bench_codec.py --rows 5000
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from KlAkOAPI.Base import KlAkBase
+from KlAkOAPI.Codec import SetCodec
+from KlAkOAPI.Params import KlAkArray, KlAkParams
+
+
+def chunk_payload(rows: int) -> bytes:
+    items = [
+        {
+            "type": "params",
+            "value": {
+                "KLHST_WKS_DN": f"Host {i}",
+                "KLHST_WKS_HOSTNAME": f"{i:08x}-4f1c-11ee-be56-0242ac120002",
+                "KLHST_WKS_GRP": {"type": "long", "value": i % 40},
+                "KLHST_WKS_STATUS": {"type": "long", "value": 1},
+                "KLHST_WKS_STATUS_ID": i % 4,
+                "KLHST_WKS_IP": {"type": "long", "value": 3232235520 + i},
+                "KLHST_WKS_LAST_INFOUDATE": {"type": "datetime", "value": "2024-05-01T10:00:00Z"},
+                "name": f"Группа {i % 40}",
+            },
+        }
+        for i in range(rows)
+    ]
+    return json.dumps({"pChunk": {"KLCSP_ITERATOR_ARRAY": items}, "PxgRetVal": rows}).encode()
+
+
+def request_params(rows: int) -> dict:
+    fields = KlAkArray([f"FIELD_{i}" for i in range(rows)])
+    params = KlAkParams({"KLGRP_FIND_FROM_CUR_VS_ONLY": True, "name": "Группа"})
+    return {"wstrFilter": '(KLHST_WKS_DN="*")', "vecFieldsToReturn": fields, "pParams": params}
+
+
+def measure(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    content = chunk_payload(args.rows)
+    request = request_params(args.rows)
+    base = KlAkBase()
+
+    print(f"GetItemsChunk payload: {args.rows} rows, {len(content) / 1024:.0f} KiB")
+    results = {}
+    for name in ("json", "orjson"):
+        try:
+            SetCodec(name)
+        except ImportError:
+            print(f"{name:>7}: not installed")
+            continue
+        # The stdlib path keeps the old behaviour of decoding response.text first
+        body = content.decode("utf-8") if name == "json" else content
+        decode = measure(lambda: base.ParseResponse(200, body), args.repeat)
+        encode = measure(lambda: base.EncodeParams(request), args.repeat)
+        results[name] = decode
+        print(f"{name:>7}: parse {decode:8.2f} ms   encode {encode:8.2f} ms (median)")
+
+    if len(results) == 2:
+        print(f"parse speedup: {results['json'] / results['orjson']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
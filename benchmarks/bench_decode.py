@@ -0,0 +1,166 @@
+"""
+Micro-benchmark for decoding FindHosts rows (KLCSP_ITERATOR_ARRAY) into HostInfo.
+
+Compares the per-row decoder the service used before (a KlAkParams lookup with a caught
+exception per missing attribute, validated HostInfo) with the table-driven column decoder
+(server.ksc.host_rows.decode_hosts) on the same parsed GetItemsChunk response.
+
+    PYTHONPATH=src python benchmarks/bench_decode.py --rows 50000
+"""
+
+import argparse
+import json
+import socket
+import statistics
+import struct
+import time
+
+from KlAkOAPI.Base import KlAkBase
+
+from server.ksc.host_rows import decode_hosts
+from server.models import HostInfo
+
+RTP_MAP = {
+    0: "Unknown",
+    1: "Stopped",
+    2: "Suspended",
+    3: "Starting",
+    4: "Running",
+    5: "Running (Max Protection)",
+    6: "Running (Max Speed)",
+    7: "Running (Recommended)",
+    8: "Running (Custom)",
+    9: "Failure",
+}
+
+
+def chunk_payload(rows: int) -> bytes:
+    items = []
+    for i in range(rows):
+        value = {
+            "KLHST_WKS_DN": f"Host {i}",
+            "KLHST_WKS_GRP": {"type": "long", "value": i % 40},
+            "KLHST_WKS_STATUS": {"type": "long", "value": (1, 5, 13, 29)[i % 4]},
+            "KLHST_WKS_STATUS_ID": i % 3,
+            "KLHST_WKS_IP": {"type": "long", "value": 0x0100A8C0 + (i << 24) - 2**31},
+            "KLHST_WKS_RTP_STATE": i % 10,
+            "name": f"Host {i}",
+        }
+        # Hosts that never reported a network name or an address
+        if i % 7:
+            value["KLHST_WKS_HOSTNAME"] = f"{i:08x}-4f1c-11ee-be56-0242ac120002"
+        else:
+            del value["KLHST_WKS_IP"]
+        items.append({"type": "params", "value": value})
+    return json.dumps({"pChunk": {"KLCSP_ITERATOR_ARRAY": items}, "PxgRetVal": rows}).encode()
+
+
+def _safe_get(obj, key, default):
+    try:
+        return obj[key]
+    except Exception:
+        return default
+
+
+def per_row(item) -> HostInfo:
+    """The previous decoder, one row at a time."""
+    unique_name = _safe_get(item, "KLHST_WKS_HOSTNAME", "")
+    if not unique_name:
+        unique_name = _safe_get(item, "KLHST_WKS_DN", "")
+    grp_id = _safe_get(item, "KLHST_WKS_GRP", 0)
+    grp_name = "Managed Devices" if grp_id == 0 else "Unknown"
+    dn = _safe_get(item, "KLHST_WKS_DN", "Unknown")
+    hostname = _safe_get(item, "KLHST_WKS_HOSTNAME", "Unknown")
+    status = _safe_get(item, "KLHST_WKS_STATUS", "0")
+    ip_val = _safe_get(item, "KLHST_WKS_IP", None)
+
+    ip_str = None
+    if ip_val is not None:
+        try:
+            ip_int = int(ip_val)
+            if ip_int < 0:
+                ip_int += 2**32
+            ip_str = socket.inet_ntoa(struct.pack("<I", ip_int))
+        except Exception:
+            ip_str = str(ip_val)
+
+    rtp_state_val = _safe_get(item, "KLHST_WKS_RTP_STATE", 0)
+    try:
+        rtp_int = int(rtp_state_val)
+        rtp_desc = dict(RTP_MAP).get(rtp_int, str(rtp_int))
+    except Exception:
+        rtp_desc = str(rtp_state_val)
+
+    status_id_val = _safe_get(item, "KLHST_WKS_STATUS_ID", 0)
+    try:
+        sid_int = int(status_id_val)
+        status_id_desc = {0: "OK", 1: "Critical", 2: "Warning"}.get(sid_int, str(sid_int))
+    except Exception:
+        status_id_desc = str(status_id_val)
+
+    status_str = str(status)
+    try:
+        s_int = int(status)
+        parts = []
+        if s_int & 0b1:
+            parts.append("Visible")
+        if s_int & 0b100:
+            parts.append("Agent Installed")
+        if s_int & 0b1000:
+            parts.append("Agent Active")
+        if s_int & 0b10000:
+            parts.append("RTP Installed")
+        details = ", ".join(parts) if parts else "None"
+        status_str = f"[{status_id_desc}] Status: {status} ({details}) | RTP: {rtp_desc}"
+    except Exception:
+        pass
+
+    return HostInfo(
+        id=str(unique_name),
+        name=str(hostname),
+        display_name=str(dn),
+        group_id=grp_id,
+        group_name=grp_name,
+        status=status_str,
+        ip_address=ip_str,
+    )
+
+
+def measure(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    response = KlAkBase().ParseResponse(200, chunk_payload(args.rows))
+    items = response.OutPar("pChunk")["KLCSP_ITERATOR_ARRAY"]
+
+    old = [per_row(item) for item in items]
+    new = decode_hosts(items)
+    if [host.model_dump() for host in old] != [host.model_dump() for host in new]:
+        raise SystemExit("decoders disagree")
+
+    print(f"KLCSP_ITERATOR_ARRAY: {args.rows} rows")
+    results = {}
+    for name, decode in (
+        ("per-row", lambda: [per_row(item) for item in items]),
+        ("columns", lambda: decode_hosts(items)),
+    ):
+        results[name] = measure(decode, args.repeat)
+        rate = args.rows / results[name] * 1000
+        print(f"{name:>8}: {results[name]:8.2f} ms (median, {rate:,.0f} rows/s)")
+
+    print(f"speedup: {results['per-row'] / results['columns']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Full fleet export: walks every host of one FindHosts accessor against the fake KSC server.
+
+Compares fixed KSC_CHUNK_SIZE chunks read one after the other with adaptive chunk sizes
+and read-ahead of the next chunk while the current one is decoded.
+
+The KSC_* credentials only need to pass settings validation; the fake server is used.
+
+    KSC_HOST=http://fake KSC_USERNAME=user KSC_PASSWORD=pass PYTHONPATH=src:. \
+        python benchmarks/bench_export.py --hosts 100000 --latency-ms 5
+"""
+
+import argparse
+import time
+
+from benchmarks.harness import FakeKscProcess
+
+from server.ksc.chunks import ChunkSizer
+from server.ksc.host_rows import decode_hosts
+from server.ksc.service import KscService
+from server.settings import settings
+
+
+def export(service: KscService) -> int:
+    """Reads and decodes every host; returns the row count."""
+    with service._pool.session() as member:
+        position = service._find_hosts_sync(member, '(KLHST_WKS_DN="*")')
+        try:
+            chunks = service._iter_chunks_sync(member.server, position.accessor, 0, position.total)
+            return sum(len(decode_hosts(items)) for items in chunks)
+        finally:
+            service.accessors.release(position.accessor)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--hosts", type=int, default=100000)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with FakeKscProcess(hosts=args.hosts, latency_ms=args.latency_ms) as ksc:
+        settings.KSC_HOST = ksc.url
+        settings.KSC_USERNAME = "user"
+        settings.KSC_PASSWORD = "pass"
+        settings.KSC_TOOL_TIMEOUT = 0
+
+        results = {}
+        for name, read_ahead, max_size in (
+            ("fixed", False, settings.KSC_CHUNK_SIZE),
+            ("adaptive", True, settings.KSC_CHUNK_SIZE_MAX),
+        ):
+            settings.KSC_CHUNK_READ_AHEAD = read_ahead
+            service = KscService()
+            service.chunk_sizer = ChunkSizer(initial=settings.KSC_CHUNK_SIZE, max_size=max_size)
+            try:
+                samples = []
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    rows = export(service)
+                    samples.append(time.perf_counter() - started)
+                stats = service.chunk_sizer.stats()
+            finally:
+                service.close()
+            results[name] = min(samples)
+            print(
+                f"{name:>8}: {rows} hosts in {results[name]:6.2f} s "
+                f"(chunk size {stats['size']}, {stats['row_bytes']:.0f} bytes/row)"
+            )
+
+    print(f"speedup: {results['fixed'] / results['adaptive']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Micro-benchmark for tool output: a get_hosts page as a pretty-printed JSON string (the
+former output) versus structured content with each MCP_TOOL_TEXT rendering.
+
+Measures FastMCP's result conversion plus the JSON-RPC serialization of the response. Note
+that FastMCP sends the string result of a `-> str` tool twice, as the text block and as
+{"result": ...} structured content.
+
+This is server-side cost only: the client's jsonschema check of the structured content
+against the tool's output schema is not included. benchmarks/test_tools.py measures the
+whole call.
+
+    KSC_HOST=http://fake KSC_USERNAME=user KSC_PASSWORD=pass PYTHONPATH=src \
+        python benchmarks/bench_output.py --hosts 5000
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Annotated
+
+from mcp.server.fastmcp import FastMCP
+from mcp.types import CallToolResult, JSONRPCResponse
+
+from server.models import HostInfo, HostPage
+from server.settings import settings
+from server.tools.output import TEXT_FORMATS, listing, tool_result
+
+
+def host_page(hosts: int) -> HostPage:
+    return HostPage(
+        hosts=[
+            HostInfo(
+                id=f"{i:08x}-4f1c-11ee-be56-0242ac120002",
+                name=f"{i:08x}-4f1c-11ee-be56-0242ac120002",
+                display_name=f"Host {i}",
+                group_id=i % 40,
+                status="[OK] Status: 13 (Visible, Agent Installed, Agent Active) | RTP: Running",
+                ip_address=f"10.0.{i // 256 % 256}.{i % 256}",
+            )
+            for i in range(hosts)
+        ],
+        total=hosts * 10,
+        next_cursor="c" * 160,
+    )
+
+
+def build_mcp(page: HostPage) -> FastMCP:
+    mcp = FastMCP("bench")
+
+    @mcp.tool()
+    async def pretty_json() -> str:
+        return json.dumps(page.model_dump(), indent=2)
+
+    @mcp.tool()
+    async def structured() -> Annotated[CallToolResult, listing(HostPage)]:
+        return tool_result(page)
+
+    return mcp
+
+
+async def respond(mcp: FastMCP, name: str) -> str:
+    result = await mcp.call_tool(name, {})
+    if not isinstance(result, CallToolResult):
+        # A `-> str` tool is wrapped by FastMCP: the text block plus {"result": text}
+        content, structured = result
+        result = CallToolResult(content=list(content), structuredContent=structured)
+    response = JSONRPCResponse(jsonrpc="2.0", id=1, result=result.model_dump(exclude_none=True))
+    return response.model_dump_json(by_alias=True, exclude_none=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--hosts", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    mcp = build_mcp(host_page(args.hosts))
+    results = {}
+    for name, text in [("pretty_json", None)] + [("structured", f) for f in TEXT_FORMATS]:
+        label = name if text is None else f"{name}/{text}"
+        if text is not None:
+            settings.MCP_TOOL_TEXT = text
+        samples = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            body = asyncio.run(respond(mcp, name))
+            samples.append(time.perf_counter() - started)
+        results[label] = (statistics.median(samples) * 1000, len(body))
+        print(f"{label:>18}: {results[label][0]:8.2f} ms  {results[label][1] / 1024:8.0f} KiB")
+
+    base_ms, base_bytes = results["pretty_json"]
+    for label, (ms, size) in results.items():
+        if label != "pretty_json":
+            print(f"{label:>18}: {ms / base_ms:.2f}x time, {size / base_bytes:.2f}x bytes")
+
+
+if __name__ == "__main__":
+    main()
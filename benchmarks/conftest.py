@@ -0,0 +1,92 @@
+"""
+Benchmark suite: every MCP tool end to end through FastMCP against the fake KSC server.
+
+    PYTHONPATH=src python -m pytest benchmarks -q
+    PYTHONPATH=src python -m pytest benchmarks -q --bench-sizes 1000,100000 --bench-save-baseline
+
+Results are compared with benchmarks/baseline.json; pass --bench-fail-on-regression to fail
+on p95 latency or throughput worse than the baseline by more than --bench-tolerance.
+"""
+
+import pytest
+from benchmarks.harness import FakeKscProcess, load_baseline, regression, save_baseline
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--bench-sizes", default="1000,10000,100000", help="fleet sizes to test")
+    group.addoption("--bench-calls", type=int, default=50, help="tool calls per scenario")
+    group.addoption("--bench-concurrency", type=int, default=8, help="concurrent tool calls")
+    group.addoption("--bench-latency-ms", type=float, default=2.0, help="fake KSC latency per call")
+    group.addoption(
+        "--bench-save-baseline", action="store_true", help="write results to baseline.json"
+    )
+    group.addoption(
+        "--bench-tolerance", type=float, default=0.5, help="allowed slowdown vs the baseline"
+    )
+    group.addoption(
+        "--bench-fail-on-regression",
+        action="store_true",
+        help="fail scenarios that regressed beyond --bench-tolerance",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "fleet_size" in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption("--bench-sizes").split(",")]
+        metafunc.parametrize("fleet_size", sizes, scope="session", ids=lambda n: f"{n}hosts")
+
+
+def pytest_configure(config):
+    config.bench_results = {}
+
+
+@pytest.fixture(scope="session")
+def fake_ksc_fleet(fleet_size, pytestconfig):
+    with FakeKscProcess(
+        hosts=fleet_size, latency_ms=pytestconfig.getoption("--bench-latency-ms")
+    ) as process:
+        yield process
+
+
+@pytest.fixture
+def record_result(request):
+    """Stores a BenchResult for the summary and checks it against the baseline."""
+    config = request.config
+    baseline = load_baseline()
+
+    def record(result):
+        config.bench_results[result.name] = result
+        problem = regression(
+            result, baseline.get(result.name), config.getoption("--bench-tolerance")
+        )
+        if problem and config.getoption("--bench-fail-on-regression"):
+            pytest.fail(f"{result.name} regressed: {problem}")
+
+    return record
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = getattr(config, "bench_results", {})
+    if not results:
+        return
+    baseline = load_baseline()
+    tolerance = config.getoption("--bench-tolerance")
+    write = terminalreporter.write_line
+    terminalreporter.section("benchmarks")
+    write(
+        f"{'scenario':<34}{'calls/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+        f"{'RSS MB':>8}{'vs baseline p95':>17}"
+    )
+    for name, result in sorted(results.items()):
+        base = baseline.get(name)
+        delta = f"{(result.p95_ms / base['p95_ms'] - 1) * 100:+.0f}%" if base else "-"
+        if regression(result, base, tolerance):
+            delta += " REGRESSED"
+        write(
+            f"{name:<34}{result.throughput:>9.1f}{result.p50_ms:>9.1f}{result.p95_ms:>9.1f}"
+            f"{result.p99_ms:>9.1f}{result.peak_rss_mb:>8.0f}{delta:>17}"
+        )
+    if config.getoption("--bench-save-baseline"):
+        save_baseline(results)
+        write("baseline saved to benchmarks/baseline.json")
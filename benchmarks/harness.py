@@ -0,0 +1,206 @@
+"""
+Measurement helpers for the benchmark suite: latency percentiles, throughput, peak RSS,
+the fake KSC process and baseline comparison.
+"""
+
+import json
+import math
+import os
+import resource
+import socket
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import anyio
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+
+@dataclass
+class BenchResult:
+    name: str
+    calls: int
+    concurrency: int
+    throughput: float  # calls per second
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    peak_rss_mb: float
+    errors: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def _current_rss_mb() -> Optional[float]:
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        return None
+
+
+class RssSampler:
+    """Samples this process's RSS in a background thread; ru_maxrss where /proc is missing."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            rss = _current_rss_mb()
+            if rss is None:
+                # Linux reports KiB, macOS bytes; this is the lifetime peak
+                scale = 2**20 if sys.platform == "darwin" else 2**10
+                rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+            self.peak_mb = max(self.peak_mb, rss)
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "RssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+
+async def measure(name: str, call, calls: int, concurrency: int) -> BenchResult:
+    """Runs `await call(i)` for i in range(calls), `concurrency` at a time."""
+    latencies: List[float] = []
+    errors = 0
+    limiter = anyio.CapacityLimiter(concurrency)
+
+    async def one(i: int):
+        nonlocal errors
+        async with limiter:
+            started = time.perf_counter()
+            try:
+                await call(i)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    with RssSampler() as rss:
+        started = time.perf_counter()
+        async with anyio.create_task_group() as tg:
+            for i in range(calls):
+                tg.start_soon(one, i)
+        elapsed = time.perf_counter() - started
+
+    return BenchResult(
+        name=name,
+        calls=calls,
+        concurrency=concurrency,
+        throughput=calls / elapsed if elapsed else 0.0,
+        p50_ms=percentile(latencies, 50) * 1000,
+        p95_ms=percentile(latencies, 95) * 1000,
+        p99_ms=percentile(latencies, 99) * 1000,
+        peak_rss_mb=rss.peak_mb,
+        errors=errors,
+    )
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class FakeKscProcess:
+    """Runs tests/fake_ksc.py in its own process so it does not share the GIL or RSS."""
+
+    def __init__(self, hosts: int, latency_ms: float = 0.0, groups: int = 20):
+        self.hosts = hosts
+        self.latency_ms = latency_ms
+        self.groups = groups
+        self.port = _free_port()
+        self._process: Optional[subprocess.Popen] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "FakeKscProcess":
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT / "src"), str(ROOT)]))
+        self._process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "tests.fake_ksc",
+                "--port",
+                str(self.port),
+                "--hosts",
+                str(self.hosts),
+                "--groups",
+                str(self.groups),
+                "--latency-ms",
+                str(self.latency_ms),
+            ],
+            cwd=ROOT,
+            env=env,
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError("Fake KSC server exited during startup")
+            try:
+                socket.create_connection(("127.0.0.1", self.port), timeout=0.2).close()
+                return self
+            except OSError:
+                time.sleep(0.05)
+        self.__exit__()
+        raise RuntimeError("Fake KSC server did not start")
+
+    def __exit__(self, *exc_info):
+        if self._process is not None:
+            self._process.terminate()
+            self._process.wait(timeout=10)
+            self._process = None
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, dict]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text()).get("results", {})
+
+
+def save_baseline(results: Dict[str, BenchResult], path: Path = BASELINE_PATH):
+    data = {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "results": {name: result.to_dict() for name, result in sorted(results.items())},
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def regression(result: BenchResult, baseline: Optional[dict], tolerance: float) -> Optional[str]:
+    """Describes how `result` is worse than `baseline` beyond `tolerance`, or None."""
+    if not baseline:
+        return None
+    problems = []
+    if result.p95_ms > baseline["p95_ms"] * (1 + tolerance):
+        problems.append(f"p95 {baseline['p95_ms']:.1f} -> {result.p95_ms:.1f} ms")
+    if result.throughput < baseline["throughput"] / (1 + tolerance):
+        problems.append(f"throughput {baseline['throughput']:.1f} -> {result.throughput:.1f}/s")
+    return ", ".join(problems) or None
@@ -0,0 +1,97 @@
+"""Drives each MCP tool through a real FastMCP server and client session."""
+
+from typing import Callable, Dict, Tuple
+
+import anyio
+import pytest
+from benchmarks.harness import measure
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+from tests.fake_ksc import FakeFleet, FakeKscConfig
+
+import server.tools.groups
+import server.tools.hosts
+import server.tools.tasks
+from server.ksc.service import KscService
+from server.settings import settings
+
+TOOL_MODULES = [server.tools.hosts, server.tools.groups, server.tools.tasks]
+
+# scenario -> (tool name, arguments for the i-th call on the given fleet)
+Scenario = Callable[[FakeFleet, int], Tuple[str, Dict]]
+SCENARIOS: Dict[str, Scenario] = {
+    "get_hosts": lambda fleet, i: ("get_hosts", {"query": {"limit": 500}}),
+    "get_hosts_critical": lambda fleet, i: (
+        "get_hosts",
+        {"query": {"status": "Critical", "limit": 500}},
+    ),
+    "get_hosts_fields": lambda fleet, i: (
+        "get_hosts",
+        {"query": {"limit": 500, "fields": ["name", "status"]}},
+    ),
+    "get_host_details": lambda fleet, i: (
+        "get_host_details",
+        {"host_id": fleet.host_name(i * 7919 % fleet.config.hosts)},
+    ),
+    "move_host": lambda fleet, i: (
+        "move_host",
+        {
+            "params": {
+                "host_id": fleet.host_name(i * 7919 % fleet.config.hosts),
+                "target_group_id": 1 + i % fleet.config.groups,
+            }
+        },
+    ),
+    "list_groups": lambda fleet, i: ("list_groups", {"query": {}}),
+    "list_tasks": lambda fleet, i: ("list_tasks", {"group_id": 1 + i % fleet.config.groups}),
+    "list_tasks_all_groups": lambda fleet, i: ("list_tasks", {"scan_all_groups": True}),
+    "run_task": lambda fleet, i: ("run_task", {"task_id": f"task-{1 + i % 20}-0"}),
+    "get_task_state": lambda fleet, i: ("get_task_state", {"task_id": f"task-{1 + i % 20}-0"}),
+}
+
+
+def _build_mcp(service: KscService, monkeypatch) -> FastMCP:
+    mcp = FastMCP("ksc-mcp-bench")
+    for module in TOOL_MODULES:
+        monkeypatch.setattr(module, "ksc_service", service)
+        module.register(mcp)
+    return mcp
+
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_tool(scenario, fleet_size, fake_ksc_fleet, pytestconfig, record_result, monkeypatch):
+    monkeypatch.setattr(settings, "KSC_HOST", fake_ksc_fleet.url)
+    monkeypatch.setattr(settings, "KSC_USERNAME", "user")
+    monkeypatch.setattr(settings, "KSC_PASSWORD", "pass")
+    monkeypatch.setattr(settings, "KSC_INVENTORY_PATH", None)
+    # Every call must reach the fake KSC: no result cache hits, no coalesced requests
+    for ttl in ("HOSTS", "HOST_DETAILS", "GROUPS", "TASKS"):
+        monkeypatch.setattr(settings, f"KSC_CACHE_TTL_{ttl}", 0)
+    monkeypatch.setattr(settings, "KSC_SINGLE_FLIGHT", False)
+    fleet = FakeFleet(FakeKscConfig(hosts=fleet_size, groups=fake_ksc_fleet.groups))
+    calls = pytestconfig.getoption("--bench-calls")
+    concurrency = pytestconfig.getoption("--bench-concurrency")
+
+    service = KscService()
+    mcp = _build_mcp(service, monkeypatch)
+
+    async def run():
+        async with create_connected_server_and_client_session(mcp) as client:
+
+            async def call(i: int):
+                name, arguments = SCENARIOS[scenario](fleet, i)
+                result = await client.call_tool(name, arguments)
+                if result.isError:
+                    raise RuntimeError(result.content[0].text)
+
+            # Warm-up: connects pool sessions, imports, first FindHosts
+            await call(0)
+            return await measure(f"{scenario}[{fleet_size}]", call, calls, concurrency)
+
+    try:
+        result = anyio.run(run)
+    finally:
+        service.close()
+
+    assert result.errors == 0
+    record_result(result)
@@ -1,9 +1,6 @@
 #! /usr/bin/python -tt
 
-import json
-
 from .Base import KlAkBase
-from .Params import KlAkParamsEncoder
 
 
 class KlAkAKPatches (KlAkBase):
@@ -13,16 +10,16 @@ class KlAkAKPatches (KlAkBase):
 
     def ApprovePatch(self, szwPatchId, parOptions):
         data = {'szwPatchId': szwPatchId, 'parOptions': parOptions}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AKPatches.ApprovePatch'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AKPatches.ApprovePatch'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
     def ForbidPatch(self, szwPatchId, parOptions):
         data = {'szwPatchId': szwPatchId, 'parOptions': parOptions}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AKPatches.ForbidPatch'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AKPatches.ForbidPatch'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
     def GetAppLatestPatchesInfo(self, pAppData):
         data = {'pAppData': pAppData}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AKPatches.GetAppLatestPatchesInfo'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AKPatches.GetAppLatestPatchesInfo'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
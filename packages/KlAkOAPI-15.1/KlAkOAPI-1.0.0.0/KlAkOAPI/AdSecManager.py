@@ -1,9 +1,6 @@
 #! /usr/bin/python -tt
 
-import json
-
 from .Base import KlAkBase
-from .Params import KlAkParamsEncoder
 
 
 class KlAkAdSecManager (KlAkBase):
@@ -13,11 +10,11 @@ class KlAkAdSecManager (KlAkBase):
 
     def ApproveDetect(self, pArrDetects):
         data = {'pArrDetects': pArrDetects}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdSecManager.ApproveDetect'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdSecManager.ApproveDetect'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False)
 
     def DisproveDetect(self, pArrDetects):
         data = {'pArrDetects': pArrDetects}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdSecManager.DisproveDetect'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdSecManager.DisproveDetect'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False)
 
@@ -1,9 +1,6 @@
 #! /usr/bin/python -tt
 
-import json
-
 from .Base import KlAkBase
-from .Params import KlAkParamsEncoder
 
 
 class KlAkAdfsSso (KlAkBase):
@@ -13,31 +10,31 @@ class KlAkAdfsSso (KlAkBase):
 
     def GetSettings(self, bExtenedSettings):
         data = {'bExtenedSettings': bExtenedSettings}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdfsSso.GetSettings'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdfsSso.GetSettings'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
     def GetJwks(self):
         data = {}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdfsSso.GetJwks'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdfsSso.GetJwks'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
     def SetSettings(self, pAdfsSettings):
         data = {'pAdfsSettings': pAdfsSettings}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdfsSso.SetSettings'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdfsSso.SetSettings'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False)
 
     def SetAdfsEnabled(self, bEnabled):
         data = {'bEnabled': bEnabled}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdfsSso.SetAdfsEnabled'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdfsSso.SetAdfsEnabled'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False)
 
     def GetAdfsEnabled(self):
         data = {}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdfsSso.GetAdfsEnabled'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdfsSso.GetAdfsEnabled'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
     def CreateNonceAndStateForUserSession(self, wstrUserSessionId):
         data = {'wstrUserSessionId': wstrUserSessionId}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdfsSso.CreateNonceAndStateForUserSession'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False, out_pars=['wstrNonce', 'wstrState'])
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdfsSso.CreateNonceAndStateForUserSession'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False, out_pars=['wstrNonce', 'wstrState'])
 
@@ -41,6 +41,7 @@ class KlAkAdmServer(KlAkBase):
         self.user_account = None
         self.token = None
         self.connected = False
+        self.login_timeout = None
         pass
 
     def __SetAuthType(self, auth_type):
@@ -82,7 +83,7 @@ class KlAkAdmServer(KlAkBase):
 
             data = {}
 
-            response = self.session.post(url = self.Call("login"), headers = auth_headers, data = data, verify = verify)
+            response = self.session.post(url = self.Call("login"), headers = auth_headers, data = data, verify = verify, timeout = self.login_timeout)
 
             # after request is sent, server answers with challenge; we need to response
             if response.status_code == 401:
@@ -127,7 +128,7 @@ class KlAkAdmServer(KlAkBase):
 
         data = {}
 
-        response = self.session.post(url = self.Call("login"), headers = auth_headers, data = data, verify = verify)
+        response = self.session.post(url = self.Call("login"), headers = auth_headers, data = data, verify = verify, timeout = self.login_timeout)
 
         return response
 
@@ -147,11 +148,12 @@ class KlAkAdmServer(KlAkBase):
         if self.auth_type == self.AuthType.GATEWAY_AUTH:
             return
 
-        return self.ParseResponse(response.status_code, response.text, retval=False)
+        return self.ParseResponse(response.status_code, response.content, retval=False)
 
-    def Create(url, user_account = None, password = None, domain = '', internal_user = False, verify = True, vserver = ''):
-        """ Creates, initializes and connects KSC server using basic authentication """
+    def Create(url, user_account = None, password = None, domain = '', internal_user = False, verify = True, vserver = '', timeout = None):
+        """ Creates, initializes and connects KSC server using basic authentication. timeout is passed to requests for the login call: seconds or (connect, read) tuple """
         server = KlAkAdmServer(url, vserver)
+        server.login_timeout = timeout
 
         if user_account is None or user_account == '':
             return KlAkAdmServer.CreateNTLM(url, verify, vserver)
@@ -170,9 +172,10 @@ class KlAkAdmServer(KlAkBase):
         server.__Connect(verify)
         return server
 
-    def CreateByToken(url, token, verify = True, vserver = ''):
-        """ Creates, initializes and connects KSC server using authentication by token """
+    def CreateByToken(url, token, verify = True, vserver = '', timeout = None):
+        """ Creates, initializes and connects KSC server using authentication by token. timeout is passed to requests for the login call """
         server = KlAkAdmServer(url, vserver)
+        server.login_timeout = timeout
         server.__SetAuthType(KlAkAdmServer.AuthType.TOKEN_AUTH)
         server.__SetToken(token)
         server.__Connect(verify)
@@ -1,9 +1,6 @@
 #! /usr/bin/python -tt
 
-import json
-
 from .Base import KlAkBase
-from .Params import KlAkParamsEncoder
 
 
 class KlAkAdmServerSettings (KlAkBase):
@@ -13,11 +10,11 @@ class KlAkAdmServerSettings (KlAkBase):
 
     def GetSharedFolder(self):
         data = {}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdmServerSettings.GetSharedFolder'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdmServerSettings.GetSharedFolder'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
     def ChangeSharedFolder(self, wstrNetworkPath):
         data = {'wstrNetworkPath': wstrNetworkPath}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdmServerSettings.ChangeSharedFolder'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AdmServerSettings.ChangeSharedFolder'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
@@ -1,9 +1,6 @@
 #! /usr/bin/python -tt
 
-import json
-
 from .Base import KlAkBase
-from .Params import KlAkParamsEncoder
 
 
 class KlAkAsyncActionStateChecker (KlAkBase):
@@ -13,6 +10,6 @@ class KlAkAsyncActionStateChecker (KlAkBase):
 
     def CheckActionState(self, wstrActionGuid):
         data = {'wstrActionGuid': wstrActionGuid}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AsyncActionStateChecker.CheckActionState'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False, out_pars=['bFinalized', 'bSuccededFinalized', 'lStateCode', 'pStateData', 'lNextCheckDelay'])
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'AsyncActionStateChecker.CheckActionState'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False, out_pars=['bFinalized', 'bSuccededFinalized', 'lStateCode', 'pStateData', 'lNextCheckDelay'])
 
@@ -4,17 +4,21 @@
 """ Basic class for KlAk types. Provides common data, basic methods and general response parsing """
 
 import http
-import json
 
+from .Codec import GetCodec
 from .Error import KlAkError, KlAkResponseError
-from .Params import KlAkArray, KlAkParams
+from .Params import KlAkArray, KlAkArrayView, KlAkParams, KlAkParamsView
 
 
 class KlAkResponse:
     __PxgRetVal = 'PxgRetVal'
     __PxgError = 'PxgError'
 
-    def __init__(self, respose_text):
+    def __init__(self, respose_text, lazy = True):
+        """ Return value and output parameters are wrapped into views (KlAkParamsView/KlAkArrayView) that decode values on access
+            and are copied into KlAkParams/KlAkArray on first modification.
+            With lazy = False they are copied into validated KlAkParams/KlAkArray objects up front instead """
+        params_type, array_type = (KlAkParamsView, KlAkArrayView) if lazy else (KlAkParams, KlAkArray)
         self.respose_text = respose_text
         self.error = None
         self.retval = None
@@ -25,16 +29,16 @@ class KlAkResponse:
             if KlAkResponse.__PxgRetVal in respose_text:
                 self.retval = self.respose_text[KlAkResponse.__PxgRetVal]
                 if type(self.retval) is dict:
-                    self.retval = KlAkParams(self.retval)
+                    self.retval = params_type(self.retval)
                 elif type(self.retval) is list:
-                    self.retval = KlAkArray(self.retval)
+                    self.retval = array_type(self.retval)
             self.outpars = {}
             for key, value in self.respose_text.items():
                 if not key == KlAkResponse.__PxgRetVal and not key == KlAkResponse.__PxgError:
                     if type(value) is dict:
-                        self.outpars[key] = KlAkParams(value)
+                        self.outpars[key] = params_type(value)
                     elif type(value) is list:
-                        self.outpars[key] = KlAkArray(value)
+                        self.outpars[key] = array_type(value)
                     else:
                         self.outpars[key] = value
 
@@ -62,13 +66,20 @@ class KlAkBase:
     def __init__(self):
         pass
 
+    def EncodeParams(self, data):
+        """ Serializes method arguments into request body with current codec (see KlAkOAPI.Codec) """
+        return GetCodec().dumps(data)
+
     def ParseResponse(self, response_code, response_text, retval = True, out_pars = []):
-        """ Response parsing, including check for error, return value (retval) presence and output parameters processing """
+        """ Response parsing, including check for error, return value (retval) presence and output parameters processing.
+            response_text can be str (response.text) or bytes (response.content), bytes are parsed without decoding them into str first """
 
         if response_code != http.HTTPStatus.OK:
-            raise KlAkResponseError(response_text)
+            if type(response_text) is bytes:
+                response_text = response_text.decode('utf-8', errors = 'replace')
+            raise KlAkResponseError(response_text, status_code = response_code)
 
-        text = json.loads(response_text)
+        text = GetCodec().loads(response_text)
         return KlAkResponse(text)
 
 
@@ -1,9 +1,6 @@
 #! /usr/bin/python -tt
 
-import json
-
 from .Base import KlAkBase
-from .Params import KlAkParamsEncoder
 
 
 class KlAkCertPoolCtrl (KlAkBase):
@@ -13,11 +10,11 @@ class KlAkCertPoolCtrl (KlAkBase):
 
     def GetCertificateInfo(self, nVServerId, nFunction):
         data = {'nVServerId': nVServerId, 'nFunction': nFunction}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'CertPoolCtrl.GetCertificateInfo'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'CertPoolCtrl.GetCertificateInfo'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
     def SetCertificate(self, nVServerId, nFunction, pCertData):
         data = {'nVServerId': nVServerId, 'nFunction': nFunction, 'pCertData': pCertData}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'CertPoolCtrl.SetCertificate'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'CertPoolCtrl.SetCertificate'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False)
 
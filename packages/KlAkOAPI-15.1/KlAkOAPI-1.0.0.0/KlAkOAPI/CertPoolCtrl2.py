@@ -1,9 +1,6 @@
 #! /usr/bin/python -tt
 
-import json
-
 from .Base import KlAkBase
-from .Params import KlAkParamsEncoder
 
 
 class KlAkCertPoolCtrl2 (KlAkBase):
@@ -13,6 +10,6 @@ class KlAkCertPoolCtrl2 (KlAkBase):
 
     def GetCertificateInfoDetails(self, nVServerId, nFunction):
         data = {'nVServerId': nVServerId, 'nFunction': nFunction}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'CertPoolCtrl2.GetCertificateInfoDetails'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'CertPoolCtrl2.GetCertificateInfoDetails'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
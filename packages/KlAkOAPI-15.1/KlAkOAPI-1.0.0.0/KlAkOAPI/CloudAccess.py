@@ -1,9 +1,6 @@
 #! /usr/bin/python -tt
 
-import json
-
 from .Base import KlAkBase
-from .Params import KlAkParamsEncoder
 
 
 class KlAkCloudAccess (KlAkBase):
@@ -13,11 +10,11 @@ class KlAkCloudAccess (KlAkBase):
 
     def AcquireAccessForKeyPair(self, enCloudType, pKeyPair):
         data = {'enCloudType': enCloudType, 'pKeyPair': pKeyPair}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'CloudAccess.AcquireAccessForKeyPair'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False, out_pars=['bAllowScanning', 'bAllowDeployment'])
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'CloudAccess.AcquireAccessForKeyPair'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False, out_pars=['bAllowScanning', 'bAllowDeployment'])
 
     def VerifyCredentials(self, enCloudType, pKeyPair):
         data = {'enCloudType': enCloudType, 'pKeyPair': pKeyPair}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'CloudAccess.VerifyCredentials'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'CloudAccess.VerifyCredentials'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
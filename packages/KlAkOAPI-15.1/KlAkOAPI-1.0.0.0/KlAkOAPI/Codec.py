@@ -0,0 +1,79 @@
+# #!/usr/bin/python -tt
+# -*- coding: utf-8 -*-
+
+""" JSON codec for KLOAPI request bodies and responses. Uses orjson when it is installed (pip install KlAkOAPI[fast]),
+stdlib json otherwise. Another codec can be plugged in with SetCodec(...) """
+
+import json
+
+from .Params import KlAkArray, KlAkParams, KlAkParamsEncoder, binToStr
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def _UnwrapParams(data):
+    """ Request bodies are dicts of method arguments; KlAkParams/KlAkArray arguments already keep JSON-ready contents in .data,
+        so they are unwrapped once here instead of going through a default() callback per object """
+    if type(data) is not dict:
+        return data
+    return {key: value.data if isinstance(value, (KlAkParams, KlAkArray)) else value for key, value in data.items()}
+
+
+def _Default(o):
+    """ Fallback for values nested in raw dicts/lists, same conversions as KlAkParamsEncoder """
+    if isinstance(o, (KlAkParams, KlAkArray)):
+        return o.data
+    elif type(o) is bytes:
+        return binToStr(o)
+    raise TypeError('Object of type ' + type(o).__name__ + ' is not JSON serializable')
+
+
+class KlAkJsonCodec:
+    """ Codec based on stdlib json """
+    name = 'json'
+
+    def dumps(self, data):
+        """ Serializes request body, returns str """
+        return json.dumps(_UnwrapParams(data), cls = KlAkParamsEncoder)
+
+    def loads(self, content):
+        """ Parses response body given as bytes (response.content) or str """
+        return json.loads(content)
+
+
+class KlAkOrjsonCodec:
+    """ Codec based on orjson: serializes straight to UTF-8 bytes and parses bytes without decoding them into str first """
+    name = 'orjson'
+
+    def dumps(self, data):
+        """ Serializes request body, returns bytes """
+        return orjson.dumps(_UnwrapParams(data), default = _Default)
+
+    def loads(self, content):
+        """ Parses response body given as bytes (response.content) or str """
+        return orjson.loads(content)
+
+
+_codec = KlAkOrjsonCodec() if orjson is not None else KlAkJsonCodec()
+
+
+def GetCodec():
+    """ Returns codec used by KlAkBase to encode requests and parse responses """
+    return _codec
+
+
+def SetCodec(codec):
+    """ Plugs in a codec: 'json', 'orjson' or any object with dumps(data) and loads(content) methods. Returns previous codec """
+    global _codec
+    previous = _codec
+    if codec == 'json':
+        codec = KlAkJsonCodec()
+    elif codec == 'orjson':
+        if orjson is None:
+            raise ImportError('orjson is not installed')
+        codec = KlAkOrjsonCodec()
+    _codec = codec
+    return previous
@@ -89,9 +89,11 @@ class KlAkError(KlAkBaseError):
 
 
 class KlAkResponseError(KlAkBaseError):
-    """ KlAkResponseError is raised when HTTP request's Status code differs from 200(OK) or unexpected values found while respose parsing """
-    def __init__(self, data):
+    """ KlAkResponseError is raised when HTTP request's Status code differs from 200(OK) or unexpected values found while respose parsing.
+        status_code holds the HTTP status when the error comes from a non-200 response (e.g. 401 once the session has expired) """
+    def __init__(self, data, status_code = None):
         self.data = data
+        self.status_code = status_code
 
 class KlAkParamTypeError(KlAkBaseError):
     """ KlAkParamTypeError is raised when trying to compose KlAkParams with unappropriate data types """
@@ -1,9 +1,6 @@
 #! /usr/bin/python -tt
 
-import json
-
 from .Base import KlAkBase
-from .Params import KlAkParamsEncoder
 
 
 class KlAkEventNotificationsApi (KlAkBase):
@@ -13,6 +10,6 @@ class KlAkEventNotificationsApi (KlAkBase):
 
     def PublishEvent(self, wstrEventType, pEventBody, tmBirthTime):
         data = {'wstrEventType': wstrEventType, 'pEventBody': pEventBody, 'tmBirthTime': tmBirthTime}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'EventNotificationsApi.PublishEvent'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'EventNotificationsApi.PublishEvent'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False)
 
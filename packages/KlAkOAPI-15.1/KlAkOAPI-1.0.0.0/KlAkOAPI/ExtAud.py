@@ -1,9 +1,6 @@
 #! /usr/bin/python -tt
 
-import json
-
 from .Base import KlAkBase
-from .Params import KlAkParamsEncoder
 
 
 class KlAkExtAud (KlAkBase):
@@ -13,46 +10,46 @@ class KlAkExtAud (KlAkBase):
 
     def GetRevision(self, nObjId, nObjType, nObjRevision):
         data = {'nObjId': nObjId, 'nObjType': nObjType, 'nObjRevision': nObjRevision}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.GetRevision'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False, out_pars=['pObjParams'])
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.GetRevision'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False, out_pars=['pObjParams'])
 
     def UpdateRevisionDesc(self, nObjId, nObjType, nObjRevision, wstrNewDescription):
         data = {'nObjId': nObjId, 'nObjType': nObjType, 'nObjRevision': nObjRevision, 'wstrNewDescription': wstrNewDescription}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.UpdateRevisionDesc'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.UpdateRevisionDesc'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False)
 
     def FinalDelete(self, arrObjects):
         data = {'arrObjects': arrObjects}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.FinalDelete'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.FinalDelete'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False)
 
     def SrvPutRevision(self, nObjId, nObjType, nOpCode, pObjParams, wstrSsPath, nUser, wstrUserDn, wstrObjName, wstrRevDesc):
         data = {'nObjId': nObjId, 'nObjType': nObjType, 'nOpCode': nOpCode, 'pObjParams': pObjParams, 'wstrSsPath': wstrSsPath, 'nUser': nUser, 'wstrUserDn': wstrUserDn, 'wstrObjName': wstrObjName, 'wstrRevDesc': wstrRevDesc}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.SrvPutRevision'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.SrvPutRevision'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
     def SrvGetRevision(self, nObjId, nObjType, nObjRevision, wstrSsPath):
         data = {'nObjId': nObjId, 'nObjType': nObjType, 'nObjRevision': nObjRevision, 'wstrSsPath': wstrSsPath}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.SrvGetRevision'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False, out_pars=['pObjParams'])
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.SrvGetRevision'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False, out_pars=['pObjParams'])
 
     def SrvDeleteOlder(self, tTime):
         data = {'tTime': tTime}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.SrvDeleteOlder'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.SrvDeleteOlder'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False)
 
     def SrvDeleteObjectRevisions(self, arrObjects):
         data = {'arrObjects': arrObjects}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.SrvDeleteObjectRevisions'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.SrvDeleteObjectRevisions'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False)
 
     def SrvUpdateRevisionDesc(self, nObjId, nObjType, nObjRevision, wstrNewDescription):
         data = {'nObjId': nObjId, 'nObjType': nObjType, 'nObjRevision': nObjRevision, 'wstrNewDescription': wstrNewDescription}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.SrvUpdateRevisionDesc'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.SrvUpdateRevisionDesc'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False)
 
     def SrvDoCleanerRoutine(self):
         data = {}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.SrvDoCleanerRoutine'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'ExtAud.SrvDoCleanerRoutine'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False)
 
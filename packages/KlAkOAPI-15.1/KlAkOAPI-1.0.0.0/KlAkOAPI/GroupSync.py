@@ -1,9 +1,6 @@
 #! /usr/bin/python -tt
 
-import json
-
 from .Base import KlAkBase
-from .Params import KlAkParamsEncoder
 
 
 class KlAkGroupSync (KlAkBase):
@@ -13,16 +10,16 @@ class KlAkGroupSync (KlAkBase):
 
     def GetSyncInfo(self, nSync, arrFieldsToReturn):
         data = {'nSync': nSync, 'arrFieldsToReturn': arrFieldsToReturn}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'GroupSync.GetSyncInfo'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'GroupSync.GetSyncInfo'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
     def GetSyncHostsInfo(self, nSync, arrFieldsToReturn, arrFieldsToOrder, nLifeTime):
         data = {'nSync': nSync, 'arrFieldsToReturn': arrFieldsToReturn, 'arrFieldsToOrder': arrFieldsToOrder, 'nLifeTime': nLifeTime}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'GroupSync.GetSyncHostsInfo'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'GroupSync.GetSyncHostsInfo'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
     def GetSyncDeliveryTime(self, nSync, szwHostId):
         data = {'nSync': nSync, 'szwHostId': szwHostId}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'GroupSync.GetSyncDeliveryTime'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'GroupSync.GetSyncDeliveryTime'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
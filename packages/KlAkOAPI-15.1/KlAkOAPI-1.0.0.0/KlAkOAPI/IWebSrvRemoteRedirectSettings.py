@@ -1,9 +1,6 @@
 #! /usr/bin/python -tt
 
-import json
-
 from .Base import KlAkBase
-from .Params import KlAkParamsEncoder
 
 
 class KlAkIWebSrvRemoteRedirectSettings (KlAkBase):
@@ -13,11 +10,11 @@ class KlAkIWebSrvRemoteRedirectSettings (KlAkBase):
 
     def SetWebSrvRemoteRedirectSettings(self, wstrHostId, pSettings):
         data = {'wstrHostId': wstrHostId, 'pSettings': pSettings}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'IWebSrvRemoteRedirectSettings.SetWebSrvRemoteRedirectSettings'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'IWebSrvRemoteRedirectSettings.SetWebSrvRemoteRedirectSettings'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False)
 
     def GetWebSrvRemoteRedirectSettings(self, wstrHostId):
         data = {'wstrHostId': wstrHostId}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'IWebSrvRemoteRedirectSettings.GetWebSrvRemoteRedirectSettings'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'IWebSrvRemoteRedirectSettings.GetWebSrvRemoteRedirectSettings'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
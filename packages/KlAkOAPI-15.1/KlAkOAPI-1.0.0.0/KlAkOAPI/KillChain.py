@@ -1,9 +1,6 @@
 #! /usr/bin/python -tt
 
-import json
-
 from .Base import KlAkBase
-from .Params import KlAkParamsEncoder
 
 
 class KlAkKillChain (KlAkBase):
@@ -13,11 +10,11 @@ class KlAkKillChain (KlAkBase):
 
     def GetByIDs(self, wstrHostID, wstrElementID):
         data = {'wstrHostID': wstrHostID, 'wstrElementID': wstrElementID}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'KillChain.GetByIDs'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, out_pars=['nResStatus'])
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'KillChain.GetByIDs'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, out_pars=['nResStatus'])
 
     def GetByIDs2(self, wstrHostID, wstrProductName, wstrProductVersion, wstrElementID):
         data = {'wstrHostID': wstrHostID, 'wstrProductName': wstrProductName, 'wstrProductVersion': wstrProductVersion, 'wstrElementID': wstrElementID}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'KillChain.GetByIDs2'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, out_pars=['nResStatus'])
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'KillChain.GetByIDs2'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, out_pars=['nResStatus'])
 
@@ -1,9 +1,6 @@
 #! /usr/bin/python -tt
 
-import json
-
 from .Base import KlAkBase
-from .Params import KlAkParamsEncoder
 
 
 class KlAkNagGuiCalls (KlAkBase):
@@ -13,6 +10,6 @@ class KlAkNagGuiCalls (KlAkBase):
 
     def CallConnectorAsync(self, szwProduct, szwVersion, szwCallName, pInData):
         data = {'szwProduct': szwProduct, 'szwVersion': szwVersion, 'szwCallName': szwCallName, 'pInData': pInData}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'NagGuiCalls.CallConnectorAsync'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'NagGuiCalls.CallConnectorAsync'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content)
 
@@ -1,9 +1,6 @@
 #! /usr/bin/python -tt
 
-import json
-
 from .Base import KlAkBase
-from .Params import KlAkParamsEncoder
 
 
 class KlAkNagNetworkListApi (KlAkBase):
@@ -13,26 +10,26 @@ class KlAkNagNetworkListApi (KlAkBase):
 
     def GetListItemFileInfo(self, listName, itemId, bNeedPacked):
         data = {'listName': listName, 'itemId': itemId, 'bNeedPacked': bNeedPacked}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'NagNetworkListApi.GetListItemFileInfo'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, out_pars=['pFileInfo'])
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'NagNetworkListApi.GetListItemFileInfo'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, out_pars=['pFileInfo'])
 
     def GetListItemFileInfo2(self, listName, itemId, productName, productVersion, bNeedPacked, pOptions):
         data = {'listName': listName, 'itemId': itemId, 'productName': productName, 'productVersion': productVersion, 'bNeedPacked': bNeedPacked, 'pOptions': pOptions}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'NagNetworkListApi.GetListItemFileInfo2'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, out_pars=['pFileInfo'])
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'NagNetworkListApi.GetListItemFileInfo2'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, out_pars=['pFileInfo'])
 
     def GetListItemFileChunk(self, listName, itemId, bNeedPacked, ulStartPos, lBytesToRead):
         data = {'listName': listName, 'itemId': itemId, 'bNeedPacked': bNeedPacked, 'ulStartPos': ulStartPos, 'lBytesToRead': lBytesToRead}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'NagNetworkListApi.GetListItemFileChunk'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, out_pars=['pChunk'])
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'NagNetworkListApi.GetListItemFileChunk'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, out_pars=['pChunk'])
 
     def GetListItemFileChunk2(self, listName, itemId, productName, productVersion, pOptions, bNeedPacked, ulStartPos, lBytesToRead):
         data = {'listName': listName, 'itemId': itemId, 'productName': productName, 'productVersion': productVersion, 'pOptions': pOptions, 'bNeedPacked': bNeedPacked, 'ulStartPos': ulStartPos, 'lBytesToRead': lBytesToRead}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'NagNetworkListApi.GetListItemFileChunk2'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, out_pars=['pChunk'])
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'NagNetworkListApi.GetListItemFileChunk2'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, out_pars=['pChunk'])
 
     def ReleaseFileInfo(self, listName, itemId, productName, productVersion):
         data = {'listName': listName, 'itemId': itemId, 'productName': productName, 'productVersion': productVersion}
-        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'NagNetworkListApi.ReleaseFileInfo'), headers = KlAkBase.common_headers, data = json.dumps(data, cls = KlAkParamsEncoder))
-        return self.ParseResponse(response.status_code, response.text, retval = False)
+        response = self.server.session.post(url = self.server.Call((lambda: self.instance + '.' if self.instance != None and self.instance != '' else '')() + 'NagNetworkListApi.ReleaseFileInfo'), headers = KlAkBase.common_headers, data = self.EncodeParams(data))
+        return self.ParseResponse(response.status_code, response.content, retval = False)
 
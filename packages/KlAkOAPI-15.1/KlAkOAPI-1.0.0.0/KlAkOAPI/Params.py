@@ -99,10 +99,10 @@ def paramDouble(value):
 
 def paramParams(value):
     """ Checks value to correspond params datatype and returns dict in paramParams format that can be used in KlAkParams.AddParams(...) method """
-    if type(value) not in [dict, KlAkParams]:
+    if not isinstance(value, (dict, KlAkParams)):
         raise KlAkParamTypeError('paramParams expects dict OR KlAkParams datatype, while ' + str(type(value)) + ' is given')
 
-    if type(value) is KlAkParams:
+    if isinstance(value, KlAkParams):
         value_checked_type = value.data
     else:
         # check elems for Null value - Null is not acceptable in params
@@ -118,7 +118,7 @@ def paramParams(value):
 def paramArray(value):
     """ Checks array elements format to correspond params datatypes and returns dict in paramArray format that can be used in KlAkParams.AddArray(...) method.
         Value can be either list or KlAkArray or a value of params type - in last case a list of one element is formed """
-    if type(value) is KlAkArray:
+    if isinstance(value, KlAkArray):
         return value.data
     if type(value) is list:
         value_list = value
@@ -138,7 +138,7 @@ def IsParamType(value):
         return True
     if type(value) is dict and 'type' in value and 'value' in value and IsParamTypeWord(value['type']):
         return True
-    if type(value) is KlAkArray:
+    if isinstance(value, KlAkArray):
         return True
     if type(value) is list:
         isValueParamType = True
@@ -190,7 +190,7 @@ def paramXXX(value):
             return value
         else:
             return paramParams(value)
-    elif type(value) is KlAkParams:
+    elif isinstance(value, KlAkParams):
         return paramParams(value.data)
     elif type(value) is date:
         return paramDate(value)
@@ -198,7 +198,7 @@ def paramXXX(value):
         return paramDateTime(value)
     elif type(value) is bytes:
         return paramBinary(value)
-    elif type(value) is KlAkArray:
+    elif isinstance(value, KlAkArray):
         return value.data
     elif type(value) is list:
         return paramArray(value)
@@ -212,7 +212,7 @@ class KlAkArray:
         self.data = []
         if data == None:
             return
-        if type(data) is KlAkArray:
+        if isinstance(data, KlAkArray):
             self.data = copy.deepcopy(data.data)
             return
         if type(data) is not list:
@@ -221,7 +221,7 @@ class KlAkArray:
             # check type of every element
             if elem == None:
                 self.data.append(elem)
-            elif type(elem) is KlAkArray:
+            elif isinstance(elem, KlAkArray):
                 self.data.append(elem.data)
             else:
                 if IsParamType(elem):
@@ -364,7 +364,7 @@ class KlAkParams:
         self.data = {}
         if data == None:
             return
-        if type(data) is KlAkParams:
+        if isinstance(data, KlAkParams):
             self.data = copy.deepcopy(data.data)
             return
         if type(data) is not dict:
@@ -373,7 +373,7 @@ class KlAkParams:
             raise KlAkParamTypeError('KlAkParams does not accept unnamed params contents in constructor')
         for key, value in data.items():
             if IsParamType(value):
-                if type(value) in [KlAkArray, KlAkParams]:
+                if isinstance(value, (KlAkArray, KlAkParams)):
                     self.data[key] = value.data
                 else:
                     self.data[key] = value
@@ -415,7 +415,7 @@ class KlAkParams:
         """ Prints params object in terms of KLOAPI types """
         result = ''
 
-        if type(data) is KlAkParams:
+        if isinstance(data, KlAkParams):
             for i, key in enumerate(data.GetNames()):
                 cur_type = data.GetType(key)
                 cur_value = data[key]
@@ -425,7 +425,7 @@ class KlAkParams:
                     result += '\n' + KlAkParams.__PrintParamsParsed(cur_value, new_indent, i == len(data.GetNames()) - 1)
                 else:
                     result += str(cur_value) + '\n'
-        elif type(data) is KlAkArray:
+        elif isinstance(data, KlAkArray):
             for i in range(len(data)):
                 cur_type = data.GetType(i)
                 cur_value = data[i]
@@ -547,14 +547,14 @@ class KlAkParams:
                 raise KlAkParamTypeError('KlAkParams does not support given datatype for paramArray section <' + name + '>. Please use paramArray converter or KlAkArray constructor to construct array section')
             else:
                 self.data.update({name: paramArray(value)})
-        elif type(value) in [KlAkArray, KlAkParams]:
+        elif isinstance(value, (KlAkArray, KlAkParams)):
             self.data.update({name: paramArray(value.data)})
         else:
             self.data.update({name: paramArray(value)})
 
     def AddParams(self, name, value):
         """ Add a value of type KlAkParams or dict which corresponds to params (not paramParams) structure: contains paramParams-wrapper inside """
-        if type(value) not in [dict, KlAkParams]:
+        if not isinstance(value, (dict, KlAkParams)):
             raise KlAkParamTypeError('KlAkParams does not support given datatype for paramParams section <' + name + '>. Please use dict or KlAkParams object to construct paramParams section')
 
         self.data.update({name: paramXXX(value)})
@@ -570,10 +570,101 @@ class KlAkParams:
         del self.data[name]
 
 
+####
+
+def extractParamView(value):
+    """ Same as extractParamValue, but nested arrays and params are returned as views (KlAkArrayView, KlAkParamsView) instead of validated copies """
+    if type(value) is list:
+        return KlAkArrayView(value)
+    if type(value) is dict:
+        if not ('type' in value and 'value' in value and IsParamTypeWord(value['type'])):
+            return KlAkParamsView(value)  # untyped dict is treated as params, same as paramXXX does
+        if value['type'] == 'params':
+            return KlAkParamsView(value['value'])
+    if type(value) is float:
+        return value  # paramXXX would wrap it into paramDouble
+    return extractParamValue(value)
+
+def _viewType(value):
+    """ Type of a raw JSON value that a view keeps as is: paramDouble for float and paramParams for untyped dict,
+        the types paramXXX gives them in KlAkParams/KlAkArray. Returns None for values the containers' GetType handles """
+    if type(value) is float:
+        return 'paramDouble'
+    if type(value) is dict and not ('type' in value and 'value' in value and IsParamTypeWord(value['type'])):
+        return 'paramParams'
+    return None
+
+def _copyOnWrite(name):
+    """ Mutator of a view: turns the view into the container KlAkResponse(lazy = False) would have built
+        (its class is replaced by KlAkParams/KlAkArray, the data is validated into a new top-level container), then modifies it.
+        As with eager containers, views taken from it earlier and the decoded JSON are left as they are """
+    def mutator(self, *args, **kwargs):
+        container = type(self).__bases__[0]
+        self.data = container(self.data).data
+        self.__class__ = container
+        return getattr(self, name)(*args, **kwargs)
+    return mutator
+
+
+class KlAkParamsView(KlAkParams):
+    """ Copy-on-write KlAkParams over decoded JSON. Wraps the dict as is, without copying or validating its contents;
+        typed values (long, datetime, binary, params, ...) are decoded only when accessed with [] operator.
+        The first modification copies it into a regular KlAkParams. Is used by KlAkResponse for return values and output parameters """
+
+    def __init__(self, data = None):
+        self.data = {} if data == None else data
+
+    def __getitem__(self, name):
+        """ Returns typed value of element of params, nested params and arrays are returned as views """
+        if name not in self.data:
+            raise KlAkParamTypeError('KlAkParams object does not contain <'+ name + '> section')
+
+        return extractParamView(self.data[name])
+
+    def GetType(self, name):
+        """ Returns type of element of params, same as KlAkParams built from the same data would return """
+        view_type = _viewType(self.data[name]) if name in self.data else None
+        return view_type or KlAkParams.GetType(self, name)
+
+
+class KlAkArrayView(KlAkArray):
+    """ Copy-on-write KlAkArray over decoded JSON list. Wraps the list as is, without copying or validating its elements;
+        typed values are decoded only when accessed. The first modification copies it into a regular KlAkArray """
+
+    def __init__(self, data = None):
+        self.data = [] if data == None else data
+
+    def __getitem__(self, index):
+        """ Override [] operator, returns typed value for given index, nested params and arrays are returned as views """
+        if type(index) is not int:
+            raise TypeError
+        if index < 0:  # treat as count backwards from end to beginning
+            index = len(self) + index
+        if index < 0 or index >= len(self):
+            raise IndexError
+
+        return extractParamView(self.data[index])
+
+    def GetType(self, index):
+        """ Returns type of element of array, same as KlAkArray built from the same data would return """
+        view_type = _viewType(self.data[index]) if type(index) is int and -len(self) <= index < len(self) else None
+        return view_type or KlAkArray.GetType(self, index)
+
+    def __iter__(self):
+        return map(extractParamView, self.data)
+
+
+_mutators = ['AddString', 'AddBool', 'AddInt', 'AddLong', 'AddDateTime', 'AddDate', 'AddBinary', 'AddFloat', 'AddDouble', 'AddArray', 'AddParams', 'Add']
+for _name in _mutators + ['__setitem__', '__delitem__']:
+    setattr(KlAkParamsView, _name, _copyOnWrite(_name))
+for _name in _mutators:
+    setattr(KlAkArrayView, _name, _copyOnWrite(_name))
+
+
 class KlAkParamsEncoder(JSONEncoder):
     """ Implements KlAkParams class serialization to JSON """
     def default(self, o):
-        if type(o) in [KlAkParams, KlAkArray]:
+        if isinstance(o, (KlAkParams, KlAkArray)):
             return o.data
         elif type(o) is bytes:
             return binToStr(o)
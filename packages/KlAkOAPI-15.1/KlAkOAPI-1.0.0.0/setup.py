@@ -19,5 +19,6 @@ setuptools.setup(
     ],
     python_requires='>=3.6',
     install_requires=['requests','pywin32 >= 1.0 ; platform_system=="Windows"'],
+    extras_require={'fast': ['orjson']},
     url="http://kaspersky.com"
 )
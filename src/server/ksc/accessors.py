@@ -0,0 +1,153 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass(eq=False)
+class AccessorEntry:
+    """An open ChunkAccessor result set on the Administration Server."""
+
+    accessor: str
+    session: str
+    total: int
+    expires_at: float
+    # Identical queries (same filter and fields) may reuse the result set; None = one-shot
+    query: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+
+
+class AccessorRegistry:
+    """
+    Tracks every ChunkAccessor (strAccessor) opened through the service.
+
+    KSC keeps a result set alive for lMaxLifeTime seconds unless ChunkAccessor.Release
+    is called, so forgetting one leaves it occupying the Administration Server. Release
+    has to go through the session that owns the accessor, which may be busy in another
+    thread; `release()` therefore only queues the accessor and the owning session drains
+    its queue (`take_pending`) the next time it is checked in.
+
+    Accessors registered with a `query` key stay open for reuse by identical queries
+    while their snapshot is younger than `lifetime`. At most `max_open` accessors are
+    kept; the least recently used one is released when the limit is exceeded, so a
+    client cursor may outlive its accessor (see `is_open`).
+    """
+
+    def __init__(self, max_open: int = 64, lifetime: float = 600):
+        self.max_open = max_open
+        self.lifetime = lifetime
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, AccessorEntry]" = OrderedDict()
+        self._pending: Dict[str, List[str]] = {}
+        self.opened = 0
+        self.released = 0
+        self.reused = 0
+
+    @property
+    def open_count(self) -> int:
+        """Accessors currently open on the server (tracked plus queued for release)."""
+        with self._lock:
+            return len(self._entries) + sum(len(p) for p in self._pending.values())
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            pending = sum(len(p) for p in self._pending.values())
+            return {
+                "open": len(self._entries) + pending,
+                "pending_release": pending,
+                "opened": self.opened,
+                "released": self.released,
+                "reused": self.reused,
+            }
+
+    def _sweep(self, now: float):
+        """Forgets accessors whose server-side lifetime has run out. Caller holds the lock."""
+        for key in [k for k, e in self._entries.items() if e.expires_at <= now]:
+            del self._entries[key]
+
+    def _queue(self, entry: AccessorEntry):
+        self._pending.setdefault(entry.session, []).append(entry.accessor)
+
+    def register(
+        self, session: str, accessor: str, total: int, query: Optional[str] = None
+    ) -> AccessorEntry:
+        entry = AccessorEntry(
+            accessor=accessor,
+            session=session,
+            total=total,
+            expires_at=time.time() + self.lifetime,
+            query=query,
+        )
+        with self._lock:
+            self._sweep(time.time())
+            self._entries[accessor] = entry
+            self.opened += 1
+            while len(self._entries) > self.max_open:
+                _, evicted = self._entries.popitem(last=False)
+                self._queue(evicted)
+        return entry
+
+    def lookup(
+        self, query: str, available: Callable[[str], bool] = lambda session: True
+    ) -> Optional[AccessorEntry]:
+        """
+        Returns a live accessor for an identical query whose session passes `available`,
+        most recently used first.
+        """
+        now = time.time()
+        with self._lock:
+            self._sweep(now)
+            for entry in reversed(self._entries.values()):
+                if (
+                    entry.query == query
+                    and now - entry.created_at < self.lifetime
+                    and available(entry.session)
+                ):
+                    self._entries.move_to_end(entry.accessor)
+                    self.reused += 1
+                    return entry
+        return None
+
+    def is_open(self, accessor: str) -> bool:
+        """Whether an accessor is still tracked, i.e. not released, evicted or expired."""
+        with self._lock:
+            entry = self._entries.get(accessor)
+            return entry is not None and entry.expires_at > time.time()
+
+    def touch(self, accessor: str):
+        """Records an access; every GetItemsChunk extends the lifetime on the server."""
+        with self._lock:
+            entry = self._entries.get(accessor)
+            if entry is not None:
+                entry.expires_at = time.time() + self.lifetime
+                self._entries.move_to_end(accessor)
+
+    def release(self, accessor: str):
+        """Stops tracking an accessor and queues its Release on the owning session."""
+        with self._lock:
+            entry = self._entries.pop(accessor, None)
+            if entry is not None:
+                self._queue(entry)
+
+    def release_all(self) -> List[str]:
+        """Queues every tracked accessor for release; returns the sessions involved."""
+        with self._lock:
+            for entry in self._entries.values():
+                self._queue(entry)
+            self._entries.clear()
+            return list(self._pending)
+
+    def take_pending(self, session: str) -> List[str]:
+        """Hands over the accessors the given session still has to Release."""
+        with self._lock:
+            pending = self._pending.pop(session, [])
+            self.released += len(pending)
+            return pending
+
+    def forget_session(self, session: str):
+        """Drops everything owned by a closed session; its result sets went with it."""
+        with self._lock:
+            self._pending.pop(session, None)
+            for key in [k for k, e in self._entries.items() if e.session == session]:
+                del self._entries[key]
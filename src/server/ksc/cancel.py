@@ -0,0 +1,63 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from server.ksc.errors import KscCancelledError
+
+
+class CancelToken:
+    """
+    Cancellation flag shared between an awaiting tool call and its worker thread.
+
+    anyio cannot interrupt a thread, so when the tool call is cancelled the thread is
+    abandoned and the token set; KSC loops check it between requests (`check`) and stop,
+    cleaning up server-side objects on the way out.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def wait(self, timeout: float) -> bool:
+        """Sleeps up to `timeout` seconds; returns True early if cancelled."""
+        return self._event.wait(timeout)
+
+
+_current: ContextVar[Optional[CancelToken]] = ContextVar("ksc_cancel", default=None)
+
+
+@contextmanager
+def bound(token: CancelToken) -> Iterator[CancelToken]:
+    """Makes `token` the current one for the calls made in this block."""
+    reset = _current.set(token)
+    try:
+        yield token
+    finally:
+        _current.reset(reset)
+
+
+def cancelled() -> bool:
+    token = _current.get()
+    return token is not None and token.cancelled
+
+
+def check():
+    """Raises KscCancelledError if the calling tool call has been cancelled."""
+    if cancelled():
+        raise KscCancelledError("The tool call was cancelled")
+
+
+def sleep(seconds: float):
+    """Interruptible sleep; raises KscCancelledError if cancelled meanwhile."""
+    token = _current.get()
+    if token is None:
+        threading.Event().wait(seconds)
+    elif token.wait(seconds):
+        check()
@@ -0,0 +1,71 @@
+import threading
+from typing import Dict, Optional
+
+
+class ChunkSizer:
+    """
+    Picks the row count of ChunkAccessor.GetItemsChunk requests from observed responses.
+
+    Walking a large accessor is bound by round trips, so chunks grow (at most doubling
+    per response) until one response takes about `target_seconds` or carries about
+    `max_bytes`, and shrink at once when responses get slower or heavier. Estimates are
+    per-row EWMAs of response time and payload size. Chunks much smaller than `min_size`
+    (a short last chunk, a 50-row page) say little about throughput and are not observed.
+
+    Thread-safe; shared by every walk of the service.
+    """
+
+    def __init__(
+        self,
+        initial: int = 500,
+        min_size: int = 100,
+        max_size: int = 5000,
+        target_seconds: float = 1.0,
+        max_bytes: int = 8 * 1024 * 1024,
+    ):
+        self.min_size = min(min_size, initial)
+        self.max_size = max(max_size, initial)
+        self.target_seconds = target_seconds
+        self.max_bytes = max_bytes
+        self._size = initial
+        self._lock = threading.Lock()
+        self._row_seconds: Optional[float] = None
+        self._row_bytes: Optional[float] = None
+        self.observations = 0
+
+    def next_size(self) -> int:
+        with self._lock:
+            return self._size
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "size": self._size,
+                "observations": self.observations,
+                "row_us": (self._row_seconds or 0.0) * 1e6,
+                "row_bytes": self._row_bytes or 0.0,
+            }
+
+    def observe(self, rows: int, seconds: float, nbytes: Optional[int] = None):
+        """Records one response: `rows` rows in `seconds`, `nbytes` body bytes if known."""
+        if rows < self.min_size:
+            return
+        with self._lock:
+            self.observations += 1
+            row_seconds = seconds / rows
+            if self._row_seconds is None:
+                self._row_seconds = row_seconds
+            else:
+                self._row_seconds += 0.3 * (row_seconds - self._row_seconds)
+            if nbytes:
+                row_bytes = nbytes / rows
+                if self._row_bytes is None:
+                    self._row_bytes = row_bytes
+                else:
+                    self._row_bytes += 0.3 * (row_bytes - self._row_bytes)
+
+            ideal = self.target_seconds / max(self._row_seconds, 1e-9)
+            if self._row_bytes:
+                ideal = min(ideal, self.max_bytes / self._row_bytes)
+            size = min(ideal, self._size * 2)
+            self._size = int(max(self.min_size, min(self.max_size, size)))
@@ -0,0 +1,56 @@
+import base64
+import json
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from server.ksc.errors import KscCursorError
+
+
+@dataclass(frozen=True)
+class HostCursor:
+    """
+    Position inside a server-side KSC result set (ChunkAccessor).
+
+    Handed to MCP clients as an opaque string so they can resume paging without
+    re-running HostGroup.FindHosts. `expires_at` mirrors the accessor lifetime on
+    the Administration Server; past that point the accessor is gone. Accessors are
+    bound to the KSC session that created them, identified by the pool key `session`.
+    `query` keeps the search filter and fields, so a cursor whose accessor was released
+    early (read to the end, or evicted) runs the search again from `offset`.
+
+    Pages served from the local inventory use source="inventory"; they have no
+    accessor and carry the original filter in `query` instead.
+    """
+
+    session: str
+    accessor: str
+    offset: int
+    total: int
+    expires_at: float
+    source: str = "ksc"
+    query: Optional[dict] = None
+
+    def encode(self) -> str:
+        raw = json.dumps(asdict(self), separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str) -> "HostCursor":
+        try:
+            data = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+            cursor = cls(
+                session=str(data["session"]),
+                accessor=str(data["accessor"]),
+                offset=int(data["offset"]),
+                total=int(data["total"]),
+                expires_at=float(data["expires_at"]),
+                source=str(data.get("source", "ksc")),
+                query=data.get("query"),
+            )
+        except Exception as e:
+            raise KscCursorError(f"Invalid cursor: {e}") from e
+
+        if cursor.expires_at <= time.time():
+            raise KscCursorError("Cursor has expired, run the query again without a cursor.")
+        return cursor
@@ -0,0 +1,90 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+
+@dataclass(eq=False)
+class Deadline:
+    """Time budget of one MCP tool call (time.monotonic() based)."""
+
+    expires_at: float
+    # Set when an operation stopped early because the budget ran out
+    partial: bool = False
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+# Context variables are copied into anyio worker threads and child tasks, so the
+# budget set by a tool follows its KscService call down to every KlAkOAPI request
+_current: ContextVar[Optional[Deadline]] = ContextVar("ksc_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """
+    Runs the block under a budget of `seconds` (None or 0: no budget of its own).
+    A nested budget can only shorten the enclosing one, never extend it.
+    """
+    parent = _current.get()
+    if not seconds or seconds <= 0:
+        yield parent
+        return
+    expires_at = time.monotonic() + seconds
+    if parent is not None and parent.expires_at <= expires_at:
+        yield parent
+        return
+    scope = Deadline(expires_at)
+    token = _current.set(scope)
+    try:
+        yield scope
+    finally:
+        _current.reset(token)
+        if parent is not None and scope.partial:
+            parent.partial = True
+
+
+@contextmanager
+def detached() -> Iterator[None]:
+    """
+    Runs the block without a budget: cleanup calls (releasing accessors, iterators,
+    cancelling searches) must still reach KSC after the deadline has passed.
+    """
+    token = _current.set(None)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def current() -> Optional[Deadline]:
+    return _current.get()
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the current budget, or None if there is none."""
+    scope = _current.get()
+    return None if scope is None else scope.remaining()
+
+
+def expired() -> bool:
+    scope = _current.get()
+    return scope is not None and scope.expired
+
+
+def mark_partial():
+    """Records that the current operation returns incomplete results."""
+    scope = _current.get()
+    if scope is not None:
+        scope.partial = True
+
+
+def is_partial() -> bool:
+    scope = _current.get()
+    return scope is not None and scope.partial
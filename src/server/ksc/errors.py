@@ -20,3 +20,27 @@ class KscTaskError(KscError):
     """Error related to KSC tasks."""
 
     pass
+
+
+class KscCursorError(KscError):
+    """Paging cursor is malformed or has expired."""
+
+    pass
+
+
+class KscBusyError(KscError):
+    """No KSC session/capacity became available within the allowed wait."""
+
+    pass
+
+
+class KscDeadlineError(KscError):
+    """The tool call's time budget ran out before the KSC request could be sent."""
+
+    pass
+
+
+class KscCancelledError(KscError):
+    """The tool call was cancelled by the client; its KSC work was stopped."""
+
+    pass
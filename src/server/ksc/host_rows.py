@@ -0,0 +1,171 @@
+"""
+Table-driven decoding of FindHosts rows (one KLCSP_ITERATOR_ARRAY chunk) into HostInfo.
+
+A chunk is decoded column by column over the raw decoded JSON: every attribute is read
+once per row with dict.get (no KlAkParams views, no exception per missing attribute),
+IPv4 addresses of the whole chunk are packed with a single struct call, and the status
+text is built from lookup tables and memoized, since a fleet only has a handful of
+distinct (status, status id, RTP state) combinations. HostInfo objects are created with
+model_construct; every value is already of the field's type.
+"""
+
+import socket
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from KlAkOAPI.Params import KlAkArray, KlAkParams, extractParamView
+
+from server.models import HostInfo
+
+# KLHST_WKS_RTP_STATE
+RTP_STATES = (
+    "Unknown",
+    "Stopped",
+    "Suspended",
+    "Starting",
+    "Running",
+    "Running (Max Protection)",
+    "Running (Max Speed)",
+    "Running (Recommended)",
+    "Running (Custom)",
+    "Failure",
+)
+# KLHST_WKS_STATUS_ID
+STATUS_IDS = ("OK", "Critical", "Warning")
+# KLHST_WKS_STATUS bits shown in the status text
+STATUS_BITS = (
+    (0b1, "Visible"),
+    (0b100, "Agent Installed"),
+    (0b1000, "Agent Active"),
+    (0b10000, "RTP Installed"),
+)
+_STATUS_MASK = 0b11101
+# Status bits (masked) -> "Visible, Agent Installed", ...
+_STATUS_DETAILS = tuple(
+    ", ".join(name for bit, name in STATUS_BITS if mask & bit) or "None"
+    for mask in range(_STATUS_MASK + 1)
+)
+
+_IP_RANGE = 2**32
+_MANAGED_DEVICES = "Managed Devices"
+
+
+def _row(item) -> Dict[str, Any]:
+    """Raw attribute dict of one row: a KlAkParams(View), a typed params value or a dict."""
+    if isinstance(item, KlAkParams):
+        return item.data
+    if item.get("type") == "params" and "value" in item:
+        return item["value"]
+    return item
+
+
+def _typed(value):
+    # {"type": "long", "value": 5} -> 5; other typed values as KlAkParams would return them
+    if value.get("type") == "long":
+        return value.get("value")
+    return extractParamView(value)
+
+
+def _column(rows: List[Dict[str, Any]], name: str, default=None) -> List[Any]:
+    values = [row.get(name, default) for row in rows]
+    for value in values:
+        if type(value) is dict:
+            return [_typed(v) if type(v) is dict else v for v in values]
+    return values
+
+
+def _describe(value, names: Tuple[str, ...]) -> str:
+    try:
+        number = int(value)
+    except Exception:
+        return str(value)
+    return names[number] if 0 <= number < len(names) else str(number)
+
+
+def status_text(status, status_id, rtp_state) -> str:
+    """Status text of a host, e.g. "[OK] Status: 13 (Visible, Agent Active) | RTP: Running"."""
+    try:
+        bits = int(status)
+    except Exception:
+        return str(status)
+    return (
+        f"[{_describe(status_id, STATUS_IDS)}] Status: {status} "
+        f"({_STATUS_DETAILS[bits & _STATUS_MASK]}) | RTP: {_describe(rtp_state, RTP_STATES)}"
+    )
+
+
+def ip_addresses(values: List[Any]) -> List[Optional[str]]:
+    """
+    Dotted IPv4 strings of KLHST_WKS_IP values (little-endian longs, possibly negative);
+    None stays None and values that are no IPv4 address are returned as str.
+    """
+    result: List[Optional[str]] = [None] * len(values)
+    indexes = []
+    numbers = []
+    for i, value in enumerate(values):
+        if value is None:
+            continue
+        try:
+            number = int(value)
+        except Exception:
+            result[i] = str(value)
+            continue
+        if number < 0:
+            number += _IP_RANGE
+        if 0 <= number < _IP_RANGE:
+            indexes.append(i)
+            numbers.append(number)
+        else:
+            result[i] = str(value)
+    packed = struct.pack(f"<{len(numbers)}I", *numbers)
+    ntoa = socket.inet_ntoa
+    for offset, i in enumerate(indexes):
+        result[i] = ntoa(packed[offset * 4 : offset * 4 + 4])
+    return result
+
+
+def decode_hosts(items: Iterable) -> List[HostInfo]:
+    """Converts the rows of one KLCSP_ITERATOR_ARRAY chunk into HostInfo objects, in order."""
+    raw = items.data if isinstance(items, KlAkArray) else items
+    rows = [_row(item) for item in raw]
+    hostnames = _column(rows, "KLHST_WKS_HOSTNAME")
+    display_names = _column(rows, "KLHST_WKS_DN")
+    groups = _column(rows, "KLHST_WKS_GRP", 0)
+    statuses = _column(rows, "KLHST_WKS_STATUS", "0")
+    status_ids = _column(rows, "KLHST_WKS_STATUS_ID", 0)
+    rtp_states = _column(rows, "KLHST_WKS_RTP_STATE", 0)
+    ips = ip_addresses(_column(rows, "KLHST_WKS_IP"))
+
+    texts: Dict[Tuple, str] = {}
+    hosts = []
+    construct = HostInfo.model_construct
+    for i, hostname in enumerate(hostnames):
+        dn = display_names[i]
+        status = statuses[i]
+        key = (status, status_ids[i], rtp_states[i])
+        try:
+            text = texts.get(key)
+        except TypeError:
+            # Unhashable attribute value
+            text = status_text(*key)
+        if text is None:
+            text = texts[key] = status_text(*key)
+        group_id = groups[i]
+        if type(group_id) is not int:
+            group_id = int(group_id)
+        hosts.append(
+            construct(
+                # KLHST_WKS_HOSTNAME (network name) is what GetHostInfo(strHostName=...)
+                # expects, so it is the host ID; the display name is the fallback
+                id=str(hostname or dn or ""),
+                name=str("Unknown" if hostname is None else hostname),
+                display_name=str("Unknown" if dn is None else dn),
+                group_id=group_id,
+                group_name=_MANAGED_DEVICES if group_id == 0 else "Unknown",
+                status=text,
+                ip_address=ips[i],
+                # Given explicitly: model_construct inspects default factories per call
+                products=[],
+            )
+        )
+    return hosts
@@ -0,0 +1,210 @@
+"""
+Compact columnar in-memory host list.
+
+A HostInfo model costs a few KB per host; a fleet snapshot instead keeps one column per
+attribute: group ids, status ids and IPv4 addresses in typed arrays, strings interned
+(a host's ID and name are usually the same string, status texts repeat across the fleet).
+Filters run over the columns and return row numbers; HostInfo objects are only built
+for the rows handed back to the client.
+"""
+
+import ipaddress
+import re
+import socket
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from server.models import HostInfo
+
+# status_ids value of a host without KLHST_WKS_STATUS_ID
+NO_STATUS_ID = -1
+# ips value of a host without an IPv4 address
+NO_IP = 0
+
+# (host, KLHST_WKS_STATUS_ID)
+HostTableRow = Tuple[HostInfo, Optional[int]]
+
+
+def parse_ip_range(text: str) -> Tuple[int, int]:
+    """
+    First and last address (as integers) of "10.0.0.0/8", "10.0.0.1-10.0.0.50" or a single
+    address. Raises ValueError for anything else.
+    """
+    text = text.strip()
+    if "-" in text:
+        first, _, last = text.partition("-")
+        return int(ipaddress.IPv4Address(first.strip())), int(ipaddress.IPv4Address(last.strip()))
+    network = ipaddress.IPv4Network(text, strict=False)
+    return int(network.network_address), int(network.broadcast_address)
+
+
+def name_pattern(name: str) -> "re.Pattern[str]":
+    """Regex for a KSC name filter where `*` is a wildcard (ASCII case-insensitive, as LIKE)."""
+    return re.compile(
+        ".*".join(re.escape(part) for part in name.split("*")),
+        re.IGNORECASE | re.ASCII | re.DOTALL,
+    )
+
+
+class HostTable:
+    """
+    Hosts in column arrays, in insertion order. `group_names` maps group ids to names for
+    the materialized HostInfo; unknown groups are named like KSC rows are.
+
+    Not thread-safe; build a table, then only read it (the inventory swaps in a new one).
+    """
+
+    def __init__(self, group_names: Optional[Dict[int, str]] = None):
+        self.group_names: Dict[int, str] = dict(group_names or {})
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.display_names: List[str] = []
+        self.statuses: List[str] = []
+        self.group_ids = array("i")
+        self.status_ids = array("i")
+        # Addresses as big-endian integers, so that ranges compare numerically
+        self.ips = array("I")
+        # Row -> ip_address of hosts whose address does not fit the ips column
+        self._ip_texts: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(
+        self,
+        id: str,
+        name: str,
+        display_name: str,
+        group_id: int,
+        status: str,
+        status_id: Optional[int] = None,
+        ip_address: Optional[str] = None,
+    ):
+        """Appends one host from its attribute values."""
+        intern = sys.intern
+        row = len(self.ids)
+        self.ids.append(intern(id))
+        self.names.append(intern(name))
+        self.display_names.append(intern(display_name))
+        self.statuses.append(intern(status))
+        self.group_ids.append(group_id)
+        self.status_ids.append(NO_STATUS_ID if status_id is None else status_id)
+        self.ips.append(self._ip_number(row, ip_address))
+
+    def append(self, host: HostInfo, status_id: Optional[int] = None):
+        self.add(
+            host.id,
+            host.name,
+            host.display_name,
+            host.group_id,
+            host.status,
+            status_id,
+            host.ip_address,
+        )
+
+    def extend(self, rows: Iterable[HostTableRow]):
+        for host, status_id in rows:
+            self.append(host, status_id)
+
+    def _ip_number(self, row: int, ip_address: Optional[str]) -> int:
+        if ip_address is None:
+            return NO_IP
+        try:
+            if ip_address.count(".") != 3:
+                raise OSError
+            number = int.from_bytes(socket.inet_aton(ip_address), "big")
+        except OSError:
+            number = NO_IP
+        if number == NO_IP:
+            self._ip_texts[row] = ip_address
+        return number
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the table: columns plus the distinct strings."""
+        size = sum(sys.getsizeof(column) for column in self._columns())
+        strings = {id(s): s for column in self._columns()[:4] for s in column}
+        return size + sum(sys.getsizeof(s) for s in strings.values())
+
+    def _columns(self) -> tuple:
+        return (
+            self.ids,
+            self.names,
+            self.display_names,
+            self.statuses,
+            self.group_ids,
+            self.status_ids,
+            self.ips,
+        )
+
+    def select(
+        self,
+        name: Optional[str] = None,
+        status_id: Optional[int] = None,
+        group_id: Optional[int] = None,
+        ip_range: Optional[str] = None,
+    ) -> Sequence[int]:
+        """
+        Row numbers, in table order, of the hosts matching every given filter. `name`
+        follows the KSC filter convention where `*` is a wildcard; `ip_range` is parsed
+        with parse_ip_range.
+        """
+        rows: Sequence[int] = range(len(self))
+        if status_id is not None:
+            column = self.status_ids
+            rows = [i for i in rows if column[i] == status_id]
+        if group_id is not None:
+            column = self.group_ids
+            rows = [i for i in rows if column[i] == group_id]
+        if ip_range is not None:
+            first, last = parse_ip_range(ip_range)
+            column = self.ips
+            rows = [i for i in rows if first <= column[i] <= last and column[i] != NO_IP]
+        if name:
+            match = name_pattern(name).fullmatch
+            column = self.names
+            rows = [i for i in rows if match(column[i])]
+        return rows
+
+    def hosts(self, rows: Iterable[int]) -> List[HostInfo]:
+        """Materializes the given rows as HostInfo."""
+        construct = HostInfo.model_construct
+        group_names = self.group_names
+        hosts = []
+        for i in rows:
+            group_id = self.group_ids[i]
+            ip = self.ips[i]
+            group_name = group_names.get(group_id) or (
+                "Managed Devices" if group_id == 0 else "Unknown"
+            )
+            hosts.append(
+                construct(
+                    id=self.ids[i],
+                    name=self.names[i],
+                    display_name=self.display_names[i],
+                    group_id=group_id,
+                    group_name=group_name,
+                    status=self.statuses[i],
+                    ip_address=(
+                        socket.inet_ntoa(ip.to_bytes(4, "big"))
+                        if ip != NO_IP
+                        else self._ip_texts.get(i)
+                    ),
+                    # Given explicitly: model_construct inspects default factories per call
+                    products=[],
+                )
+            )
+        return hosts
+
+    def query(
+        self,
+        name: Optional[str] = None,
+        status_id: Optional[int] = None,
+        group_id: Optional[int] = None,
+        ip_range: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> Tuple[List[HostInfo], int]:
+        """One page of matching hosts and the total number of matches."""
+        rows = self.select(name, status_id, group_id, ip_range)
+        return self.hosts(rows[offset : offset + limit]), len(rows)
@@ -0,0 +1,207 @@
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+
+from server.ksc.host_table import HostTable
+from server.models import GroupInfo, HostInfo
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hosts (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    display_name TEXT NOT NULL,
+    group_id INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    status_id INTEGER,
+    ip_address TEXT,
+    last_info_update TEXT,
+    generation INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS hosts_status_id ON hosts (status_id);
+CREATE INDEX IF NOT EXISTS hosts_name ON hosts (name);
+CREATE INDEX IF NOT EXISTS hosts_group_id ON hosts (group_id);
+
+CREATE TABLE IF NOT EXISTS groups (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    full_name TEXT NOT NULL,
+    parent_id INTEGER NOT NULL,
+    host_count INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# (host, KLHST_WKS_STATUS_ID, KLHST_WKS_LAST_INFOUDATE as ISO string)
+InventoryRow = Tuple[HostInfo, Optional[int], Optional[str]]
+
+
+class HostInventory:
+    """
+    On-disk SQLite copy of the KSC host list.
+
+    Filled by a full sync (FindHosts over the whole fleet) and kept current by incremental
+    syncs that only fetch hosts whose KLHST_WKS_LAST_INFOUDATE moved past the stored
+    high-water mark. Hosts that disappear from KSC are removed on the next full sync.
+
+    Queries are answered from a columnar in-memory snapshot (HostTable) of the database,
+    loaded on the first query after a write.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._table: Optional[HostTable] = None
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        self._db.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    @property
+    def synced_at(self) -> Optional[float]:
+        """Unix time of the last successful (full or incremental) sync, None if never synced."""
+        with self._lock:
+            value = self._get_meta("synced_at")
+        return float(value) if value is not None else None
+
+    @property
+    def full_synced_at(self) -> Optional[float]:
+        with self._lock:
+            value = self._get_meta("full_synced_at")
+        return float(value) if value is not None else None
+
+    @property
+    def high_water_mark(self) -> Optional[str]:
+        """Newest KLHST_WKS_LAST_INFOUDATE seen so far."""
+        with self._lock:
+            return self._get_meta("high_water_mark")
+
+    def staleness(self) -> Optional[float]:
+        synced_at = self.synced_at
+        return None if synced_at is None else max(0.0, time.time() - synced_at)
+
+    def begin_full_sync(self) -> int:
+        """Starts a new generation; rows not rewritten before finish_sync() are dropped."""
+        with self._lock:
+            return int(self._get_meta("generation") or 0) + 1
+
+    def upsert_hosts(self, rows: Iterable[InventoryRow], generation: Optional[int] = None):
+        with self._lock:
+            if generation is None:
+                generation = int(self._get_meta("generation") or 0)
+            mark = self._get_meta("high_water_mark")
+            params = []
+            for host, status_id, last_update in rows:
+                if last_update and (mark is None or last_update > mark):
+                    mark = last_update
+                params.append(
+                    (
+                        host.id,
+                        host.name,
+                        host.display_name,
+                        host.group_id,
+                        host.status,
+                        status_id,
+                        host.ip_address,
+                        last_update,
+                        generation,
+                    )
+                )
+            self._table = None
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO hosts (id, name, display_name, group_id, status, "
+                    "status_id, ip_address, last_info_update, generation) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    params,
+                )
+                if mark is not None:
+                    self._set_meta("high_water_mark", mark)
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def replace_groups(self, groups: Iterable[GroupInfo]):
+        with self._lock:
+            self._table = None
+            self._db.execute("BEGIN")
+            try:
+                self._db.execute("DELETE FROM groups")
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO groups (id, name, full_name, parent_id, host_count) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(g.id, g.name, g.full_name, g.parent_id, g.host_count) for g in groups],
+                )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def finish_sync(self, generation: Optional[int] = None):
+        """Records a completed sync; for a full sync also drops hosts KSC no longer reports."""
+        now = str(time.time())
+        with self._lock:
+            self._table = None
+            self._db.execute("BEGIN")
+            try:
+                if generation is not None:
+                    self._db.execute("DELETE FROM hosts WHERE generation < ?", (generation,))
+                    self._set_meta("generation", str(generation))
+                    self._set_meta("full_synced_at", now)
+                self._set_meta("synced_at", now)
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def table(self) -> HostTable:
+        """The hosts (ordered by id) as a HostTable, loaded from the database if needed."""
+        with self._lock:
+            if self._table is None:
+                groups = dict(self._db.execute("SELECT id, name FROM groups"))
+                table = HostTable(groups)
+                rows = self._db.execute(
+                    "SELECT id, name, display_name, group_id, status, status_id, ip_address "
+                    "FROM hosts ORDER BY id"
+                )
+                for row in rows:
+                    table.add(*row)
+                self._table = table
+            return self._table
+
+    def query_hosts(
+        self,
+        name: Optional[str] = None,
+        status_id: Optional[int] = None,
+        limit: int = 50,
+        offset: int = 0,
+        group_id: Optional[int] = None,
+        ip_range: Optional[str] = None,
+    ) -> Tuple[List[HostInfo], int]:
+        """
+        Returns one page of hosts and the total number of matches. `name` follows the
+        KSC filter convention where `*` is a wildcard; `ip_range` is a CIDR network,
+        "first-last" addresses or one address.
+        """
+        return self.table().query(name, status_id, group_id, ip_range, limit, offset)
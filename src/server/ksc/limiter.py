@@ -0,0 +1,203 @@
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+
+from server import metrics, tracing
+from server.ksc import deadline
+from server.ksc.errors import KscBusyError, KscDeadlineError
+
+logger = logging.getLogger(__name__)
+
+# Responses meaning the Administration Server is shedding load
+OVERLOAD_STATUS_CODES = {429, 503}
+
+_last_response = threading.local()
+
+
+def last_response_bytes() -> Optional[int]:
+    """Body size of the last (non-streamed) response this thread read through a LimitedAdapter."""
+    return getattr(_last_response, "size", None)
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit for the calls made to one KSC Administration Server.
+
+    Every call that completes in time without an overload signal raises the limit by
+    1/limit (about +1 per round of `limit` calls); a 429/503, a transport error or a
+    call slower than `latency_target` seconds multiplies it by `backoff`, at most once
+    per `latency_target` so one burst of failures does not collapse it to the minimum.
+    Calls over the limit wait in a queue for at most `max_queue_wait` seconds and are
+    then rejected with KscBusyError.
+
+    Blocking; used from the worker threads that run KlAkOAPI calls.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: Optional[int] = None,
+        latency_target: float = 5.0,
+        backoff: float = 0.5,
+        max_queue_wait: float = 30,
+    ):
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.max_queue_wait = max_queue_wait
+        self._limit = float(initial_limit if initial_limit is not None else max_limit)
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._queued = 0
+        self._last_decrease = 0.0
+        self._latency_ewma: Optional[float] = None
+        self.max_queue_depth = 0
+        self.calls = 0
+        self.rejected = 0
+        self.overloads = 0
+
+    @property
+    def limit(self) -> int:
+        with self._cond:
+            return int(self._limit)
+
+    def stats(self) -> Dict[str, float]:
+        with self._cond:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "queue_depth": self._queued,
+                "max_queue_depth": self.max_queue_depth,
+                "calls": self.calls,
+                "rejected": self.rejected,
+                "overloads": self.overloads,
+                "latency_ewma_ms": (self._latency_ewma or 0.0) * 1000,
+            }
+
+    def acquire(self, timeout: Optional[float] = None):
+        """Waits for a free slot; raises KscBusyError after `timeout` (default max_queue_wait)."""
+        timeout = self.max_queue_wait if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            if self._in_flight >= int(self._limit):
+                self._queued += 1
+                self.max_queue_depth = max(self.max_queue_depth, self._queued)
+                try:
+                    while self._in_flight >= int(self._limit):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self.rejected += 1
+                            raise KscBusyError(
+                                f"KSC is overloaded: no call slot freed up within {timeout:g}s "
+                                f"(limit {int(self._limit)}, {self._queued} queued)"
+                            )
+                        self._cond.wait(remaining)
+                finally:
+                    self._queued -= 1
+            self._in_flight += 1
+            self.calls += 1
+
+    def release(self, latency: float, overloaded: bool = False):
+        """Frees the slot and adapts the limit to how the call went."""
+        with self._cond:
+            self._in_flight -= 1
+            if self._latency_ewma is None:
+                self._latency_ewma = latency
+            else:
+                self._latency_ewma += 0.2 * (latency - self._latency_ewma)
+
+            if overloaded or latency > self.latency_target:
+                self.overloads += 1
+                now = time.monotonic()
+                if now - self._last_decrease >= self.latency_target:
+                    self._last_decrease = now
+                    previous = int(self._limit)
+                    self._limit = max(float(self.min_limit), self._limit * self.backoff)
+                    logger.warning(
+                        f"KSC overload signal (latency {latency:.2f}s, overloaded={overloaded}), "
+                        f"concurrency limit {previous} -> {int(self._limit)}"
+                    )
+            else:
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            self._cond.notify_all()
+
+
+class LimitedAdapter(HTTPAdapter):
+    """
+    requests transport adapter that runs every request under an AdaptiveLimiter.
+
+    KlAkOAPI never passes a timeout, so requests without one get `timeout`
+    (connect, read), shortened to what is left of the calling tool's deadline. Once
+    that deadline has passed no further request is sent (KscDeadlineError). Every
+    request is also recorded in server.metrics and traced as a span named after its
+    KLOAPI method.
+    """
+
+    def __init__(
+        self,
+        limiter: AdaptiveLimiter,
+        timeout: Optional[Tuple[float, float]] = None,
+        **kwargs,
+    ):
+        self.limiter = limiter
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        method = metrics.ksc_method(request.url)
+        with tracing.span(method, **{"ksc.method": method, "url.full": request.url}) as span:
+            response = self._send(request, **kwargs)
+            if span.is_recording():
+                body = request.body or b""
+                span.set_attributes(
+                    {
+                        "http.request.body.size": len(body),
+                        "http.response.status_code": response.status_code,
+                    }
+                )
+                if not kwargs.get("stream"):
+                    span.set_attribute("http.response.body.size", len(response.content))
+                    code = metrics.kloapi_error_code(response.content)
+                    if code is not None:
+                        span.set_attribute("ksc.error_code", code)
+            return response
+
+    def _send(self, request, **kwargs):
+        remaining = deadline.remaining()
+        if remaining is not None and remaining <= 0:
+            raise KscDeadlineError(f"Time budget exhausted before {request.url}")
+        if kwargs.get("timeout") is None and self.timeout is not None:
+            connect, read = self.timeout
+            if remaining is not None:
+                connect, read = min(connect, remaining), min(read, remaining)
+            kwargs["timeout"] = (connect, read)
+
+        queue_wait = None
+        if remaining is not None:
+            queue_wait = min(self.limiter.max_queue_wait, remaining)
+        queued = time.monotonic()
+        self.limiter.acquire(queue_wait)
+        started = time.monotonic()
+        tracing.current_span().set_attribute("ksc.queue_wait_ms", (started - queued) * 1000)
+        overloaded = True  # transport errors count as overload
+        stream = bool(kwargs.get("stream"))
+        response = error = None
+        try:
+            response = super().send(request, **kwargs)
+            if not stream:
+                # Read the body here so latency and metrics cover the whole response
+                _last_response.size = len(response.content)
+            overloaded = response.status_code in OVERLOAD_STATUS_CODES
+            return response
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            latency = time.monotonic() - started
+            self.limiter.release(latency, overloaded)
+            metrics.record_ksc_request(request, response, latency, error, stream)
@@ -0,0 +1,298 @@
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
+
+from KlAkOAPI.AdmServer import KlAkAdmServer
+from KlAkOAPI.Error import KlAkResponseError
+from KlAkOAPI.Session import KlAkSession
+from requests import RequestException
+
+from server.ksc.errors import KscAuthError, KscBusyError, KscError
+
+logger = logging.getLogger(__name__)
+
+
+def _chain(exc: Optional[BaseException]) -> Iterator[BaseException]:
+    """`exc` and the errors it was raised from, e.g. the KlAkOAPI error under a KscApiError."""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        yield exc
+        exc = exc.__cause__ or exc.__context__
+
+
+def is_session_expired(exc: BaseException) -> bool:
+    """
+    Whether `exc`, or an error it was raised from, is KSC rejecting an established
+    session with HTTP 401. A failed login (KscAuthError) does not count.
+    """
+    for error in _chain(exc):
+        if isinstance(error, KscAuthError):
+            return False
+        if isinstance(error, KlAkResponseError) and getattr(error, "status_code", None) == 401:
+            return True
+    return False
+
+
+def is_connection_failure(exc: BaseException) -> bool:
+    """
+    Whether `exc`, or an error it was raised from, failed at the HTTP level (network
+    error, non-200 response), so the connection it was sent on should not be reused.
+    """
+    return any(isinstance(error, (RequestException, KlAkResponseError)) for error in _chain(exc))
+
+
+@dataclass(eq=False)
+class PooledSession:
+    """An authenticated KlAkAdmServer owned by the pool."""
+
+    server: KlAkAdmServer
+    key: str = field(default_factory=lambda: uuid.uuid4().hex)
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class KscSessionPool:
+    """
+    Fixed-size pool of authenticated KSC connections.
+
+    A KlAkAdmServer wraps a single requests.Session bound to one TCP connection, which
+    is neither thread-safe nor shareable, so each worker thread checks out its own
+    connection for the duration of an operation. Idle connections are health-checked
+    with Session.Ping before reuse and recycled once older than `max_age` seconds.
+
+    Server-side objects (ChunkAccessor result sets, task iterators) belong to the
+    session that created them; `checkout(key=...)` returns that specific session.
+    `on_checkin` runs in the returning thread while it still owns the session (used to
+    release such objects), `on_discard` runs once a session has been disconnected.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], KlAkAdmServer],
+        size: int,
+        max_age: float = 3600,
+        health_check_interval: float = 60,
+        checkout_timeout: float = 30,
+        on_checkin: Optional[Callable[[PooledSession], None]] = None,
+        on_discard: Optional[Callable[[PooledSession], None]] = None,
+    ):
+        self._factory = factory
+        self.size = size
+        self.max_age = max_age
+        self.health_check_interval = health_check_interval
+        self.checkout_timeout = checkout_timeout
+        self._on_checkin = on_checkin
+        self._on_discard = on_discard
+
+        self._cond = threading.Condition()
+        self._members: Dict[str, PooledSession] = {}
+        self._idle: List[PooledSession] = []
+        self._creating = 0
+        self._closed = False
+
+    @property
+    def in_use(self) -> int:
+        with self._cond:
+            return len(self._members) - len(self._idle)
+
+    @property
+    def idle(self) -> int:
+        with self._cond:
+            return len(self._idle)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "size": self.size,
+                "open": len(self._members),
+                "idle": len(self._idle),
+                "in_use": len(self._members) - len(self._idle),
+                "connecting": self._creating,
+            }
+
+    def has(self, key: str) -> bool:
+        """Whether the session with the given key is still part of the pool."""
+        with self._cond:
+            return key in self._members
+
+    def is_idle(self, key: str) -> bool:
+        """Whether the session with the given key can be checked out without waiting."""
+        with self._cond:
+            member = self._members.get(key)
+            return member is not None and member in self._idle
+
+    def _connect(self) -> PooledSession:
+        server = self._factory()
+        if not server.connected:
+            raise KscError("Failed to connect to KSC server (connected=False)")
+        return PooledSession(server=server)
+
+    def _is_healthy(self, member: PooledSession) -> bool:
+        now = time.monotonic()
+        if now - member.created_at > self.max_age:
+            return False
+        if now - member.last_used < self.health_check_interval:
+            return True
+        try:
+            KlAkSession(member.server).Ping()
+            return True
+        except Exception as e:
+            logger.info(f"Pooled KSC session {member.key} failed health check: {e}")
+            return False
+
+    def _drop(self, member: PooledSession):
+        """Disconnects a member. Must be called without holding the lock."""
+        try:
+            member.server.Disconnect()
+        except Exception:
+            pass
+        if self._on_discard is not None:
+            self._on_discard(member)
+
+    def checkout(self, key: Optional[str] = None, timeout: Optional[float] = None) -> PooledSession:
+        """
+        Takes a session out of the pool, connecting a new one if the pool is not full.
+        With `key`, waits for that particular session; raises KscError if it is gone.
+        """
+        deadline = time.monotonic() + (self.checkout_timeout if timeout is None else timeout)
+        while True:
+            member = None
+            create = False
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise KscError("KSC session pool is closed")
+                    if key is not None:
+                        if key not in self._members:
+                            raise KscError(f"KSC session {key} is no longer available")
+                        candidate = self._members[key]
+                        if candidate in self._idle:
+                            self._idle.remove(candidate)
+                            member = candidate
+                            break
+                    elif self._idle:
+                        # LIFO keeps a small set of connections warm
+                        member = self._idle.pop()
+                        break
+                    elif len(self._members) + self._creating < self.size:
+                        self._creating += 1
+                        create = True
+                        break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise KscBusyError(
+                            f"Timed out waiting for a free KSC session (pool size {self.size})"
+                        )
+                    # Waiters for a given key share the condition: releases notify all
+                    self._cond.wait(remaining)
+
+            if create:
+                try:
+                    member = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._creating -= 1
+                        self._cond.notify_all()
+                    raise
+                with self._cond:
+                    self._creating -= 1
+                    self._members[member.key] = member
+                return member
+
+            if key is not None or self._is_healthy(member):
+                return member
+
+            # Stale or dead connection: replace it on the next loop iteration
+            self._discard(member)
+
+    def checkin(self, member: PooledSession, discard: bool = False):
+        """Returns a session to the pool, or disconnects it if `discard` is set."""
+        if discard:
+            self._discard(member)
+            return
+        if self._on_checkin is not None:
+            try:
+                self._on_checkin(member)
+            except Exception as e:
+                logger.warning(f"Check-in hook failed for KSC session {member.key}: {e}")
+        member.last_used = time.monotonic()
+        with self._cond:
+            if member.key in self._members and not self._closed:
+                self._idle.append(member)
+                self._cond.notify_all()
+                return
+        self._drop(member)
+
+    def _discard(self, member: PooledSession):
+        with self._cond:
+            self._members.pop(member.key, None)
+            if member in self._idle:
+                self._idle.remove(member)
+            self._cond.notify_all()
+        self._drop(member)
+
+    @contextmanager
+    def session(self, key: Optional[str] = None) -> Iterator[PooledSession]:
+        """
+        Context manager around checkout/checkin. Connections that failed at the HTTP
+        level (network error, non-200 response) or whose KSC session expired are
+        discarded rather than reused.
+        """
+        member = self.checkout(key)
+        broken = False
+        try:
+            yield member
+        except Exception as e:
+            # Service methods wrap KlAkOAPI/requests errors in KscApiError
+            broken = is_connection_failure(e)
+            raise
+        finally:
+            self.checkin(member, discard=broken)
+
+    def heartbeat(self, idle_for: float) -> int:
+        """
+        Pings every idle session unused for at least `idle_for` seconds so KSC does not
+        expire it, and drops the ones that no longer answer. Returns how many were pinged.
+        """
+        with self._cond:
+            now = time.monotonic()
+            due = [m for m in self._idle if now - m.last_used >= idle_for]
+            for member in due:
+                self._idle.remove(member)
+        for member in due:
+            try:
+                KlAkSession(member.server).Ping()
+            except Exception as e:
+                logger.info(f"Pooled KSC session {member.key} failed heartbeat: {e}")
+                self._discard(member)
+                continue
+            self.checkin(member)
+        return len(due)
+
+    def drain(self, timeout: float) -> bool:
+        """Waits up to `timeout` seconds for every checked-out session to be returned."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while len(self._members) - len(self._idle) + self._creating > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self):
+        """Disconnects every idle session; busy sessions are dropped on checkin."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for member in idle:
+                self._members.pop(member.key, None)
+            self._cond.notify_all()
+        for member in idle:
+            self._drop(member)
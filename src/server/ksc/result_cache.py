@@ -0,0 +1,161 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Set
+
+from pydantic import BaseModel
+
+
+def approx_size(value: Any) -> int:
+    """Rough deep size in bytes of a tool result (models, lists, dicts, scalars)."""
+    size = sys.getsizeof(value)
+    if isinstance(value, BaseModel):
+        size += sum(approx_size(v) for v in value.__dict__.values())
+    elif isinstance(value, dict):
+        size += sum(approx_size(k) + approx_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(approx_size(v) for v in value)
+    return size
+
+
+@dataclass(eq=False)
+class CacheEntry:
+    value: Any
+    expires_at: float
+    size: int
+    tags: FrozenSet[Hashable]
+
+
+class ResultCache:
+    """
+    Thread-safe TTL + LRU cache of read tool results, bounded by approximate memory use.
+
+    Every entry carries tags such as ("host", id) or ("group", id) naming the KSC objects
+    it was built from, so a mutation can drop exactly the entries it makes stale
+    (`invalidate`). A result computed before an invalidation must not be stored after
+    it: callers read `generation` before going to KSC and pass it to `put`, which then
+    refuses the stale result.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._tags: Dict[Hashable, Set[Hashable]] = {}
+        self._bytes = 0
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """Incremented by every invalidation."""
+        with self._lock:
+            return self._generation
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: Hashable) -> Optional[CacheEntry]:
+        """Caller holds the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self._bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+        return entry
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: float,
+        tags: Iterable[Hashable] = (),
+        generation: Optional[int] = None,
+    ) -> bool:
+        """
+        Stores `value` for `ttl` seconds. Returns False if it was not stored: a
+        non-positive ttl, a value larger than the whole cache, or an invalidation since
+        `generation` was read.
+        """
+        if ttl <= 0 or value is None:
+            return False
+        size = approx_size(value)
+        if size > self.max_bytes:
+            return False
+        entry = CacheEntry(
+            value=value, expires_at=time.monotonic() + ttl, size=size, tags=frozenset(tags)
+        )
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            self._remove(key)
+            self._entries[key] = entry
+            self._bytes += size
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+        return True
+
+    def peek_tagged(self, tag: Hashable) -> List[Any]:
+        """Values of live entries carrying `tag`, without counting a hit or touching LRU."""
+        now = time.monotonic()
+        with self._lock:
+            entries = (self._entries[key] for key in self._tags.get(tag, ()))
+            return [entry.value for entry in entries if entry.expires_at > now]
+
+    def invalidate(self, *tags: Hashable) -> int:
+        """Drops every entry carrying any of `tags`; returns how many were dropped."""
+        with self._lock:
+            self._generation += 1
+            keys = set()
+            for tag in tags:
+                keys.update(self._tags.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._tags.clear()
+            self._bytes = 0
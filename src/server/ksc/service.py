@@ -1,79 +1,399 @@
+import contextvars
 import logging
-from typing import List, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import replace
+from datetime import datetime
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 # Import KlAkOAPI modules
+from anyio import CapacityLimiter
 from KlAkOAPI.AdmServer import KlAkAdmServer
+from KlAkOAPI.AsyncActionStateChecker import KlAkAsyncActionStateChecker
 from KlAkOAPI.ChunkAccessor import KlAkChunkAccessor
 from KlAkOAPI.HostGroup import KlAkHostGroup
+from KlAkOAPI.Session import KlAkSession
 from KlAkOAPI.Tasks import KlAkTasks
 
-from server.ksc.errors import KscApiError, KscAuthError
-from server.models import GroupInfo, HostDetail, HostInfo, TaskInfo, TaskRunResult, TaskState
+from server import metrics, tracing
+from server.ksc import cancel, deadline
+from server.ksc.accessors import AccessorRegistry
+from server.ksc.chunks import ChunkSizer
+from server.ksc.cursor import HostCursor
+from server.ksc.errors import (
+    KscApiError,
+    KscAuthError,
+    KscCancelledError,
+    KscCursorError,
+    KscError,
+)
+from server.ksc.host_rows import decode_hosts
+from server.ksc.inventory import HostInventory, InventoryRow
+from server.ksc.limiter import AdaptiveLimiter, LimitedAdapter, last_response_bytes
+from server.ksc.pool import KscSessionPool, PooledSession, is_session_expired
+from server.ksc.result_cache import ResultCache
+from server.ksc.singleflight import SingleFlight
+from server.ksc.task_catalog import TaskCatalog, TaskCatalogEntry
+from server.models import (
+    GroupInfo,
+    HostDetail,
+    HostInfo,
+    HostPage,
+    TaskInfo,
+    TaskList,
+    TaskRunResult,
+    TaskState,
+    projection,
+)
 from server.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# on_progress(groups_done, groups_total, tasks_from_group) for list_tasks fan-out
+TaskProgressCallback = Callable[[int, int, List[TaskInfo]], Awaitable[None]]
+
+# Host attributes requested from FindHosts for HostInfo
+HOST_FIELDS = [
+    "KLHST_WKS_DN",
+    "KLHST_WKS_HOSTNAME",
+    "KLHST_WKS_GRP",
+    "KLHST_WKS_STATUS",
+    "id",
+    "name",
+    "KLHST_WKS_IP",
+    "KLHST_WKS_RTP_STATE",
+    "KLHST_WKS_STATUS_ID",
+]
+# HostInfo field -> FindHosts attributes it is decoded from, for projected searches
+HOST_FIELD_ATTRIBUTES = {
+    "id": ["KLHST_WKS_HOSTNAME", "KLHST_WKS_DN"],
+    "name": ["KLHST_WKS_HOSTNAME"],
+    "display_name": ["KLHST_WKS_DN"],
+    "group_id": ["KLHST_WKS_GRP"],
+    "group_name": ["KLHST_WKS_GRP"],
+    "status": ["KLHST_WKS_STATUS", "KLHST_WKS_STATUS_ID", "KLHST_WKS_RTP_STATE"],
+    "ip_address": ["KLHST_WKS_IP"],
+    "products": [],
+}
+# Group attributes requested from FindGroups, and the GroupInfo field each one fills
+GROUP_FIELDS = {
+    "id": "id",
+    "name": "name",
+    "grp_full_name": "full_name",
+    "KLGRP_CHLDHST_CNT": "host_count",
+}
+
+
+def host_attributes(fields: Optional[List[str]]) -> List[str]:
+    """FindHosts vecFieldsToReturn for a projection of HostInfo fields (None: all)."""
+    if fields is None:
+        return HOST_FIELDS
+    wanted = {attribute for field in fields for attribute in HOST_FIELD_ATTRIBUTES[field]}
+    return [attribute for attribute in HOST_FIELDS if attribute in wanted]
+
 
 class KscService:
     def __init__(self):
-        self.server: Optional[KlAkAdmServer] = None
-        self._connected = False
-
-    def _connect_sync(self):
-        """Synchronous connection logic."""
-        if self._connected and self.server and self.server.connected:
-            return
-
+        # Adapts how many KlAkOAPI calls may be in flight to how the server copes
+        self.limiter = AdaptiveLimiter(
+            max_limit=settings.KSC_POOL_SIZE,
+            min_limit=settings.KSC_LIMITER_MIN_LIMIT,
+            latency_target=settings.KSC_LIMITER_LATENCY_TARGET,
+            backoff=settings.KSC_LIMITER_BACKOFF,
+            max_queue_wait=settings.KSC_LIMITER_MAX_QUEUE_WAIT,
+        )
+        # Blocking KSC work runs on its own worker threads rather than anyio's shared
+        # default limiter (40 threads); a thread beyond the pool size could only wait
+        # for a free session
+        self._threads = CapacityLimiter(settings.KSC_POOL_SIZE)
+        # Every FindHosts/FindGroups result set is tracked so it gets released on KSC
+        self.accessors = AccessorRegistry(
+            max_open=settings.KSC_MAX_OPEN_ACCESSORS, lifetime=settings.KSC_ACCESSOR_LIFETIME
+        )
+        # Every call checks out its own authenticated connection, so concurrent tool
+        # calls run in parallel instead of sharing one (non thread-safe) requests.Session
+        self._pool = KscSessionPool(
+            self._create_server,
+            size=settings.KSC_POOL_SIZE,
+            max_age=settings.KSC_POOL_MAX_AGE,
+            health_check_interval=settings.KSC_POOL_HEALTH_CHECK_INTERVAL,
+            checkout_timeout=settings.KSC_POOL_TIMEOUT,
+            on_checkin=self._release_accessors,
+            on_discard=lambda member: self.accessors.forget_session(member.key),
+        )
+        self.inventory: Optional[HostInventory] = None
+        if settings.KSC_INVENTORY_PATH:
+            self.inventory = HostInventory(settings.KSC_INVENTORY_PATH)
+        self.task_catalog = TaskCatalog(ttl=settings.KSC_TASK_CATALOG_TTL)
+        # Concurrent identical reads (e.g. several agents polling critical hosts) share
+        # one KSC request
+        self.flights = SingleFlight()
+        # Recent read results, dropped by tag when a tool mutates the objects they show
+        self.cache = ResultCache(max_bytes=settings.KSC_CACHE_MAX_BYTES)
+        # GetItemsChunk sizes follow observed response times and sizes; the next chunk
+        # of a walk is requested on a helper thread while the caller processes the last
+        self.chunk_sizer = ChunkSizer(
+            initial=settings.KSC_CHUNK_SIZE,
+            max_size=settings.KSC_CHUNK_SIZE_MAX,
+            target_seconds=settings.KSC_CHUNK_TARGET_SECONDS,
+            max_bytes=settings.KSC_CHUNK_MAX_BYTES,
+        )
+        self._read_ahead: Optional[ThreadPoolExecutor] = None
+        if settings.KSC_CHUNK_READ_AHEAD:
+            self._read_ahead = ThreadPoolExecutor(
+                max_workers=settings.KSC_POOL_SIZE, thread_name_prefix="ksc-read-ahead"
+            )
+        # Session token minted after a password login; new connections log in with it
+        # instead of sending the credentials again
+        self._token: Optional[str] = None
+        self._auth_lock = threading.Lock()
+        self._login_lock = threading.Lock()
+        self.auth_stats = {
+            "password_logins": 0,
+            "token_logins": 0,
+            "token_failures": 0,
+            "retries": 0,
+        }
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Counters of every component, by component name (exported by server.metrics)."""
+        with self._auth_lock:
+            auth = dict(self.auth_stats)
+        return {
+            "limiter": self.limiter.stats(),
+            "pool": self._pool.stats(),
+            "accessors": self.accessors.stats(),
+            "flights": self.flights.stats(),
+            "cache": self.cache.stats(),
+            "task_catalog": self.task_catalog.stats(),
+            "chunks": self.chunk_sizer.stats(),
+            "auth": auth,
+        }
+
+    @property
+    def _timeout(self) -> tuple:
+        """(connect, read) timeout for every KlAkOAPI request."""
+        return (settings.KSC_CONNECT_TIMEOUT, settings.KSC_READ_TIMEOUT)
+
+    def _count(self, stat: str):
+        with self._auth_lock:
+            self.auth_stats[stat] += 1
+
+    def _create_server(self) -> KlAkAdmServer:
+        """Opens one authenticated KSC connection for the session pool."""
+        verify = settings.KSC_CERT_PATH if settings.KSC_CERT_PATH else settings.KSC_VERIFY_SSL
+        server = self._create_server_by_token(verify)
+        if server is None:
+            # One password login at a time: connections opened meanwhile (e.g. a burst
+            # on a cold pool) wait for it and then log in with the token it minted
+            with self._login_lock:
+                server = self._create_server_by_token(verify)
+                if server is None:
+                    server = self._create_server_by_password(verify)
+
+        # Every KlAkOAPI call made on this connection goes through the limiter, with
+        # timeouts bounded by the calling tool's deadline
+        adapter = LimitedAdapter(
+            self.limiter, timeout=self._timeout, pool_connections=1, pool_maxsize=1
+        )
+        server.session.mount("https://", adapter)
+        server.session.mount("http://", adapter)
+        return server
+
+    def _create_server_by_token(self, verify) -> Optional[KlAkAdmServer]:
+        """Logs in with the cached session token; None if there is none or it was refused."""
+        token = self._token
+        if not token:
+            return None
+        try:
+            server = KlAkAdmServer.CreateByToken(
+                settings.KSC_HOST, token, verify=verify, timeout=self._timeout
+            )
+            if server.connected:
+                self._count("token_logins")
+                return server
+        except Exception as e:
+            logger.info(f"Token login to KSC failed, using password: {e}")
+        self._count("token_failures")
+        with self._auth_lock:
+            if self._token == token:
+                self._token = None
+        return None
+
+    def _create_server_by_password(self, verify) -> KlAkAdmServer:
         logger.info(f"Connecting to KSC at {settings.KSC_HOST} as {settings.KSC_USERNAME}")
         try:
-            self.server = KlAkAdmServer.Create(
+            server = KlAkAdmServer.Create(
                 url=settings.KSC_HOST,  # type: ignore
                 user_account=settings.KSC_USERNAME,
                 password=settings.KSC_PASSWORD,
-                verify=(
-                    settings.KSC_CERT_PATH
-                    if settings.KSC_CERT_PATH
-                    else settings.KSC_VERIFY_SSL
-                ),
+                verify=verify,
+                timeout=self._timeout,
             )
 
-            if not self.server.connected:
+            if not server.connected:
                 raise KscAuthError("Failed to connect to KSC server (connected=False)")
 
-            self._connected = True
             logger.info("Successfully connected to KSC")
+            self._count("password_logins")
 
         except Exception as e:
             logger.error(f"Connection failed: {e}")
-            self._connected = False
             raise KscAuthError(f"Connection failed: {str(e)}") from e
 
+        if settings.KSC_TOKEN_AUTH:
+            try:
+                self._token = KlAkSession(server).CreateToken().RetVal()
+            except Exception as e:
+                logger.info(f"Could not create a KSC session token: {e}")
+        return server
+
+    async def _run_sync(self, fn: Callable, *args):
+        """
+        Runs blocking KlAkOAPI work in a worker thread. If the calling task is cancelled
+        it returns at once and the thread is told to stop at its next KSC request,
+        releasing what it opened on the server (see server.ksc.cancel).
+        """
+        from anyio import get_cancelled_exc_class, to_thread
+
+        token = cancel.CancelToken()
+        try:
+            return await to_thread.run_sync(
+                self._call_with_relogin,
+                token,
+                fn,
+                *args,
+                limiter=self._threads,
+                abandon_on_cancel=True,
+            )
+        except get_cancelled_exc_class():
+            token.cancel()
+            raise
+
+    def _call_with_relogin(self, token: cancel.CancelToken, fn: Callable, *args):
+        """
+        Runs `fn` once more if KSC rejected its session as expired. The pool has dropped
+        that session by then, so the retry runs on a healthy or freshly logged-in one.
+        The call was refused before doing anything, so retrying is safe for writes too.
+        """
+        with cancel.bound(token):
+            try:
+                return fn(*args)
+            except Exception as e:
+                if not is_session_expired(e) or token.cancelled:
+                    raise
+                logger.info(f"KSC session expired, retrying on a new session: {e}")
+                self._count("retries")
+                return fn(*args)
+
+    def _connect_sync(self):
+        """Synchronous connection logic: makes sure at least one pooled session is up."""
+        with self._pool.session():
+            pass
+
     async def connect(self):
         """Async wrapper for connection."""
-        from anyio import to_thread
-
-        await to_thread.run_sync(self._connect_sync)
+        await self._run_sync(self._connect_sync)
 
-    def _ensure_connected(self):
-        if not self._connected or not self.server:
-            self._connect_sync()
+    def _release_accessors(self, member: PooledSession):
+        """Pool check-in hook: releases the accessors queued for this session."""
+        pending = self.accessors.take_pending(member.key)
+        if not pending:
+            return
+        chunk_accessor = KlAkChunkAccessor(member.server)
+        # Runs after the call that queued them, possibly past its deadline
+        with deadline.detached():
+            for str_accessor in pending:
+                try:
+                    chunk_accessor.Release(str_accessor)
+                except Exception as e:
+                    logger.debug(f"Failed to release accessor {str_accessor}: {e}")
+        logger.debug(f"Released {len(pending)} accessors, {self.accessors.open_count} open")
+
+    def close(self, timeout: float = 0):
+        """
+        Releases open accessors and disconnects all pooled KSC sessions. Waits up to
+        `timeout` seconds for calls still running (e.g. cancelled ones releasing their
+        searches and iterators) to return their sessions first.
+        """
+        if timeout > 0 and not self._pool.drain(timeout):
+            logger.warning(f"KSC calls still running after {timeout:g}s, closing anyway")
+        for key in self.accessors.release_all():
+            try:
+                member = self._pool.checkout(key=key, timeout=0)
+            except KscError:
+                # Busy sessions release on check-in; closed ones took their accessors along
+                continue
+            self._pool.checkin(member)
+        self._pool.close()
+        if self._read_ahead is not None:
+            self._read_ahead.shutdown(wait=False)
+        if self.inventory is not None:
+            self.inventory.close()
+
+    async def _read(
+        self,
+        key: tuple,
+        fn: Callable[[], Awaitable],
+        ttl: float = 0,
+        tags: Callable[[Any], Iterable[tuple]] = lambda result: (),
+    ):
+        """
+        Runs a read call through the result cache and the single-flight layer. Only the
+        call that actually went to KSC stores its result, tagged with `tags(result)`.
+        """
+        if ttl > 0:
+            cached = self.cache.get(key)
+            tracing.current_span().set_attribute("ksc.cache_hit", cached is not None)
+            if cached is not None:
+                return cached
+
+        async def load():
+            generation = self.cache.generation
+            result = await fn()
+            if not deadline.is_partial():
+                self.cache.put(key, result, ttl, tags(result), generation=generation)
+            return result
+
+        if not settings.KSC_SINGLE_FLIGHT:
+            return await load()
+        return await self.flights.do(key, load)
 
     def _ping_sync(self) -> str:
-        self._ensure_connected()
-        try:
-            host_group = KlAkHostGroup(self.server)
-            host_group.GetDomains()
-            return "pong"
-        except Exception as e:
-            logger.warning(f"Ping failed, retrying connection: {e}")
-            self._connected = False
-            self._connect_sync()
-            return "pong"
+        with self._pool.session() as member:
+            KlAkSession(member.server).Ping()
+        return "pong"
 
+    @tracing.traced("KscService.ping")
     async def ping(self) -> str:
-        from anyio import to_thread
-
-        return await to_thread.run_sync(self._ping_sync)
+        return await self._run_sync(self._ping_sync)
+
+    async def run_heartbeat(self):
+        """
+        Pings idle pooled sessions every KSC_HEARTBEAT_INTERVAL seconds so they do not
+        expire during quiet periods and the next tool call finds a live session.
+        """
+        from anyio import sleep
+
+        interval = settings.KSC_HEARTBEAT_INTERVAL
+        while True:
+            await sleep(interval)
+            try:
+                await self._run_sync(self._pool.heartbeat, interval)
+            except Exception as e:
+                logger.warning(f"KSC heartbeat failed: {e}")
 
     def _safe_get(self, obj, key, default):
         """Helper to safely get values from KlAkParams objects or dicts."""
@@ -82,205 +402,383 @@ class KscService:
         except Exception:
             return default
 
-    def _list_hosts_sync(
-        self, group_name: Optional[str] = None, status: Optional[str] = None
-    ) -> List[HostInfo]:
-        self._ensure_connected()
-        host_group = KlAkHostGroup(self.server)
-        chunk_accessor = KlAkChunkAccessor(self.server)
-
-        # Build filter string
-        # Build filter string
-        # wstr_filter = ""
-        # wstr_filter = "" # Original line, replaced by new logic below
-        # Improved filtering logic would go here # Original line, replaced by new logic below
-        # if not wstr_filter: # Original line, replaced by new logic below
-        #     wstr_filter = '(KLHST_WKS_DN="*")' # Original line, replaced by new logic below
-
-        vec_fields = [
-            "KLHST_WKS_DN",
-            "KLHST_WKS_HOSTNAME",
-            "KLHST_WKS_GRP",
-            "KLHST_WKS_STATUS",
-            "id",
-            "name",
-            "KLHST_WKS_IP",
-            "KLHST_WKS_RTP_STATE",
-            "KLHST_WKS_STATUS_ID",
-        ]
-
-        # Build filter
-        filters = []
-        if group_name:
-            # Attempting group name filter if possible, or usually we filter by browsing group.
-            filters.append(f'(KLHST_WKS_GRP_NAME="{group_name}")')
+    def _status_id(self, status: Optional[str]) -> Optional[int]:
+        """Maps a status name (OK/Critical/Warning, case insensitive) to KLHST_WKS_STATUS_ID."""
+        if not status:
+            return None
+        status_map = {"OK": 0, "CRITICAL": 1, "WARNING": 2}
+        return status_map.get(status.upper())
 
+    def _host_filter(self, group_name: Optional[str], status: Optional[str]) -> str:
+        """Builds the FindHosts search filter."""
         final_filter = ""
         if group_name:
             # Reverting to original logic for group_name to avoid breaking changes in this task
             # But it effectively filters by Host Name currently.
             final_filter = f'(name="{group_name}")'
 
-        if status:
-            status_map = {"OK": 0, "CRITICAL": 1, "WARNING": 2}
-            # Case insensitive check
-            s_upper = status.upper()
-            if s_upper in status_map:
-                sid = status_map[s_upper]
-                status_filter = f"(KLHST_WKS_STATUS_ID={sid})"
-                if final_filter:
-                    final_filter = f"(&{final_filter}{status_filter})"
-                else:
-                    final_filter = status_filter
+        sid = self._status_id(status)
+        if sid is not None:
+            status_filter = f"(KLHST_WKS_STATUS_ID={sid})"
+            if final_filter:
+                final_filter = f"(&{final_filter}{status_filter})"
+            else:
+                final_filter = status_filter
 
         # If no specific filters, default to all hosts
         if not final_filter:
             final_filter = '(KLHST_WKS_DN="*")'
-
+        return final_filter
+
+    def _iter_chunks_sync(
+        self, server: KlAkAdmServer, str_accessor: str, start: int, count: int
+    ) -> Iterator:
+        """
+        Walks a ChunkAccessor from `start`, yielding at most `count` rows in chunks sized
+        by self.chunk_sizer. Stops early, marking the result partial, once the tool's
+        deadline has passed.
+
+        An accessor can only be read on the session that created it, so ranges are not
+        spread over sessions; instead, while the caller processes one chunk the next is
+        already requested on a helper thread (one request in flight per session).
+        """
+        chunk_accessor = KlAkChunkAccessor(server)
+
+        def fetch(pos: int, size: int) -> list:
+            with tracing.span("read_chunk", **{"ksc.offset": pos, "ksc.count": size}) as span:
+                started = time.monotonic()
+                res_chunk = chunk_accessor.GetItemsChunk(str_accessor, pos, size)
+                elapsed = time.monotonic() - started
+                chunk_data = res_chunk.OutPar("pChunk")
+                items = []
+                if chunk_data and "KLCSP_ITERATOR_ARRAY" in chunk_data:
+                    items = chunk_data["KLCSP_ITERATOR_ARRAY"]
+                span.set_attribute("ksc.items", len(items))
+            self.chunk_sizer.observe(len(items), elapsed, last_response_bytes())
+            return items
+
+        pos = start
+        end = start + count
+        # (size, future) of the chunk requested ahead on the helper thread
+        pending: Optional[Tuple[int, Future]] = None
+        try:
+            while pos < end:
+                cancel.check()
+                if deadline.expired():
+                    deadline.mark_partial()
+                    return
+                try:
+                    if pending is not None:
+                        (size, future), pending = pending, None
+                        items = future.result()
+                    else:
+                        size = min(self.chunk_sizer.next_size(), end - pos)
+                        items = fetch(pos, size)
+                except Exception:
+                    # The read timeout is cut to the deadline; keep the rows read so far
+                    if deadline.expired():
+                        deadline.mark_partial()
+                        return
+                    raise
+                if len(items) == 0:
+                    return
+                pos += len(items)
+                if self._read_ahead is not None and len(items) == size and pos < end:
+                    ahead = min(self.chunk_sizer.next_size(), end - pos)
+                    # The helper thread sees the caller's deadline, cancel token and span
+                    context = contextvars.copy_context()
+                    pending = (ahead, self._read_ahead.submit(context.run, fetch, pos, ahead))
+                yield items
+        finally:
+            if pending is not None:
+                # The session goes back to the pool only once its last request is done
+                wait([pending[1]])
+
+    def _iter_hosts_sync(
+        self, server: KlAkAdmServer, str_accessor: str, start: int, count: int
+    ) -> Iterator[HostInfo]:
+        """Generator-based host stream over an open FindHosts accessor."""
+        for items in self._iter_chunks_sync(server, str_accessor, start, count):
+            yield from decode_hosts(items)
+
+    def _find_hosts_sync(
+        self,
+        member: PooledSession,
+        wstr_filter: str,
+        vec_fields: List[str] = HOST_FIELDS,
+        query: Optional[str] = None,
+    ) -> HostCursor:
+        """
+        Runs a host search and returns a cursor positioned at the first row. The
+        accessor is registered for release; pass `query` to let identical searches reuse it.
+
+        The search runs as HostGroup.FindHostsAsync so that a cancelled or timed-out
+        tool call can stop it on the server with FindHostsAsyncCancel.
+        """
+        host_group = KlAkHostGroup(member.server)
+        chunk_accessor = KlAkChunkAccessor(member.server)
+
+        res = host_group.FindHostsAsync(
+            wstrFilter=wstr_filter,
+            vecFieldsToReturn=vec_fields,
+            vecFieldsToOrder=[],
+            pParams={"KLGRP_FIND_FROM_CUR_VS_ONLY": True},
+            lMaxLifeTime=settings.KSC_ACCESSOR_LIFETIME,
+        )
+        request_id = res.OutPar("strRequestId")
+        try:
+            self._wait_for_action_sync(member.server, request_id)
+        except BaseException:
+            with deadline.detached():
+                try:
+                    host_group.FindHostsAsyncCancel(request_id)
+                except Exception as e:
+                    logger.debug(f"Failed to cancel host search {request_id}: {e}")
+            raise
+
+        str_accessor = host_group.FindHostsAsyncGetAccessor(request_id).OutPar("strAccessor")
         try:
-            res = host_group.FindHosts(
-                wstrFilter=final_filter,
-                vecFieldsToReturn=vec_fields,
-                vecFieldsToOrder=[],
-                pParams={"KLGRP_FIND_FROM_CUR_VS_ONLY": True},
-                lMaxLifeTime=600,
-            )
-
-            str_accessor = res.OutPar("strAccessor")
             items_count = chunk_accessor.GetItemsCount(str_accessor).RetVal()
+        except Exception:
+            self.accessors.register(member.key, str_accessor, 0)
+            self.accessors.release(str_accessor)
+            raise
+        self.accessors.register(member.key, str_accessor, items_count, query)
+        return HostCursor(
+            session=member.key,
+            accessor=str_accessor,
+            offset=0,
+            total=items_count,
+            expires_at=time.time() + settings.KSC_ACCESSOR_LIFETIME,
+        )
+
+    def _wait_for_action_sync(self, server: KlAkAdmServer, action_guid: str):
+        """Polls an asynchronous KSC action until it finishes, unless cancelled first."""
+        checker = KlAkAsyncActionStateChecker(server)
+        while True:
+            cancel.check()
+            state = checker.CheckActionState(action_guid)
+            if state.OutPar("bFinalized"):
+                if not state.OutPar("bSuccededFinalized"):
+                    raise KscApiError(
+                        f"KSC action {action_guid} failed: {state.OutPar('pStateData')}"
+                    )
+                return
+            # lNextCheckDelay is in milliseconds; never wait past the deadline
+            delay = (state.OutPar("lNextCheckDelay") or 0) / 1000
+            remaining = deadline.remaining()
+            if remaining is not None:
+                delay = min(delay, max(remaining, 0))
+            cancel.sleep(delay)
 
-            hosts = []
-            if items_count > 0:
-                count_to_fetch = min(items_count, 50)
-                res_chunk = chunk_accessor.GetItemsChunk(str_accessor, 0, count_to_fetch)
-                chunk_data = res_chunk.OutPar("pChunk")
-
-                if chunk_data and "KLCSP_ITERATOR_ARRAY" in chunk_data:
-                    items_iter = chunk_data["KLCSP_ITERATOR_ARRAY"]
-                    for item in items_iter:
-                        # Use KLHST_WKS_HOSTNAME (Network Name) as the ID for MCP lookups
-                        # This typically maps to what GetHostInfo(strHostName=...) expects
-                        unique_name = self._safe_get(item, "KLHST_WKS_HOSTNAME", "")
-                        if not unique_name:
-                            # Fallback to Display Name
-                            unique_name = self._safe_get(item, "KLHST_WKS_DN", "")
-
-                        grp_id = self._safe_get(item, "KLHST_WKS_GRP", 0)
-                        grp_name = "Unknown"
-                        if grp_id == 0:
-                            grp_name = "Managed Devices"
-
-                        # Extract other fields safely
-                        dn = self._safe_get(item, "KLHST_WKS_DN", "Unknown")
-                        hostname = self._safe_get(item, "KLHST_WKS_HOSTNAME", "Unknown")
-                        status = self._safe_get(item, "KLHST_WKS_STATUS", "0")
-                        ip_val = self._safe_get(item, "KLHST_WKS_IP", None)
-
-                        # Decode IP
-                        ip_str = None
-                        if ip_val is not None:
-                            try:
-                                ip_int = int(ip_val)
-                                if ip_int < 0:
-                                    ip_int += 2**32
-                                import socket
-                                import struct
-
-                                packed_ip = struct.pack("<I", ip_int)
-                                ip_str = socket.inet_ntoa(packed_ip)
-                            except Exception:
-                                ip_str = str(ip_val)
-
-                        # Fetch RTP State
-                        rtp_state_val = self._safe_get(item, "KLHST_WKS_RTP_STATE", 0)
-                        rtp_desc = "Unknown"
-                        try:
-                            rtp_int = int(rtp_state_val)
-                            rtp_map = {
-                                0: "Unknown",
-                                1: "Stopped",
-                                2: "Suspended",
-                                3: "Starting",
-                                4: "Running",
-                                5: "Running (Max Protection)",
-                                6: "Running (Max Speed)",
-                                7: "Running (Recommended)",
-                                8: "Running (Custom)",
-                                9: "Failure",
-                            }
-                            rtp_desc = rtp_map.get(rtp_int, str(rtp_int))
-                        except Exception:
-                            rtp_desc = str(rtp_state_val)
-
-                        # Fetch Status ID (OK/Critical/Warning)
-                        status_id_val = self._safe_get(item, "KLHST_WKS_STATUS_ID", 0)
-                        status_id_desc = "Unknown"
-                        try:
-                            sid_int = int(status_id_val)
-                            if sid_int == 0:
-                                status_id_desc = "OK"
-                            elif sid_int == 1:
-                                status_id_desc = "Critical"
-                            elif sid_int == 2:
-                                status_id_desc = "Warning"
-                            else:
-                                status_id_desc = str(sid_int)
-                        except Exception:
-                            status_id_desc = str(status_id_val)
-
-                        # Decode Status Bitmask
-                        status_str = str(status)
-                        try:
-                            s_int = int(status)
-                            status_desc_parts = []
-                            # Bit 0 (1): Visible
-                            if s_int & 0b1:
-                                status_desc_parts.append("Visible")
-                            # Bit 2 (4): Agent Installed
-                            if s_int & 0b100:
-                                status_desc_parts.append("Agent Installed")
-                            # Bit 3 (8): Agent Active
-                            if s_int & 0b1000:
-                                status_desc_parts.append("Agent Active")
-                            # Bit 4 (16): RTP Installed
-                            if s_int & 0b10000:
-                                status_desc_parts.append("RTP Installed")
-
-                            # Combine
-                            status_details = (
-                                ", ".join(status_desc_parts) if status_desc_parts else "None"
-                            )
-                            status_str = (
-                                f"[{status_id_desc}] Status: {status} "
-                                f"({status_details}) | RTP: {rtp_desc}"
-                            )
-                        except Exception:
-                            pass
-
-                        hosts.append(
-                            HostInfo(
-                                id=str(unique_name),
-                                name=str(hostname),
-                                display_name=str(dn),
-                                group_id=grp_id,
-                                group_name=grp_name,
-                                status=status_str,
-                                ip_address=ip_str,
-                            )
+    def _list_hosts_sync(
+        self,
+        group_name: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> HostPage:
+        # Resuming from a cursor skips FindHosts and continues on the same accessor,
+        # which only exists within the pooled session that created it
+        position = HostCursor.decode(cursor) if cursor else None
+        fields = projection(fields, HostInfo)
+        if position is None and self.inventory is not None and self.inventory.synced_at:
+            return self._list_hosts_from_inventory(group_name, status, limit, fields=fields)
+        if position is not None and position.source == "inventory":
+            return self._list_hosts_from_inventory(group_name, status, limit, position)
+        wstr_filter = self._host_filter(group_name, status)
+        resume_at = 0
+        if position is not None:
+            # The accessor only holds the attributes of the search that created it
+            fields = (position.query or {}).get("fields")
+            wstr_filter = (position.query or {}).get("filter", wstr_filter)
+            if not self.accessors.is_open(position.accessor):
+                # Released or evicted: run the search again and continue at the offset
+                resume_at, position = position.offset, None
+
+        vec_fields = host_attributes(fields)
+        # Accessors of projected searches are only reused by the same projection
+        query = wstr_filter if fields is None else f"{wstr_filter} {','.join(vec_fields)}"
+        if position is None:
+            position = self._reusable_cursor(query)
+        if position and not self._pool.has(position.session):
+            raise KscCursorError("Cursor is no longer valid, its KSC session was closed.")
+
+        with self._pool.session(key=position.session if position else None) as member:
+            try:
+                if position is None:
+                    with tracing.span("find_hosts", **{"ksc.filter": wstr_filter}) as span:
+                        position = self._find_hosts_sync(
+                            member, wstr_filter, vec_fields, query=query
                         )
+                        span.set_attribute("ksc.total", position.total)
+                if resume_at:
+                    position = replace(position, offset=min(resume_at, position.total))
 
-            return hosts
+                hosts = list(
+                    self._iter_hosts_sync(member.server, position.accessor, position.offset, limit)
+                )
+                if position.offset + len(hosts) >= position.total:
+                    # Walk finished: Release goes out when the session is checked in
+                    self.accessors.release(position.accessor)
+                else:
+                    self.accessors.touch(position.accessor)
+
+            except Exception as e:
+                if position is not None:
+                    self.accessors.release(position.accessor)
+                raise KscApiError(f"Failed to list hosts: {e}")
+
+        next_offset = position.offset + len(hosts)
+        # Fewer rows than requested and available: the deadline cut the page short
+        wanted = min(limit, position.total - position.offset)
+        partial = deadline.is_partial() and len(hosts) < wanted
+        next_cursor = None
+        if (hosts or partial) and next_offset < position.total:
+            # Every access extends the accessor lifetime on the server
+            next_cursor = HostCursor(
+                session=position.session,
+                accessor=position.accessor,
+                offset=next_offset,
+                total=position.total,
+                expires_at=time.time() + settings.KSC_ACCESSOR_LIFETIME,
+                query={"filter": wstr_filter, "fields": fields},
+            ).encode()
+
+        return HostPage(
+            hosts=hosts,
+            total=position.total,
+            next_cursor=next_cursor,
+            partial=partial,
+            fields=fields,
+        )
+
+    def _reusable_cursor(self, wstr_filter: str) -> Optional[HostCursor]:
+        """Cursor at the first row of a live accessor for the same search, if one is free."""
+        entry = self.accessors.lookup(wstr_filter, available=self._pool.is_idle)
+        if entry is None:
+            return None
+        return HostCursor(
+            session=entry.session,
+            accessor=entry.accessor,
+            offset=0,
+            total=entry.total,
+            expires_at=entry.expires_at,
+        )
+
+    def _list_hosts_from_inventory(
+        self,
+        group_name: Optional[str],
+        status: Optional[str],
+        limit: int,
+        position: Optional[HostCursor] = None,
+        fields: Optional[List[str]] = None,
+    ) -> HostPage:
+        """Answers a host search from the local inventory instead of KSC."""
+        if self.inventory is None:
+            raise KscCursorError("Cursor refers to the local inventory, which is disabled.")
+
+        offset = 0
+        if position is not None:
+            query = position.query or {}
+            group_name, status = query.get("group_name"), query.get("status")
+            fields = query.get("fields")
+            offset = position.offset
+
+        hosts, total = self.inventory.query_hosts(
+            name=group_name, status_id=self._status_id(status), limit=limit, offset=offset
+        )
+
+        next_cursor = None
+        if hosts and offset + len(hosts) < total:
+            next_cursor = HostCursor(
+                session="",
+                accessor="",
+                offset=offset + len(hosts),
+                total=total,
+                expires_at=time.time() + settings.KSC_ACCESSOR_LIFETIME,
+                source="inventory",
+                query={"group_name": group_name, "status": status, "fields": fields},
+            ).encode()
+
+        return HostPage(
+            hosts=hosts,
+            total=total,
+            next_cursor=next_cursor,
+            staleness_seconds=self.inventory.staleness(),
+            fields=fields,
+        )
+
+    def _inventory_rows(self, items) -> Iterator[InventoryRow]:
+        for item, host in zip(items, decode_hosts(items)):
+            status_id = self._safe_get(item, "KLHST_WKS_STATUS_ID", None)
+            last_update = self._safe_get(item, "KLHST_WKS_LAST_INFOUDATE", None)
+            if isinstance(last_update, datetime):
+                last_update = last_update.strftime("%Y-%m-%d %H:%M:%S")
+            yield (
+                host,
+                int(status_id) if isinstance(status_id, int) else None,
+                last_update or None,
+            )
 
-        except Exception as e:
-            raise KscApiError(f"Failed to list hosts: {e}")
+    def _sync_inventory_sync(self, full: bool = False):
+        """
+        Copies hosts into the local inventory. A full sync walks every host; an incremental
+        sync only fetches hosts updated since the inventory's high-water mark.
+        """
+        inventory = self.inventory
+        if inventory is None:
+            return
+
+        mark = inventory.high_water_mark
+        if mark is None:
+            full = True
+
+        started = time.monotonic()
+        inventory.replace_groups(self._list_groups_sync())
+
+        generation = inventory.begin_full_sync() if full else None
+        wstr_filter = '(KLHST_WKS_DN="*")' if full else f'(KLHST_WKS_LAST_INFOUDATE>=T"{mark}")'
+        with self._pool.session() as member:
+            position = self._find_hosts_sync(
+                member, wstr_filter, HOST_FIELDS + ["KLHST_WKS_LAST_INFOUDATE"]
+            )
+            try:
+                chunks = self._iter_chunks_sync(member.server, position.accessor, 0, position.total)
+                for items in chunks:
+                    inventory.upsert_hosts(self._inventory_rows(items), generation)
+            finally:
+                self.accessors.release(position.accessor)
+
+        inventory.finish_sync(generation)
+        logger.info(
+            f"Inventory {'full' if full else 'incremental'} sync: {position.total} hosts "
+            f"in {time.monotonic() - started:.1f}s"
+        )
+
+    async def run_inventory_sync(self):
+        """Background job: keeps the local inventory current until cancelled."""
+        from anyio import sleep
+
+        while self.inventory is not None:
+            full_synced_at = self.inventory.full_synced_at
+            full = (
+                full_synced_at is None
+                or time.time() - full_synced_at >= settings.KSC_INVENTORY_FULL_SYNC_INTERVAL
+            )
+            try:
+                await self._run_sync(self._sync_inventory_sync, full)
+            except Exception as e:
+                logger.warning(f"Inventory sync failed: {e}")
+            await sleep(settings.KSC_INVENTORY_REFRESH_INTERVAL)
 
     def _list_groups_sync(
-        self, group_name: Optional[str] = None, parent_id: Optional[int] = None
+        self,
+        group_name: Optional[str] = None,
+        parent_id: Optional[int] = None,
+        fields: Optional[List[str]] = None,
     ) -> List[GroupInfo]:
-        self._ensure_connected()
-        host_group = KlAkHostGroup(self.server)
-        chunk_accessor = KlAkChunkAccessor(self.server)
-
         # Build filter
         wstr_filter = ""
         if group_name:
@@ -297,131 +795,267 @@ class KscService:
             pass
             # We usually use 'one level' search or 'subtree' search.
 
-        vec_fields = ["id", "name", "grp_full_name", "KLGRP_CHLDHST_CNT"]
-
-        try:
-            res = host_group.FindGroups(
-                wstrFilter=wstr_filter,
-                vecFieldsToReturn=vec_fields,
-                vecFieldsToOrder=[],
-                pParams=p_params,
-                lMaxLifeTime=600,
-            )
-
-            str_accessor = res.OutPar("strAccessor")
-            items_count = chunk_accessor.GetItemsCount(str_accessor).RetVal()
+        vec_fields = [
+            attribute
+            for attribute, field in GROUP_FIELDS.items()
+            if fields is None or field in fields
+        ]
 
-            groups = []
-            if items_count > 0:
-                count_to_fetch = min(items_count, 100)
-                res_chunk = chunk_accessor.GetItemsChunk(str_accessor, 0, count_to_fetch)
-                chunk_data = res_chunk.OutPar("pChunk")
+        with self._pool.session() as member:
+            host_group = KlAkHostGroup(member.server)
+            chunk_accessor = KlAkChunkAccessor(member.server)
 
-                if chunk_data and "KLCSP_ITERATOR_ARRAY" in chunk_data:
-                    items_iter = chunk_data["KLCSP_ITERATOR_ARRAY"]
-                    for item in items_iter:
-                        groups.append(
-                            GroupInfo(
-                                id=self._safe_get(item, "id", 0),
-                                name=str(self._safe_get(item, "name", "Unknown")),
-                                full_name=str(self._safe_get(item, "grp_full_name", "")),
-                                host_count=self._safe_get(item, "KLGRP_CHLDHST_CNT", 0),
-                                # TODO: Get parent ID if possible,
-                                # usually requires extra query or fields
-                                parent_id=0,
-                            )
-                        )
+            try:
+                res = host_group.FindGroups(
+                    wstrFilter=wstr_filter,
+                    vecFieldsToReturn=vec_fields,
+                    vecFieldsToOrder=[],
+                    pParams=p_params,
+                    lMaxLifeTime=settings.KSC_ACCESSOR_LIFETIME,
+                )
 
-            return groups
+                str_accessor = res.OutPar("strAccessor")
+                self.accessors.register(member.key, str_accessor, 0)
+                try:
+                    items_count = chunk_accessor.GetItemsCount(str_accessor).RetVal()
+                    groups = self._read_groups_sync(member.server, str_accessor, items_count)
+                finally:
+                    self.accessors.release(str_accessor)
+                return groups
+
+            except KscCancelledError:
+                raise
+            except Exception as e:
+                raise KscApiError(f"Failed to list groups: {e}")
+
+    def _read_groups_sync(
+        self, server: KlAkAdmServer, str_accessor: str, items_count: int
+    ) -> List[GroupInfo]:
+        # Every chunk, not just the first: the task scan fans out over this list
+        groups = []
+        for items in self._iter_chunks_sync(server, str_accessor, 0, items_count):
+            for item in items:
+                groups.append(
+                    GroupInfo(
+                        id=self._safe_get(item, "id", 0),
+                        name=str(self._safe_get(item, "name", "Unknown")),
+                        full_name=str(self._safe_get(item, "grp_full_name", "")),
+                        host_count=self._safe_get(item, "KLGRP_CHLDHST_CNT", 0),
+                        # TODO: Get parent ID if possible,
+                        # usually requires extra query or fields
+                        parent_id=0,
+                    )
+                )
 
-        except Exception as e:
-            raise KscApiError(f"Failed to list groups: {e}")
+        return groups
 
+    @tracing.traced("KscService.list_groups")
     async def list_groups(
-        self, group_name: Optional[str] = None, parent_id: Optional[int] = None
+        self,
+        group_name: Optional[str] = None,
+        parent_id: Optional[int] = None,
+        fields: Optional[List[str]] = None,
     ) -> List[GroupInfo]:
-        from anyio import to_thread
-
-        return await to_thread.run_sync(self._list_groups_sync, group_name, parent_id)
+        """Lists groups; a `fields` projection only requests those attributes from KSC."""
+        fields = projection(fields, GroupInfo)
+        groups = await self._read(
+            ("list_groups", group_name, parent_id, fields and tuple(fields)),
+            lambda: self._run_sync(self._list_groups_sync, group_name, parent_id, fields),
+            ttl=settings.KSC_CACHE_TTL_GROUPS,
+            tags=lambda groups: [("groups",)] + [("group", g.id) for g in groups],
+        )
+        tracing.current_span().set_attribute("ksc.items", len(groups))
+        return groups
+
+    @tracing.traced("KscService.list_hosts_page")
+    async def list_hosts_page(
+        self,
+        group_name: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> HostPage:
+        # The search filter normalizes the arguments ("critical" and "Critical" match)
+        fields = projection(fields, HostInfo)
+        key = (
+            "list_hosts",
+            self._host_filter(group_name, status),
+            limit,
+            cursor,
+            fields and tuple(fields),
+        )
+        span = tracing.current_span()
+        span.set_attributes({"ksc.filter": key[1], "ksc.limit": limit, "ksc.resumed": bool(cursor)})
+        page = await self._read(
+            key,
+            lambda: self._run_sync(
+                self._list_hosts_sync, group_name, status, limit, cursor, fields
+            ),
+            ttl=settings.KSC_CACHE_TTL_HOSTS,
+            tags=lambda page: [("host", h.id) for h in page.hosts],
+        )
+        span.set_attributes(
+            {"ksc.items": len(page.hosts), "ksc.total": page.total, "ksc.partial": page.partial}
+        )
+        return page
 
     async def list_hosts(
         self, group_name: Optional[str] = None, status: Optional[str] = None
     ) -> List[HostInfo]:
-        from anyio import to_thread
-
-        return await to_thread.run_sync(self._list_hosts_sync, group_name, status)
+        page = await self.list_hosts_page(group_name=group_name, status=status)
+        return page.hosts
 
     def _get_host_details_sync(self, host_id: str) -> HostDetail:
-        self._ensure_connected()
-        host_group = KlAkHostGroup(self.server)
+        with self._pool.session() as member:
+            host_group = KlAkHostGroup(member.server)
 
-        try:
-            res = host_group.GetHostInfo(
-                # host_id must be the unique string name (GUID-like) or Network Name
-                strHostName=host_id,
-                pFields2Return=["KLHST_WKS_DN", "KLHST_WKS_HOSTNAME"],
-            )
+            try:
+                res = host_group.GetHostInfo(
+                    # host_id must be the unique string name (GUID-like) or Network Name
+                    strHostName=host_id,
+                    pFields2Return=["KLHST_WKS_DN", "KLHST_WKS_HOSTNAME"],
+                )
 
-            data = res.RetVal()
-            return HostDetail(
-                id=host_id,
-                name=str(self._safe_get(data, "KLHST_WKS_DN", "Unknown")),
-                products=[],
-                os_info={},
-            )
-        except Exception as e:
-            raise KscApiError(f"Failed to get host details: {e}")
+                data = res.RetVal()
+                return HostDetail(
+                    id=host_id,
+                    name=str(self._safe_get(data, "KLHST_WKS_DN", "Unknown")),
+                    products=[],
+                    os_info={},
+                )
+            except Exception as e:
+                raise KscApiError(f"Failed to get host details: {e}")
 
+    @tracing.traced("KscService.get_host_details")
     async def get_host_details(self, host_id: str) -> HostDetail:
-        from anyio import to_thread
-
-        return await to_thread.run_sync(self._get_host_details_sync, host_id)
+        tracing.current_span().set_attribute("ksc.host_id", host_id)
+        return await self._read(
+            ("get_host_details", host_id),
+            lambda: self._run_sync(self._get_host_details_sync, host_id),
+            ttl=settings.KSC_CACHE_TTL_HOST_DETAILS,
+            tags=lambda details: [("host", host_id)],
+        )
 
     def _move_host_sync(self, host_id: str, group_id: int) -> bool:
-        self._ensure_connected()
-        host_group = KlAkHostGroup(self.server)
-        try:
-            # MoveHostsToGroup(nGroup, pHostNames) where pHostNames is array of host IDs/names
-            host_group.MoveHostsToGroup(nGroup=group_id, pHostNames=[host_id])
-            return True
-        except Exception as e:
-            raise KscApiError(f"Failed to move host: {e}")
+        with self._pool.session() as member:
+            host_group = KlAkHostGroup(member.server)
+            try:
+                # MoveHostsToGroup(nGroup, pHostNames) where pHostNames is array of host IDs/names
+                host_group.MoveHostsToGroup(nGroup=group_id, pHostNames=[host_id])
+                return True
+            except Exception as e:
+                raise KscApiError(f"Failed to move host: {e}")
 
+    @tracing.traced("KscService.move_host")
     async def move_host(self, host_id: str, group_id: int) -> bool:
-        from anyio import to_thread
-
-        return await to_thread.run_sync(self._move_host_sync, host_id, group_id)
+        tracing.current_span().set_attributes({"ksc.host_id": host_id, "ksc.group_id": group_id})
+        try:
+            return await self._run_sync(self._move_host_sync, host_id, group_id)
+        finally:
+            self._invalidate_moved_host(host_id, group_id)
+
+    def _invalidate_moved_host(self, host_id: str, target_group_id: int):
+        """Drops cached results showing the host and the host counts of both groups."""
+        source_groups = {
+            host.group_id
+            for page in self.cache.peek_tagged(("host", host_id))
+            if isinstance(page, HostPage) and (page.fields is None or "group_id" in page.fields)
+            for host in page.hosts
+            if host.id == host_id
+        }
+        tags = [("host", host_id), ("group", target_group_id)]
+        if source_groups:
+            tags += [("group", gid) for gid in source_groups]
+        else:
+            # Source group unknown: every group listing may show a stale host count
+            tags.append(("groups",))
+        self.cache.invalidate(*tags)
 
-    def _list_tasks_sync(self, group_id: int = -1, scan_all_groups: bool = False) -> List[TaskInfo]:
-        self._ensure_connected()
-        tasks_api = KlAkTasks(self.server)
+    def _task_display_name(self, tasks_api: KlAkTasks, unique_name: str) -> Optional[str]:
+        """Resolves a task's DisplayName with Tasks.GetTask."""
+        try:
+            # Fetch full details to get DisplayName
+            details = tasks_api.GetTask(str(unique_name))
 
-        # Strategy:
-        # 1. If scan_all_groups is True, get all groups first, then iterate.
-        # 2. If scan_all_groups is False, just query the specific group_id (or Global if -1).
+            # details might be KlAkResponse or KlAkParams or dict-like
+            # Try item access first as it seems most reliable for these wrappers
+            dn = None
+            try:
+                dn = details["DisplayName"]
+            except Exception:
+                # Try .get if available
+                if hasattr(details, "get"):
+                    try:
+                        dn = details.get("DisplayName")
+                    except Exception:
+                        pass
 
-        target_groups = []
-        if scan_all_groups:
-            # Fetch all groups. We could filter by parent_id if needed,
-            # but for "all" we want the flat list presumably.
-            # _list_groups_sync with no args usually returns all top-level or searchable groups.
-            # However, FindGroups usually searches deep if configured.
-            # _list_groups_sync uses wstrFilter='(name="{group_name}")' if named, else all?
-            # Let's check _list_groups_sync implementation. It uses empty filter -> all groups.
-            kv_groups = self._list_groups_sync()
-            target_groups = [g.id for g in kv_groups]
+            if not dn:
+                try:
+                    # Sometimes details is a wrapper that needs OutPar or similar?
+                    # But GetTask generally returns KlAkParams.
+                    # If ParseResponse returns dict (from json), we are good.
+                    rv = details
+                    if hasattr(details, "RetVal"):
+                        rv = details.RetVal()
 
-            # Also include global tasks (group -1)
-            target_groups.append(-1)
-        else:
-            target_groups = [group_id]
+                    try:
+                        dn = rv["DisplayName"]
+                    except Exception:
+                        pass
+                except Exception:
+                    pass
 
-        all_tasks = []
+            return dn
 
-        for gid in target_groups:
-            # If group_id is not -1, we assume it's significant
-            group_id_significant = gid != -1
+        except Exception:
+            return None
+
+    def _resolve_task(
+        self, tasks_api: KlAkTasks, task_id: str, task_data, gid: int
+    ) -> TaskCatalogEntry:
+        """
+        Returns catalog data for a task found by the task iterator. The DisplayName is
+        taken from the iterator row when KSC includes TASK_INFO_PARAMS, then from the
+        task catalog, and only as a last resort from a Tasks.GetTask round trip.
+        """
+        info = self._safe_get(task_data, "TASK_INFO_PARAMS", None)
+        name = self._safe_get(info, "DisplayName", None)
+        task_type = str(self._safe_get(task_data, "TASKSCH_TYPE", "Unknown"))
+        group_id = self._safe_get(info, "PRTS_TASK_GROUPID", gid)
+
+        if not name:
+            entry = self.task_catalog.get(task_id)
+            if entry is not None:
+                return entry
+
+            # unique_name is the ID needed for GetTask
+            name = self._task_display_name(tasks_api, task_id)
+            if not name:
+                # Not cached: GetTask may have failed transiently
+                name = self._safe_get(task_data, "TASK_NAME", "Unknown")
+                return TaskCatalogEntry(
+                    name=str(name), type=task_type, group_id=group_id, cached_at=time.monotonic()
+                )
 
+        return self.task_catalog.put(task_id, str(name), task_type, group_id)
+
+    def _list_group_tasks_sync(
+        self, gid: int, seen: Set[str], seen_lock: threading.Lock
+    ) -> List[TaskInfo]:
+        """
+        Enumerates the tasks of one group on its own pooled session. Task IDs are
+        claimed in the shared `seen` set, so a task that is visible from several
+        groups (bIncludeSupergroups) is returned only once. They are claimed when the
+        group's read is over, so a read retried by _call_with_relogin still finds them.
+        """
+        # If group_id is not -1, we assume it's significant
+        group_id_significant = gid != -1
+        group_tasks: Dict[str, TaskInfo] = {}
+
+        with self._pool.session() as member:
+            tasks_api = KlAkTasks(member.server)
             try:
                 res = tasks_api.ResetTasksIterator(
                     nGroupId=gid,
@@ -431,140 +1065,213 @@ class KscService:
                     strComponentName="",
                     strInstanceId="",
                     strTaskName="",
-                    # Maybe False if scanning all to avoid dups? But True is safer for visibility.
+                    # Maybe False if scanning all to avoid dups?
+                    # But True is safer for visibility.
                     bIncludeSupergroups=True,
                 )
 
                 iter_id = res.OutPar("strTaskIteratorId")
 
-                # Fetch tasks for this group
-                for _ in range(50):  # Limit per group to avoid timeout loops
-                    res_task = tasks_api.GetNextTask(iter_id)
-                    task_data = res_task.OutPar("pChunk")
-                    if not task_data:
-                        break
-
-                    # Check potential ID fields
-                    unique_name = self._safe_get(task_data, "TASK_UNIQUE_ID", "")
-                    if not unique_name:
-                        unique_name = self._safe_get(task_data, "strName", "")
-
-                    # Check if already added (simple dedup by ID)
-                    t_id = str(unique_name)
-                    if any(t.id == t_id for t in all_tasks):
-                        continue
-
-                    # Resolve friendly name
-                    # unique_name is the ID needed for GetTask
-                    friendly_name = self._safe_get(task_data, "TASK_NAME", "Unknown")
-
-                    try:
-                        # Fetch full details to get DisplayName
-                        details = tasks_api.GetTask(str(unique_name))
-
-                        # details might be KlAkResponse or KlAkParams or dict-like
-                        # Try item access first as it seems most reliable for these wrappers
-                        dn = None
-                        try:
-                            dn = details["DisplayName"]
-                        except Exception:
-                            # Try .get if available
-                            if hasattr(details, "get"):
-                                try:
-                                    dn = details.get("DisplayName")
-                                except Exception:
-                                    pass
-
-                            # check if it's a list or tuple (sometimes KlAkParams)
-                            if not dn:
-                                try:
-                                    # Try extracting from raw if it's wrapped
-                                    # But for now assume dict-like access works or fails
-                                    pass
-                                except Exception:
-                                    pass
-
-                        if not dn:
-                            try:
-                                # Sometimes details is a wrapper that needs OutPar or similar?
-                                # But GetTask generally returns KlAkParams.
-                                # If ParseResponse returns dict (from json), we are good.
-                                rv = details
-                                if hasattr(details, "RetVal"):
-                                    rv = details.RetVal()
-
-                                try:
-                                    dn = rv["DisplayName"]
-                                except Exception:
-                                    pass
-                            except Exception:
-                                pass
-
-                        if dn:
-                            friendly_name = dn
+                try:
+                    # Fetch tasks for this group
+                    for _ in range(50):  # Limit per group to avoid timeout loops
+                        cancel.check()
+                        if deadline.expired():
+                            deadline.mark_partial()
+                            break
+                        res_task = tasks_api.GetNextTask(iter_id)
+                        task_data = res_task.OutPar("pTaskData")
+                        if not task_data:
+                            break
+
+                        # Check potential ID fields
+                        unique_name = self._safe_get(task_data, "TASK_UNIQUE_ID", "")
+                        if not unique_name:
+                            unique_name = self._safe_get(task_data, "strName", "")
 
-                    except Exception:
-                        pass
+                        # Check if already added by this or another group
+                        t_id = str(unique_name)
+                        with seen_lock:
+                            if t_id in seen or t_id in group_tasks:
+                                continue
 
-                    all_tasks.append(
-                        TaskInfo(
-                            id=t_id,
-                            name=str(friendly_name),
-                            type=str(self._safe_get(task_data, "TASKSCH_TYPE", "Unknown")),
-                            state="Unknown",
+                        entry = self._resolve_task(tasks_api, t_id, task_data, gid)
+                        group_tasks[t_id] = TaskInfo(
+                            id=t_id, name=entry.name, type=entry.type, state="Unknown"
                         )
-                    )
-
-                tasks_api.ReleaseTasksIterator(iter_id)
+                finally:
+                    # Also on cancellation/errors, so iterators don't pile up on the server
+                    with deadline.detached():
+                        tasks_api.ReleaseTasksIterator(iter_id)
+
+            except KscCancelledError:
+                raise
+            except Exception as e:
+                if is_session_expired(e):
+                    # _call_with_relogin reads the group again on a new session
+                    raise
+                # If one group fails (e.g. permissions), keep what we have and move on
+                logger.warning(f"Failed to list tasks of group {gid}: {e}")
+                if deadline.expired():
+                    deadline.mark_partial()
+
+        with seen_lock:
+            # Another group may have claimed some of them while this one was read
+            claimed = [task for t_id, task in group_tasks.items() if t_id not in seen]
+            seen.update(task.id for task in claimed)
+        return claimed
+
+    @tracing.traced("KscService.list_tasks_page")
+    async def list_tasks_page(
+        self,
+        group_id: int = -1,
+        scan_all_groups: bool = False,
+        on_progress: Optional[TaskProgressCallback] = None,
+    ) -> TaskList:
+        """
+        Lists tasks of one group, or of every group when `scan_all_groups` is set.
+
+        Groups are enumerated concurrently, at most settings.KSC_MAX_CONCURRENCY at a
+        time. `on_progress(done, total, tasks)` is awaited as each group finishes,
+        with the tasks that group contributed. Concurrent identical calls share one
+        scan, and each caller still receives every progress event. The result is
+        partial when the scan ran out of time, whichever caller's deadline that was.
+        """
+        key = ("list_tasks", "all" if scan_all_groups else group_id)
+        span = tracing.current_span()
+        span.set_attributes({"ksc.group_id": group_id, "ksc.scan_all_groups": scan_all_groups})
+        ttl = settings.KSC_CACHE_TTL_TASKS
+        if ttl > 0:
+            cached = self.cache.get(key)
+            span.set_attribute("ksc.cache_hit", cached is not None)
+            if cached is not None:
+                return cached
+
+        async def load(publish):
+            generation = self.cache.generation
+            tasks = await self._scan_tasks(group_id, scan_all_groups, publish)
+            page = TaskList(tasks=tasks, partial=deadline.is_partial())
+            if not page.partial:
+                tags = [("tasks",)] + [("task", t.id) for t in tasks]
+                self.cache.put(key, page, ttl, tags, generation=generation)
+            return page
+
+        if not settings.KSC_SINGLE_FLIGHT:
+            page = await load(on_progress)
+        else:
+            page = await self.flights.do_with_progress(key, load, on_progress)
+        span.set_attributes({"ksc.items": len(page.tasks), "ksc.partial": page.partial})
+        return page
+
+    async def list_tasks(
+        self,
+        group_id: int = -1,
+        scan_all_groups: bool = False,
+        on_progress: Optional[TaskProgressCallback] = None,
+    ) -> List[TaskInfo]:
+        page = await self.list_tasks_page(group_id, scan_all_groups, on_progress)
+        return page.tasks
+
+    async def _scan_tasks(
+        self,
+        group_id: int,
+        scan_all_groups: bool,
+        on_progress: Optional[TaskProgressCallback],
+    ) -> List[TaskInfo]:
+        from anyio import CapacityLimiter, create_task_group
 
-            except Exception:
-                # If one group fails (e.g. permissions), log/ignore and continue to next
-                continue
+        # Strategy:
+        # 1. If scan_all_groups is True, get all groups first, then fan out over them.
+        # 2. If scan_all_groups is False, just query the specific group_id (or Global if -1).
+        if scan_all_groups:
+            groups = await self.list_groups()
+            # Also include global tasks (group -1)
+            target_groups = [g.id for g in groups] + [-1]
+        else:
+            target_groups = [group_id]
 
-        return all_tasks
+        limiter = CapacityLimiter(settings.KSC_MAX_CONCURRENCY)
+        seen: Set[str] = set()
+        seen_lock = threading.Lock()
+        results: Dict[int, List[TaskInfo]] = {}
+
+        async def scan(index: int, gid: int):
+            async with limiter:
+                if deadline.expired():
+                    # Out of time: leave the remaining groups unscanned
+                    deadline.mark_partial()
+                    group_tasks = []
+                else:
+                    with tracing.span("scan_group", **{"ksc.group_id": gid}) as span:
+                        group_tasks = await self._run_sync(
+                            self._list_group_tasks_sync, gid, seen, seen_lock
+                        )
+                        span.set_attribute("ksc.items", len(group_tasks))
+            results[index] = group_tasks
+            if on_progress is not None:
+                await on_progress(len(results), len(target_groups), group_tasks)
 
-    async def list_tasks(self, group_id: int = -1, scan_all_groups: bool = False) -> List[TaskInfo]:
-        from anyio import to_thread
+        async with create_task_group() as tg:
+            for index, gid in enumerate(target_groups):
+                tg.start_soon(scan, index, gid)
 
-        return await to_thread.run_sync(self._list_tasks_sync, group_id, scan_all_groups)
+        # Keep the group order of the sequential implementation
+        return [task for index in range(len(target_groups)) for task in results[index]]
 
-    def _run_task_sync(self, task_id: str) -> TaskRunResult:
-        self._ensure_connected()
-        tasks_api = KlAkTasks(self.server)
+    async def warm_task_catalog(self):
+        """Fills the task catalog with one full task scan (run at startup if configured)."""
         try:
-            tasks_api.RunTask(strTask=task_id)
-            return TaskRunResult(task_id=task_id, status="Started")
+            tasks = await self.list_tasks(scan_all_groups=True)
+            logger.info(f"Task catalog warmed with {len(tasks)} tasks")
         except Exception as e:
-            raise KscApiError(f"Failed to run task: {e}")
+            logger.warning(f"Task catalog warm-up failed: {e}")
 
-    async def run_task(self, task_id: str) -> TaskRunResult:
-        from anyio import to_thread
+    def _run_task_sync(self, task_id: str) -> TaskRunResult:
+        # Running a task changes its state/statistics; drop what we know about it
+        self.task_catalog.invalidate(task_id)
+        with self._pool.session() as member:
+            tasks_api = KlAkTasks(member.server)
+            try:
+                tasks_api.RunTask(strTask=task_id)
+                return TaskRunResult(task_id=task_id, status="Started")
+            except Exception as e:
+                raise KscApiError(f"Failed to run task: {e}")
 
-        return await to_thread.run_sync(self._run_task_sync, task_id)
+    @tracing.traced("KscService.run_task")
+    async def run_task(self, task_id: str) -> TaskRunResult:
+        tracing.current_span().set_attribute("ksc.task_id", task_id)
+        # A state poll already in flight predates the run; don't hand it to new callers
+        self.flights.forget(("get_task_state", task_id))
+        self.cache.invalidate(("task", task_id))
+        return await self._run_sync(self._run_task_sync, task_id)
 
     def _get_task_state_sync(self, task_id: str) -> TaskState:
-        self._ensure_connected()
-        tasks_api = KlAkTasks(self.server)
-        try:
-            res = tasks_api.GetTaskStatistics(strTask=task_id)
-            data = res.RetVal()
-            # data typically has percentages, state code, etc.
-            # mapping needs to be robust, here we use defaults
-            return TaskState(
-                task_id=task_id,
-                percentage=self._safe_get(data, "nCompletion", 0),
-                state_code=self._safe_get(data, "nState", 0),
-                state_desc="Running"
-                if self._safe_get(data, "nState", 0)
-                else "Unknown",  # simplified
-            )
-        except Exception as e:
-            raise KscApiError(f"Failed to get task state: {e}")
+        with self._pool.session() as member:
+            tasks_api = KlAkTasks(member.server)
+            try:
+                res = tasks_api.GetTaskStatistics(strTask=task_id)
+                data = res.RetVal()
+                # data typically has percentages, state code, etc.
+                # mapping needs to be robust, here we use defaults
+                return TaskState(
+                    task_id=task_id,
+                    percentage=self._safe_get(data, "nCompletion", 0),
+                    state_code=self._safe_get(data, "nState", 0),
+                    state_desc="Running"
+                    if self._safe_get(data, "nState", 0)
+                    else "Unknown",  # simplified
+                )
+            except Exception as e:
+                raise KscApiError(f"Failed to get task state: {e}")
 
+    @tracing.traced("KscService.get_task_state")
     async def get_task_state(self, task_id: str) -> TaskState:
-        from anyio import to_thread
-
-        return await to_thread.run_sync(self._get_task_state_sync, task_id)
+        tracing.current_span().set_attribute("ksc.task_id", task_id)
+        return await self._read(
+            ("get_task_state", task_id),
+            lambda: self._run_sync(self._get_task_state_sync, task_id),
+        )
 
 
 ksc_service = KscService()
+metrics.REGISTRY.add_collector("ksc", ksc_service.stats)
@@ -0,0 +1,133 @@
+import logging
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+import anyio
+
+logger = logging.getLogger(__name__)
+
+# publish(*args) forwards one progress event to every caller sharing the flight
+ProgressPublisher = Callable[..., Awaitable[None]]
+ProgressListener = Callable[..., Awaitable[None]]
+
+
+class _Flight:
+    """One in-flight call and everything waiting for it."""
+
+    def __init__(self):
+        self.done = anyio.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        # The leader was cancelled before producing a result; waiters start over
+        self.abandoned = False
+        self.events: List[Tuple] = []
+        self.listeners: List[ProgressListener] = []
+
+    async def publish(self, *args):
+        self.events.append(args)
+        for listener in list(self.listeners):
+            try:
+                await listener(*args)
+            except Exception as e:
+                # One caller's broken progress channel must not fail the shared call
+                logger.debug(f"Dropping progress listener after error: {e}")
+                self.listeners.remove(listener)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls into one.
+
+    The first caller for a key (the leader) runs the call; callers arriving with the
+    same key while it is in flight wait for it and get the same result or exception.
+    Keys are tuples whose first element is the method name, which is also what the
+    per-method counters are grouped by. Results are shared between callers and must
+    be treated as read-only.
+
+    Not thread-safe: all callers must run on the same event loop.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.calls = 0
+        self.executed = 0
+        self.coalesced = 0
+        self.coalesced_by_method: Counter = Counter()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight,
+            "coalesced_by_method": dict(self.coalesced_by_method),
+        }
+
+    async def do(self, key: Tuple, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Returns `await fn()`, sharing the call with concurrent callers of `key`."""
+        return await self._do(key, lambda publish: fn(), None)
+
+    async def do_with_progress(
+        self,
+        key: Tuple,
+        fn: Callable[[ProgressPublisher], Awaitable[Any]],
+        on_progress: Optional[ProgressListener] = None,
+    ) -> Any:
+        """
+        Like `do`, for calls that report progress: the leader runs `fn(publish)` and
+        every event it publishes reaches each caller's `on_progress`. Callers joining
+        late first get the events published so far.
+        """
+        return await self._do(key, fn, on_progress)
+
+    def forget(self, key: Tuple):
+        """Lets the next caller of `key` start a fresh call instead of joining a stale one."""
+        self._flights.pop(key, None)
+
+    async def _do(self, key, fn, on_progress):
+        self.calls += 1
+        while True:
+            flight = self._flights.get(key)
+            if flight is None:
+                return await self._lead(key, fn, on_progress)
+            if on_progress is not None:
+                for args in list(flight.events):
+                    await on_progress(*args)
+                flight.listeners.append(on_progress)
+            try:
+                await flight.done.wait()
+            finally:
+                # Also when this caller is cancelled while the flight goes on
+                if on_progress is not None and on_progress in flight.listeners:
+                    flight.listeners.remove(on_progress)
+            if flight.abandoned:
+                continue
+            self.coalesced += 1
+            self.coalesced_by_method[key[0]] += 1
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+    async def _lead(self, key, fn, on_progress):
+        flight = _Flight()
+        if on_progress is not None:
+            flight.listeners.append(on_progress)
+        self._flights[key] = flight
+        self.executed += 1
+        try:
+            flight.result = await fn(flight.publish)
+            return flight.result
+        except anyio.get_cancelled_exc_class():
+            flight.abandoned = True
+            raise
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            flight.done.set()
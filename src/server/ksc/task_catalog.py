@@ -0,0 +1,67 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True)
+class TaskCatalogEntry:
+    name: str
+    type: str
+    group_id: Optional[int]
+    cached_at: float
+
+
+class TaskCatalog:
+    """
+    Thread-safe cache of task id -> display name/type/group.
+
+    Tasks.GetNextTask only returns iterator data, and resolving the DisplayName used to
+    cost one Tasks.GetTask round trip per task. Entries are filled on first use (or by
+    warming the catalog at startup), expire after `ttl` seconds and are dropped
+    explicitly when a tool mutates the task.
+    """
+
+    def __init__(self, ttl: float = 600):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[str, TaskCatalogEntry] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def get(self, task_id: str) -> Optional[TaskCatalogEntry]:
+        with self._lock:
+            entry = self._entries.get(task_id)
+            if entry is not None and time.monotonic() - entry.cached_at < self.ttl:
+                self.hits += 1
+                return entry
+            if entry is not None:
+                del self._entries[task_id]
+            self.misses += 1
+            return None
+
+    def put(
+        self, task_id: str, name: str, type: str, group_id: Optional[int] = None
+    ) -> TaskCatalogEntry:
+        entry = TaskCatalogEntry(
+            name=name, type=type, group_id=group_id, cached_at=time.monotonic()
+        )
+        with self._lock:
+            self._entries[task_id] = entry
+        return entry
+
+    def invalidate(self, task_id: Optional[str] = None):
+        """Drops one task, or the whole catalog if no id is given."""
+        with self._lock:
+            if task_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(task_id, None)
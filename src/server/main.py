@@ -1,15 +1,59 @@
 import importlib
 import logging
 import pkgutil
+from contextlib import asynccontextmanager
 
+import anyio
 from mcp.server.fastmcp import FastMCP
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+
+from server import metrics, tracing
+from server.ksc.service import ksc_service
+from server.settings import settings
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("ksc-mcp")
 
-# Initialize FastMCP
-mcp = FastMCP("ksc-mcp")
+
+@asynccontextmanager
+async def lifespan():
+    """
+    Runs KSC background jobs for as long as the server is up, then releases what the
+    service holds on KSC (accessors, iterators, sessions).
+    """
+    async with anyio.create_task_group() as tg:
+        if ksc_service.inventory is not None:
+            tg.start_soon(ksc_service.run_inventory_sync)
+        if settings.KSC_TASK_CATALOG_WARMUP:
+            tg.start_soon(ksc_service.warm_task_catalog)
+        if settings.KSC_HEARTBEAT_INTERVAL > 0:
+            tg.start_soon(ksc_service.run_heartbeat)
+        try:
+            yield
+        finally:
+            tg.cancel_scope.cancel()
+    with anyio.CancelScope(shield=True):
+        await anyio.to_thread.run_sync(ksc_service.close, settings.MCP_SHUTDOWN_TIMEOUT)
+
+
+# Initialize FastMCP. The lifespan above belongs to the process, not to FastMCP's own
+# lifespan hook: over HTTP that one runs once per MCP session (per request if stateless)
+mcp = FastMCP(
+    "ksc-mcp",
+    host=settings.MCP_HOST,
+    port=settings.MCP_PORT,
+    # Workers don't share session state, so a session can't be pinned to one of them
+    stateless_http=settings.MCP_WORKERS > 1,
+)
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request: Request) -> Response:
+    """Prometheus scrape endpoint, served when the server runs over HTTP."""
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
 
 
 def load_tools():
@@ -33,11 +77,54 @@ def load_tools():
             logger.error(f"Failed to load tools from {name}: {e}")
 
 
+async def run_stdio():
+    async with lifespan():
+        await mcp.run_stdio_async()
+
+
+def create_app() -> Starlette:
+    """
+    ASGI app for the streamable HTTP transport, created by uvicorn in every worker
+    process. Each worker has its own KscService and session pool.
+    """
+    tracing.configure(settings.KSC_TRACE_EXPORTER, settings.KSC_TRACE_FILE)
+    load_tools()
+    app = mcp.streamable_http_app()
+    sessions = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def app_lifespan(app: Starlette):
+        # On shutdown the MCP sessions stop first, cancelling their tool calls, then
+        # the service waits for those calls to clean up before closing
+        async with lifespan(), sessions(app):
+            yield
+
+    app.router.lifespan_context = app_lifespan
+    return app
+
+
 def main():
     """Server entry point."""
-    logger.info("Starting KSC MCP Server...")
-    load_tools()
-    mcp.run()
+    logger.info(f"Starting KSC MCP Server ({settings.MCP_TRANSPORT})...")
+    if settings.MCP_TRANSPORT == "stdio":
+        tracing.configure(settings.KSC_TRACE_EXPORTER, settings.KSC_TRACE_FILE)
+        load_tools()
+        anyio.run(run_stdio)
+    elif settings.MCP_TRANSPORT == "streamable-http":
+        import uvicorn
+
+        uvicorn.run(
+            "server.main:create_app",
+            factory=True,
+            host=settings.MCP_HOST,
+            port=settings.MCP_PORT,
+            workers=settings.MCP_WORKERS,
+            timeout_graceful_shutdown=int(settings.MCP_SHUTDOWN_TIMEOUT),
+        )
+    else:
+        raise ValueError(
+            f"Unknown MCP_TRANSPORT {settings.MCP_TRANSPORT!r}, use 'stdio' or 'streamable-http'"
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,295 @@
+"""
+Prometheus metrics for the KSC call path and the MCP tools.
+
+A small dependency-free registry rendering the Prometheus text exposition format.
+KlAkOAPI requests are recorded by the transport adapter every pooled connection uses
+(server.ksc.limiter.LimitedAdapter), tool calls by the `observe_tool` decorator, and the
+service's component stats (limiter, pool, cache, ...) are collected at scrape time.
+"""
+
+import functools
+import json
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from server import tracing
+
+# Seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+# Bytes
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Marker of a KLOAPI error body ({"PxgError": {"code": ..., ...}}), which KSC sends with 200
+_PXG_ERROR = b'"PxgError"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels)
+    return "{" + pairs + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, value: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(zip(self.labelnames, key))} {_format_value(value)}"
+            for key, value in values
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> (per-bucket counts, +Inf count is the total, sum)
+        self._series: Dict[Tuple[str, ...], List] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0, 0.0]
+            counts = series[0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            series[1] += 1
+            series[2] += value
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            return series[1] if series is not None else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((key, (list(s[0]), s[1], s[2])) for key, s in self._series.items())
+        lines = self.header()
+        for key, (counts, total, total_sum) in series:
+            labels = list(zip(self.labelnames, key))
+            for bound, count in zip(self.buckets, counts):
+                le = _format_labels(labels + [("le", _format_value(bound))])
+                lines.append(f"{self.name}_bucket{le} {count}")
+            lines.append(f"{self.name}_bucket{_format_labels(labels + [('le', '+Inf')])} {total}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total_sum)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {total}")
+        return lines
+
+
+class Registry:
+    """Holds the metrics and renders them, plus the gauges of registered stats collectors."""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Tuple[str, Callable[[], Dict[str, Dict[str, Any]]]]] = []
+
+    def counter(self, name: str, help: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, help, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, help, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, prefix: str, collect: Callable[[], Dict[str, Dict[str, Any]]]):
+        """
+        Exports `collect()` as gauges at every render. It returns {component: stats}
+        dicts such as {"cache": {"hits": 3}} -> `<prefix>_cache_hits 3`; a nested
+        "<name>_by_<label>" dict becomes `<prefix>_<component>_<name>{<label>="..."}`.
+        """
+        self._collectors.append((prefix, collect))
+
+    def _render_collector(self, prefix: str, collect) -> List[str]:
+        lines = []
+        for component, stats in collect().items():
+            for key, value in stats.items():
+                if isinstance(value, dict):
+                    name, _, label = key.rpartition("_by_")
+                    metric = f"{prefix}_{component}_{name or key}"
+                    lines.append(f"# TYPE {metric} gauge")
+                    for item, item_value in sorted(value.items()):
+                        labels = _format_labels([(label or "key", item)])
+                        lines.append(f"{metric}{labels} {_format_value(item_value)}")
+                elif isinstance(value, (int, float)):
+                    metric = f"{prefix}_{component}_{key}"
+                    lines.append(f"# TYPE {metric} gauge")
+                    lines.append(f"{metric} {_format_value(value)}")
+        return lines
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for prefix, collect in self._collectors:
+            lines.extend(self._render_collector(prefix, collect))
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+KSC_REQUEST_SECONDS = REGISTRY.histogram(
+    "ksc_request_duration_seconds",
+    "Latency of KlAkOAPI requests, response body included",
+    ("method",),
+)
+KSC_REQUEST_BYTES = REGISTRY.histogram(
+    "ksc_request_size_bytes", "Size of KlAkOAPI request bodies", ("method",), SIZE_BUCKETS
+)
+KSC_RESPONSE_BYTES = REGISTRY.histogram(
+    "ksc_response_size_bytes", "Size of KlAkOAPI response bodies", ("method",), SIZE_BUCKETS
+)
+KSC_REQUEST_ERRORS = REGISTRY.counter(
+    "ksc_request_errors_total",
+    "Failed KlAkOAPI requests by KlAkError code, http_<status> or transport exception",
+    ("method", "code"),
+)
+TOOL_SECONDS = REGISTRY.histogram(
+    "mcp_tool_duration_seconds", "Latency of MCP tool calls", ("tool",)
+)
+TOOL_ERRORS = REGISTRY.counter(
+    "mcp_tool_errors_total", "MCP tool calls that raised, by exception type", ("tool", "error")
+)
+
+
+def ksc_method(url: str) -> str:
+    """KLOAPI method of a request URL: .../api/v1.0/HostGroup.FindHosts -> HostGroup.FindHosts."""
+    return url.split("?", 1)[0].rsplit("/", 1)[-1]
+
+
+def kloapi_error_code(content: bytes) -> Optional[str]:
+    """KlAkError code of a KLOAPI error body, None for a successful response."""
+    if _PXG_ERROR not in content[:64]:
+        return None
+    try:
+        return str(json.loads(content)["PxgError"].get("code"))
+    except (ValueError, KeyError, AttributeError, TypeError):
+        return "unknown"
+
+
+def record_ksc_request(
+    request,
+    response=None,
+    latency: float = 0.0,
+    error: Optional[BaseException] = None,
+    stream: bool = False,
+):
+    """
+    Records one KlAkOAPI HTTP request (`response` is None if it raised). Unless
+    `stream` is set the response body must have been read already.
+    """
+    method = ksc_method(request.url)
+    KSC_REQUEST_SECONDS.observe(latency, method=method)
+    body = request.body or b""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    KSC_REQUEST_BYTES.observe(len(body), method=method)
+    if error is not None:
+        KSC_REQUEST_ERRORS.inc(method=method, code=type(error).__name__)
+        return
+    if stream:
+        # Streamed download (AdmServer.Get): the body is read later by the caller
+        size = int(response.headers.get("Content-Length") or 0)
+        KSC_RESPONSE_BYTES.observe(size, method=method)
+        return
+    content = response.content or b""
+    KSC_RESPONSE_BYTES.observe(len(content), method=method)
+    if response.status_code != 200:
+        KSC_REQUEST_ERRORS.inc(method=method, code=f"http_{response.status_code}")
+        return
+    code = kloapi_error_code(content)
+    if code is not None:
+        KSC_REQUEST_ERRORS.inc(method=method, code=code)
+
+
+def observe_tool(fn: Callable) -> Callable:
+    """
+    Records the latency and failures of an async MCP tool function, and runs it in a
+    trace span (the root of the service and KlAkOAPI spans it causes).
+    """
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        started = time.monotonic()
+        try:
+            with tracing.span(f"tool {name}", **{"mcp.tool": name}):
+                return await fn(*args, **kwargs)
+        except Exception as e:
+            TOOL_ERRORS.inc(tool=name, error=type(e).__name__)
+            raise
+        finally:
+            TOOL_SECONDS.observe(time.monotonic() - started, tool=name)
+
+    return wrapper
+
+
+def render() -> str:
+    """All metrics in the Prometheus text exposition format."""
+    return REGISTRY.render()
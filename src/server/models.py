@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Iterable, List, Literal, Optional, Type
 
 from pydantic import BaseModel, Field
 
@@ -22,6 +22,26 @@ class HostInfo(BaseModel):
     )
 
 
+# Fields a listing can be projected to; `id` is always returned
+HostField = Literal[
+    "id", "name", "display_name", "group_id", "group_name", "status", "ip_address", "products"
+]
+GroupField = Literal["id", "name", "full_name", "parent_id", "host_count"]
+TaskField = Literal["id", "name", "type", "state"]
+
+
+def projection(fields: Optional[Iterable[str]], model: Type[BaseModel]) -> Optional[List[str]]:
+    """
+    Normalizes a `fields` projection of `model`: None when every field is wanted, else
+    the wanted fields (id included) in model order.
+    """
+    if not fields:
+        return None
+    wanted = set(fields) | {"id"}
+    names = [name for name in model.model_fields if name in wanted]
+    return None if len(names) == len(model.model_fields) else names
+
+
 class HostDetail(BaseModel):
     """
     Detailed information about a specific host.
@@ -47,6 +67,43 @@ class HostQuery(BaseModel):
     status: Optional[str] = Field(
         default=None, description="Filter by status (e.g. 'Critical', 'Warning', 'OK')."
     )
+    limit: int = Field(default=50, ge=1, le=5000, description="Maximum number of hosts to return.")
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor from a previous response's next_cursor to fetch the next page. "
+        "When set, group_name, status and fields are ignored.",
+    )
+    fields: Optional[List[HostField]] = Field(
+        default=None,
+        description="Host fields to return (id is always included), e.g. ['id', 'name']. "
+        "KSC then only sends the attributes these need. Defaults to all fields.",
+    )
+
+
+class HostPage(BaseModel):
+    """
+    One page of a host search.
+    """
+
+    hosts: List[HostInfo] = Field(default_factory=list, description="Hosts on this page.")
+    total: int = Field(default=0, description="Total number of hosts matching the query.")
+    next_cursor: Optional[str] = Field(
+        default=None, description="Cursor for the next page, or None if this is the last page."
+    )
+    partial: bool = Field(
+        default=False,
+        description="True if the time budget ran out before the page was filled; "
+        "next_cursor continues where it stopped.",
+    )
+    staleness_seconds: Optional[float] = Field(
+        default=None,
+        description="Age in seconds of the local inventory this page was served from. "
+        "None when the page was read live from KSC.",
+    )
+    fields: Optional[List[HostField]] = Field(
+        default=None,
+        description="Host fields returned, when the search was projected; None for all.",
+    )
 
 
 class GroupInfo(BaseModel):
@@ -70,6 +127,11 @@ class GroupQuery(BaseModel):
         default=None, description="Filter by group name (supports wildcards)."
     )
     parent_id: Optional[int] = Field(default=None, description="Filter by parent group ID.")
+    fields: Optional[List[GroupField]] = Field(
+        default=None,
+        description="Group fields to return (id is always included), e.g. ['id', 'name']. "
+        "Defaults to all fields.",
+    )
 
 
 class MoveHostParams(BaseModel):
@@ -94,6 +156,19 @@ class TaskInfo(BaseModel):
     )
 
 
+class TaskList(BaseModel):
+    """
+    Tasks found by a task listing.
+    """
+
+    tasks: List[TaskInfo] = Field(default_factory=list, description="Tasks found.")
+    partial: bool = Field(
+        default=False,
+        description="True if the time budget ran out before every group was scanned; "
+        "tasks holds the ones found so far.",
+    )
+
+
 class TaskRunResult(BaseModel):
     """
     Result of a task execution request.
@@ -15,6 +15,97 @@ class Settings(BaseSettings):
     # Optional: Path to SSL certificate for verification
     KSC_CERT_PATH: Optional[str] = None
 
+    # MCP transport: "stdio" (one client per process) or "streamable-http" (shared server)
+    MCP_TRANSPORT: str = "stdio"
+    MCP_HOST: str = "127.0.0.1"
+    MCP_PORT: int = 8000
+    # uvicorn worker processes for streamable-http; each has its own KSC session pool.
+    # With more than one worker, MCP sessions are stateless (any worker serves any request)
+    MCP_WORKERS: int = 1
+    # Seconds to let running tool calls finish and release their KSC resources on shutdown
+    MCP_SHUTDOWN_TIMEOUT: float = 10
+    # Text block next to the structured content of listing tools: "none", "compact"
+    # (tab-separated rows, for clients that ignore structured content) or "json"
+    MCP_TOOL_TEXT: str = "compact"
+
+    # Session pool: number of authenticated KSC connections used for concurrent calls
+    KSC_POOL_SIZE: int = 10
+    # Recycle pooled connections older than this many seconds
+    KSC_POOL_MAX_AGE: int = 3600
+    # Ping idle connections before reuse if unused for this many seconds
+    KSC_POOL_HEALTH_CHECK_INTERVAL: int = 60
+    # Seconds to wait for a free connection before failing the call
+    KSC_POOL_TIMEOUT: float = 30
+
+    # Ping idle pooled connections this often (seconds) so KSC keeps their sessions; 0 = off
+    KSC_HEARTBEAT_INTERVAL: int = 60
+    # Log new connections in with a session token (Session.CreateToken) instead of the password
+    KSC_TOKEN_AUTH: bool = True
+
+    # Maximum number of KSC calls one operation may run in parallel (e.g. list_tasks fan-out)
+    KSC_MAX_CONCURRENCY: int = 8
+
+    # Timeouts (seconds) for connecting to KSC and for reading each KlAkOAPI response
+    KSC_CONNECT_TIMEOUT: float = 10
+    KSC_READ_TIMEOUT: float = 120
+    # Time budget of one MCP tool call; listings stop early and return partial results
+    # once it is spent. 0 = no budget
+    KSC_TOOL_TIMEOUT: float = 60
+
+    # Adaptive concurrency limit for KSC calls (starts at, and never exceeds, KSC_POOL_SIZE):
+    # lowest limit it may back off to
+    KSC_LIMITER_MIN_LIMIT: int = 1
+    # Calls slower than this many seconds count as an overload signal, like HTTP 429/503
+    KSC_LIMITER_LATENCY_TARGET: float = 5.0
+    # Factor the limit is multiplied by on overload
+    KSC_LIMITER_BACKOFF: float = 0.5
+    # Seconds a call may wait for a slot before it is rejected
+    KSC_LIMITER_MAX_QUEUE_WAIT: float = 30
+
+    # Tracing of tool -> service -> KlAkOAPI calls (see server.tracing): "none", "console"
+    # (JSON lines on stderr), "file" (JSON lines appended to KSC_TRACE_FILE) or "otel"
+    # (OpenTelemetry API, exported by the SDK configured in the process)
+    KSC_TRACE_EXPORTER: str = "none"
+    KSC_TRACE_FILE: str = "ksc-traces.jsonl"
+
+    # Paging: rows requested per ChunkAccessor.GetItemsChunk call at first. Long walks
+    # (inventory sync, large pages) grow it up to KSC_CHUNK_SIZE_MAX while one response
+    # stays under KSC_CHUNK_TARGET_SECONDS and KSC_CHUNK_MAX_BYTES
+    KSC_CHUNK_SIZE: int = 500
+    KSC_CHUNK_SIZE_MAX: int = 5000
+    KSC_CHUNK_TARGET_SECONDS: float = 1.0
+    KSC_CHUNK_MAX_BYTES: int = 8 * 1024 * 1024
+    # Request the next chunk while the current one is being processed
+    KSC_CHUNK_READ_AHEAD: bool = True
+
+    # Lifetime (seconds) of server-side result sets created by FindHosts/FindGroups
+    KSC_ACCESSOR_LIFETIME: int = 600
+    # Upper bound on FindHosts result sets kept open for reuse by identical queries
+    KSC_MAX_OPEN_ACCESSORS: int = 64
+
+    # Share one in-flight KSC request between concurrent identical read calls
+    KSC_SINGLE_FLIGHT: bool = True
+
+    # Result cache for read tools: memory budget in bytes and per-tool TTLs in seconds
+    # (0 disables caching for that tool)
+    KSC_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    KSC_CACHE_TTL_HOSTS: int = 30
+    KSC_CACHE_TTL_HOST_DETAILS: int = 60
+    KSC_CACHE_TTL_GROUPS: int = 300
+    KSC_CACHE_TTL_TASKS: int = 120
+
+    # Task catalog: seconds a cached task name/type stays valid
+    KSC_TASK_CATALOG_TTL: int = 600
+    # Fill the task catalog with a full task scan when the server starts
+    KSC_TASK_CATALOG_WARMUP: bool = False
+
+    # Local host inventory (SQLite). Disabled unless a database path is set.
+    KSC_INVENTORY_PATH: Optional[str] = None
+    # Seconds between incremental inventory refreshes
+    KSC_INVENTORY_REFRESH_INTERVAL: int = 60
+    # Seconds between full inventory syncs (these also drop hosts removed from KSC)
+    KSC_INVENTORY_FULL_SYNC_INTERVAL: int = 3600
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
 
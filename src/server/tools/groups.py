@@ -1,23 +1,33 @@
+from typing import Annotated, List
+
 from mcp.server.fastmcp import FastMCP
+from mcp.types import CallToolResult
 
+from server.ksc.deadline import deadline
 from server.ksc.service import ksc_service
-from server.models import GroupQuery
+from server.metrics import observe_tool
+from server.models import GroupInfo, GroupQuery, projection
+from server.settings import settings
+from server.tools.output import listing, tool_result
 
 # Defines tools for manipulating groups
 
 
 def register(mcp: FastMCP):
     @mcp.tool()
-    async def list_groups(query: GroupQuery) -> str:
+    @observe_tool
+    async def list_groups(
+        query: GroupQuery,
+    ) -> Annotated[CallToolResult, listing(List[GroupInfo])]:
         """
         List administration groups in KSC.
 
-        Returns a JSON string of group objects.
+        Returns a list of group objects.
         Use this to browse the group hierarchy or find specific groups by name.
+        Set query.fields (e.g. ["id", "name"]) to return only those group fields.
         """
-        import json
-
-        groups = await ksc_service.list_groups(
-            group_name=query.group_name, parent_id=query.parent_id
-        )
-        return json.dumps([g.model_dump() for g in groups], indent=2)
+        with deadline(settings.KSC_TOOL_TIMEOUT):
+            groups = await ksc_service.list_groups(
+                group_name=query.group_name, parent_id=query.parent_id, fields=query.fields
+            )
+        return tool_result(groups, projection(query.fields, GroupInfo))
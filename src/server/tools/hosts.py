@@ -1,53 +1,69 @@
 from typing import Annotated
 
 from mcp.server.fastmcp import FastMCP
+from mcp.types import CallToolResult
 from pydantic import Field
 
+from server.ksc.deadline import deadline
 from server.ksc.service import ksc_service
-from server.models import HostQuery, MoveHostParams
+from server.metrics import observe_tool
+from server.models import HostDetail, HostPage, HostQuery, MoveHostParams
+from server.settings import settings
+from server.tools.output import listing, tool_result
 
 # Defines tools for manipulating hosts and groups
 
 
 def register(mcp: FastMCP):
     @mcp.tool()
-    async def get_hosts(query: HostQuery) -> str:
+    @observe_tool
+    async def get_hosts(query: HostQuery) -> Annotated[CallToolResult, listing(HostPage)]:
         """
         Search for managed devices (hosts) in KSC.
 
-        Returns a JSON string of host objects.
+        Returns a page of host objects, the total match count and a next_cursor.
+        Pass next_cursor back as query.cursor to fetch the following page.
         Use this tool to find hosts by group name or status.
         Status Filter Options:
         - "Critical": List devices with critical health status (e.g. protection off, viruses found).
         - "Warning": List devices with warning status (e.g. databases outdated).
         - "OK": List devices with healthy status.
 
-        If no filters are provided, it returns all visible hosts (limited by default paging).
+        If no filters are provided, it pages through all visible hosts (query.limit per page).
+        Set query.fields (e.g. ["id", "name"]) to return only those host fields; KSC then
+        only sends the attributes they need. Following pages keep the first page's fields.
+        If KSC is too slow to fill the page in time, the hosts read so far are returned
+        with partial=true; next_cursor continues from there.
         """
-        import json
-
-        hosts = await ksc_service.list_hosts(group_name=query.group_name, status=query.status)
-        return json.dumps([h.model_dump() for h in hosts], indent=2)
+        with deadline(settings.KSC_TOOL_TIMEOUT):
+            page = await ksc_service.list_hosts_page(
+                group_name=query.group_name,
+                status=query.status,
+                limit=query.limit,
+                cursor=query.cursor,
+                fields=query.fields,
+            )
+        return tool_result(page, page.fields)
 
     @mcp.tool()
+    @observe_tool
     async def get_host_details(
         host_id: Annotated[
             str, Field(description="The unique identifier of the host (KSC ID preferred).")
         ],
-    ) -> str:
+    ) -> Annotated[CallToolResult, HostDetail]:
         """
         Retrieve detailed information about a specific host.
 
-        Returns a JSON string of details.
         Args:
             host_id: The unique identifier of the host (KSC ID preferred).
         """
-        import json
-
-        details = await ksc_service.get_host_details(host_id)
-        return json.dumps(details.model_dump(), indent=2)
+        with deadline(settings.KSC_TOOL_TIMEOUT):
+            details = await ksc_service.get_host_details(host_id)
+        return tool_result(details)
 
     @mcp.tool()
+    @observe_tool
     async def move_host(params: MoveHostParams) -> bool:
         """
         Move a host to a different administration group.
@@ -55,6 +71,9 @@ def register(mcp: FastMCP):
         Args:
             params: Object containing host_id and target_group_id.
         """
-        return await ksc_service.move_host(host_id=params.host_id, group_id=params.target_group_id)
+        with deadline(settings.KSC_TOOL_TIMEOUT):
+            return await ksc_service.move_host(
+                host_id=params.host_id, group_id=params.target_group_id
+            )
 
     # Future: add list_groups here
@@ -0,0 +1,20 @@
+from mcp.server.fastmcp import FastMCP
+
+from server import metrics
+from server.metrics import observe_tool
+
+# Exposes the server's own metrics to MCP clients (stdio mode has no /metrics endpoint)
+
+
+def register(mcp: FastMCP):
+    @mcp.tool()
+    @observe_tool
+    async def ksc_metrics() -> str:
+        """
+        Report the server's performance metrics in the Prometheus text format.
+
+        Includes per-method KSC request latency histograms, request/response sizes,
+        KSC error counts by error code, MCP tool latencies, and the state of the session
+        pool, concurrency limiter, result cache and request coalescing.
+        """
+        return metrics.render()
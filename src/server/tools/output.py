@@ -0,0 +1,169 @@
+"""
+Tool results as typed structured content.
+
+Listing tools return their models as MCP structuredContent, which clients check against
+the output schema FastMCP derives from the model type. The text content block next to it
+is chosen by settings.MCP_TOOL_TEXT:
+
+- "none": no text block; the structured content is the whole response
+- "compact": a tab-separated rendering (one line per host, group or task) for clients
+  that only show text to the model
+- "json": the structured content as compact JSON, the spec's backwards-compatible form
+
+Listing output schemas (see `listing`) are plain objects that name their fields in the
+description: MCP clients validate structured content against the output schema with
+jsonschema on every call, which for a typed 500-host page costs more than the call itself.
+
+Listings can be projected to a subset of row fields (`fields`); the rows then only carry
+those fields, which `listing` allows as it checks rows only as objects.
+"""
+
+import functools
+import typing
+from typing import Any, Dict, List, Optional, Sequence, Type, Union
+
+import pydantic_core
+from mcp.types import CallToolResult, TextContent
+from pydantic import BaseModel, ConfigDict, create_model
+
+from server.settings import settings
+
+TEXT_FORMATS = ("none", "compact", "json")
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, dict)):
+        text = pydantic_core.to_json(value).decode() if value else ""
+    else:
+        text = str(value)
+    return text.replace("\t", " ").replace("\n", " ")
+
+
+def _cells(values: List[Any]) -> List[str]:
+    # Column at a time: a column of plain strings is used as is
+    if all(type(v) is str for v in values) and not any("\t" in v or "\n" in v for v in values):
+        return values
+    return [_cell(v) for v in values]
+
+
+def _is_table(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(v, dict) for v in value)
+
+
+def render_compact(data: Dict[str, Any]) -> str:
+    """
+    Renders dumped tool output: scalar fields as "name: value" lines, lists of objects
+    as a tab-separated table (header line first) without the columns empty in every row.
+    """
+    lines = []
+    tables = []
+    for key, value in data.items():
+        if _is_table(value):
+            tables.append((key, value))
+        elif isinstance(value, list) and not value:
+            lines.append(f"{key}: none")
+        elif value is not None and key != "result":
+            lines.append(f"{key}: {_cell(value)}")
+    for key, rows in tables:
+        if lines:
+            lines.append(f"{key}:")
+        columns = []
+        cells = []
+        for column in rows[0]:
+            values = [row.get(column) for row in rows]
+            if any(v not in (None, "", [], {}) for v in values):
+                columns.append(column)
+                cells.append(_cells(values))
+        lines.append("\t".join(columns))
+        lines.extend(map("\t".join, zip(*cells)))
+    return "\n".join(lines)
+
+
+def _row_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    # The row model of a List[...] of rows (models with an id), else None
+    if typing.get_origin(annotation) is not list:
+        return None
+    (item,) = typing.get_args(annotation)
+    if isinstance(item, type) and issubclass(item, BaseModel) and "id" in item.model_fields:
+        return item
+    return None
+
+
+def _describe(doc: Optional[str], definitions: Dict[str, Any]) -> str:
+    fields = []
+    for name, (annotation, _) in definitions.items():
+        row = _row_model(annotation)
+        if row is not None:
+            name = f"{name} (list of {row.__name__}: {', '.join(row.model_fields)})"
+        fields.append(name)
+    return f"{doc.strip() + ' ' if doc else ''}Fields: {', '.join(fields)}."
+
+
+@functools.lru_cache(maxsize=None)
+def listing(annotation: Any) -> Type[BaseModel]:
+    """
+    Output model of a listing (a model with lists of rows, or a list of rows). FastMCP
+    checks results against it with rows taken as plain dicts; the schema it advertises is
+    just an object whose fields are named in the description.
+    """
+    row = _row_model(annotation)
+    if row is not None:
+        name, doc, definitions = f"{row.__name__}List", None, {"result": (annotation, ...)}
+    else:
+        name, doc = annotation.__name__, annotation.__doc__
+        definitions = {
+            field: (info.annotation, info) for field, info in annotation.model_fields.items()
+        }
+    description = _describe(doc, definitions)
+
+    def loose_schema(schema: Dict[str, Any]):
+        schema.pop("properties", None)
+        schema.pop("required", None)
+        schema["description"] = description
+
+    for field, (field_annotation, info) in definitions.items():
+        if _row_model(field_annotation) is not None:
+            # Rows are only checked as objects; projected rows lack fields
+            definitions[field] = (List[Dict[str, Any]], info)
+    config = ConfigDict(json_schema_extra=loose_schema)
+    return create_model(name, __config__=config, **definitions)
+
+
+def _dump(value: BaseModel, fields: Optional[List[str]]) -> Dict[str, Any]:
+    if fields is None:
+        return value.model_dump(mode="json")
+    if "id" in type(value).model_fields:
+        return value.model_dump(mode="json", include=set(fields))
+    include = {
+        name: {"__all__": set(fields)} if _row_model(info.annotation) else True
+        for name, info in type(value).model_fields.items()
+    }
+    return value.model_dump(mode="json", include=include)
+
+
+def tool_result(
+    value: Union[BaseModel, Sequence[BaseModel]], fields: Optional[List[str]] = None
+) -> CallToolResult:
+    """
+    CallToolResult for a model (structured content is its fields) or a list of models
+    (wrapped as {"result": [...]}, the way FastMCP wraps list return types). With
+    `fields`, rows are trimmed to those fields.
+    """
+    if isinstance(value, BaseModel):
+        data = _dump(value, fields)
+    else:
+        data = {"result": [_dump(item, fields) for item in value]}
+
+    text_format = settings.MCP_TOOL_TEXT
+    content: List[TextContent] = []
+    if text_format == "compact":
+        content.append(TextContent(type="text", text=render_compact(data)))
+    elif text_format == "json":
+        content.append(TextContent(type="text", text=pydantic_core.to_json(data).decode()))
+    elif text_format != "none":
+        raise ValueError(f"Unknown MCP_TOOL_TEXT {text_format!r}, expected one of {TEXT_FORMATS}")
+    return CallToolResult(content=content, structuredContent=data)
@@ -1,14 +1,21 @@
-from typing import Annotated
+import json
+from typing import Annotated, List, Optional
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.types import CallToolResult
 from pydantic import Field
 
+from server.ksc.deadline import deadline
 from server.ksc.service import ksc_service
-from server.models import TaskRunResult, TaskState
+from server.metrics import observe_tool
+from server.models import TaskField, TaskInfo, TaskList, TaskRunResult, TaskState, projection
+from server.settings import settings
+from server.tools.output import listing, tool_result
 
 
 def register(mcp: FastMCP):
     @mcp.tool()
+    @observe_tool
     async def list_tasks(
         group_id: int = Field(
             default=-1, description="Optional group ID to filter tasks. Defaults to -1 (Global)."
@@ -17,24 +24,43 @@ def register(mcp: FastMCP):
             default=False,
             description="If true, scans ALL groups for tasks. Ignores group_id if set.",
         ),
-    ) -> str:
+        fields: Optional[List[TaskField]] = Field(
+            default=None,
+            description="Task fields to return (id is always included), e.g. ['id', 'name']. "
+            "Defaults to all fields.",
+        ),
+        ctx: Context = None,
+    ) -> Annotated[CallToolResult, listing(TaskList)]:
         """
         Enumerate all available tasks on the KSC server.
 
-        Returns a JSON string of task objects containing IDs and names.
+        Returns task objects containing IDs and names.
         useful for finding a task ID before running it.
         Args:
             group_id: Optional. If set to -1 (default), lists global tasks.
                       If set to a specific group ID, lists tasks for that group.
             scan_all_groups: Optional. If True, will iterate through ALL groups to find tasks.
-                             Use with caution on large servers.
+                             Groups are scanned in parallel; each finished group is reported
+                             as a progress notification carrying that group's tasks.
+            fields: Optional. Task fields to return, e.g. ["id", "name"].
+
+        If the scan runs out of time, returns the tasks found so far with partial=true.
         """
-        import json
 
-        tasks = await ksc_service.list_tasks(group_id=group_id, scan_all_groups=scan_all_groups)
-        return json.dumps([t.model_dump() for t in tasks], indent=2)
+        async def report_progress(done: int, total: int, group_tasks):
+            if ctx is not None:
+                await ctx.report_progress(
+                    done, total, message=json.dumps([t.model_dump() for t in group_tasks])
+                )
+
+        with deadline(settings.KSC_TOOL_TIMEOUT):
+            page = await ksc_service.list_tasks_page(
+                group_id=group_id, scan_all_groups=scan_all_groups, on_progress=report_progress
+            )
+        return tool_result(page, projection(fields, TaskInfo))
 
     @mcp.tool()
+    @observe_tool
     async def run_task(
         task_id: Annotated[str, Field(description="The unique identifier of the task to run.")],
     ) -> TaskRunResult:
@@ -44,9 +70,11 @@ def register(mcp: FastMCP):
         Args:
             task_id: The unique identifier of the task to run.
         """
-        return await ksc_service.run_task(task_id)
+        with deadline(settings.KSC_TOOL_TIMEOUT):
+            return await ksc_service.run_task(task_id)
 
     @mcp.tool()
+    @observe_tool
     async def get_task_state(
         task_id: Annotated[str, Field(description="The unique identifier of the task.")],
     ) -> TaskState:
@@ -55,4 +83,5 @@ def register(mcp: FastMCP):
 
         Use this to poll for completion or check progress.
         """
-        return await ksc_service.get_task_state(task_id)
+        with deadline(settings.KSC_TOOL_TIMEOUT):
+            return await ksc_service.get_task_state(task_id)
@@ -0,0 +1,233 @@
+"""
+Span-based tracing of MCP tool -> KscService -> KlAkOAPI request call chains.
+
+Off until `configure` picks an exporter:
+
+- "console": one JSON object per finished span on stderr (stdout carries stdio MCP)
+- "file": the same JSON lines appended to a file
+- "otel": spans are created through the OpenTelemetry API (opentelemetry-api), so an
+  SDK TracerProvider configured in the process receives them with its own exporters
+
+The JSON lines follow the layout of the OpenTelemetry SDK's ConsoleSpanExporter
+(name, context.trace_id/span_id, parent_id, start_time/end_time, attributes, status).
+The current span lives in a context variable, which anyio copies into worker threads
+and child tasks, so KlAkOAPI requests made in a worker thread nest under the service
+call that started them.
+"""
+
+import functools
+import json
+import logging
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+EXPORTERS = ("none", "console", "file", "otel")
+
+
+class _NoopSpan:
+    """Returned while tracing is off; every call does nothing."""
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        pass
+
+    def is_recording(self) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+    )
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else random.getrandbits(128)
+        self.span_id = random.getrandbits(64)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]):
+        self.attributes.update(attributes)
+
+    def is_recording(self) -> bool:
+        return self.end_ns is None
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+    def to_dict(self) -> Dict[str, Any]:
+        def timestamp(ns: int) -> str:
+            return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
+        return {
+            "name": self.name,
+            "context": {"trace_id": f"0x{self.trace_id:032x}", "span_id": f"0x{self.span_id:016x}"},
+            "parent_id": f"0x{self.parent_id:016x}" if self.parent_id is not None else None,
+            "start_time": timestamp(self.start_ns),
+            "end_time": timestamp(self.end_ns or time.time_ns()),
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "status": (
+                {"status_code": "ERROR", "description": self.error}
+                if self.error is not None
+                else {"status_code": "OK"}
+            ),
+        }
+
+
+class JsonLinesExporter:
+    """Writes every finished span as one JSON line to a text stream."""
+
+    def __init__(self, stream: TextIO, close_stream: bool = False):
+        self._stream = stream
+        self._close_stream = close_stream
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+    def close(self):
+        if self._close_stream:
+            self._stream.close()
+
+
+_current: ContextVar[Optional[Span]] = ContextVar("ksc_span", default=None)
+
+
+class _LocalTracer:
+    def __init__(self, exporter: JsonLinesExporter):
+        self.exporter = exporter
+
+    @contextmanager
+    def start_span(self, name: str, attributes: Dict[str, Any]) -> Iterator[Span]:
+        span = Span(name, _current.get(), attributes)
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current.reset(token)
+            span.end_ns = time.time_ns()
+            try:
+                self.exporter.export(span)
+            except Exception as e:
+                logger.debug(f"Dropping span {name}: {e}")
+
+    def current_span(self):
+        return _current.get() or NOOP_SPAN
+
+    def close(self):
+        self.exporter.close()
+
+
+class _OTelTracer:
+    def __init__(self):
+        from opentelemetry import trace
+
+        self._trace = trace
+        self._tracer = trace.get_tracer("ksc-mcp")
+
+    @contextmanager
+    def start_span(self, name: str, attributes: Dict[str, Any]):
+        # Records the exception and sets an error status itself
+        with self._tracer.start_as_current_span(name, attributes=attributes) as span:
+            yield span
+
+    def current_span(self):
+        return self._trace.get_current_span()
+
+    def close(self):
+        pass
+
+
+_tracer = None
+
+
+def configure(exporter: str = "none", path: Optional[str] = None):
+    """Selects the exporter (one of EXPORTERS); "file" appends to `path`."""
+    global _tracer
+    if exporter not in EXPORTERS:
+        raise ValueError(f"Unknown trace exporter {exporter!r}, expected one of {EXPORTERS}")
+    if _tracer is not None:
+        _tracer.close()
+    if exporter == "none":
+        _tracer = None
+    elif exporter == "console":
+        _tracer = _LocalTracer(JsonLinesExporter(sys.stderr))
+    elif exporter == "file":
+        if not path:
+            raise ValueError("The file trace exporter needs a path")
+        _tracer = _LocalTracer(JsonLinesExporter(open(path, "a", encoding="utf-8"), True))
+    else:
+        _tracer = _OTelTracer()
+    logger.info(f"Tracing: {exporter}")
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Any]:
+    """Runs the block as a child span of the current one; yields the span."""
+    tracer = _tracer
+    if tracer is None:
+        yield NOOP_SPAN
+        return
+    with tracer.start_span(name, attributes) as current:
+        yield current
+
+
+def current_span():
+    """The innermost open span (a no-op span while tracing is off)."""
+    tracer = _tracer
+    return NOOP_SPAN if tracer is None else tracer.current_span()
+
+
+def traced(name: str) -> Callable:
+    """Decorator running an async function in a span called `name`."""
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return await fn(*args, **kwargs)
+            with span(name):
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
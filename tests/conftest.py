@@ -13,6 +13,15 @@ def mock_env(monkeypatch):
     monkeypatch.setenv("KSC_PASSWORD", "pass")
 
 
+@pytest.fixture
+def fake_ksc():
+    """A local fake KSC Administration Server (see tests/fake_ksc.py) with 1000 hosts."""
+    from tests.fake_ksc import FakeKscConfig, FakeKscServer
+
+    with FakeKscServer(FakeKscConfig()) as server:
+        yield server
+
+
 def pytest_addoption(parser):
     parser.addoption(
         "--run-integration", action="store_true", default=False, help="run integration tests"
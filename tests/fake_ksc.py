@@ -0,0 +1,614 @@
+"""
+Local stand-in for the KSC Administration Server (KLOAPI over HTTP) for tests and benchmarks.
+
+Implements login plus the HostGroup, ChunkAccessor, Tasks, Session and
+AsyncActionStateChecker methods the MCP server uses, on top of a synthetic, deterministic
+fleet of any size (hosts are generated on demand, nothing is stored per host). Every call
+can be slowed down with injectable latency, so the whole stack from KlAkAdmServer.Create
+up can be exercised and load-tested offline.
+
+In tests, use the `fake_ksc` fixture (see conftest.py) or `FakeKscServer` directly:
+
+    with FakeKscServer(FakeKscConfig(hosts=50_000, latency=0.005)) as ksc:
+        server = KlAkAdmServer.Create(ksc.url, "user", "pass", verify=False)
+
+Standalone (e.g. to benchmark against a separate process):
+
+    PYTHONPATH=src python -m tests.fake_ksc --hosts 100000 --latency-ms 5 --port 13299
+"""
+
+import argparse
+import asyncio
+import base64
+import fnmatch
+import functools
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+SESSION_COOKIE = "kscfake_session"
+_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class FakeKscConfig:
+    hosts: int = 1000
+    groups: int = 20
+    tasks_per_group: int = 3
+    # Seconds added to every call (+ uniform random jitter), per-method overrides by name
+    latency: float = 0.0
+    jitter: float = 0.0
+    method_latency: Dict[str, float] = field(default_factory=dict)
+    username: str = "user"
+    password: str = "pass"
+    # Whether GetNextTask rows carry TASK_INFO_PARAMS.DisplayName (otherwise GetTask is needed)
+    task_names_in_iterator: bool = True
+    # CheckActionState polls before an async action reports completion
+    action_polls: int = 1
+    seed: int = 0
+
+
+def _long(value: int) -> dict:
+    return {"type": "long", "value": value}
+
+
+def _datetime(value: datetime) -> dict:
+    return {"type": "datetime", "value": value.strftime("%Y-%m-%dT%H:%M:%SZ")}
+
+
+def _params(value: dict) -> dict:
+    return {"type": "params", "value": value}
+
+
+class KlsError(Exception):
+    """Returned to the client as a PxgError body."""
+
+    def __init__(self, message: str, code: int = 1186):
+        self.message = message
+        self.code = code
+
+
+# (attribute op value) atoms of a KSC search filter, e.g. (KLHST_WKS_STATUS_ID=1)
+_ATOM = re.compile(r'\((\w+)\s*(>=|<=|<>|=|>|<)\s*(T?"[^"]*"|-?\d+)\)')
+
+
+def _compile_filter(wstr_filter: str) -> Optional[Callable[[Callable[[str], Any]], bool]]:
+    """
+    Compiles the subset of the KSC filter syntax the server uses: a single atom or
+    (&...)/(|...) over atoms. The predicate takes an attribute getter; None is returned
+    for filters that match everything.
+    """
+    text = (wstr_filter or "").strip()
+    atoms = _ATOM.findall(text)
+    conditions = []
+    for name, op, raw in atoms:
+        if raw.startswith('T"'):
+            value: Any = datetime.strptime(raw[2:-1], "%Y-%m-%d %H:%M:%S").replace(
+                tzinfo=timezone.utc
+            )
+        elif raw.startswith('"'):
+            value = raw[1:-1]
+            if value == "*" and op == "=":
+                continue
+        else:
+            value = int(raw)
+        conditions.append((name, op, value))
+
+    if not conditions:
+        return None
+
+    def test(get: Callable[[str], Any], name: str, op: str, value: Any) -> bool:
+        actual = get(name)
+        if actual is None:
+            return False
+        if isinstance(value, str):
+            matched = fnmatch.fnmatchcase(str(actual).lower(), value.lower())
+            return matched if op == "=" else not matched
+        return {
+            "=": actual == value,
+            "<>": actual != value,
+            ">=": actual >= value,
+            "<=": actual <= value,
+            ">": actual > value,
+            "<": actual < value,
+        }[op]
+
+    combine = any if text.startswith("(|") else all
+    return lambda get: combine(test(get, *condition) for condition in conditions)
+
+
+class FakeFleet:
+    """Deterministic synthetic hosts, groups and tasks."""
+
+    def __init__(self, config: FakeKscConfig):
+        self.config = config
+        # host index -> group id / last update, for hosts changed through the API
+        self.moved: Dict[int, int] = {}
+        self.touched: Dict[int, datetime] = {}
+
+    # Hosts
+
+    def host_name(self, index: int) -> str:
+        return f"{index:08x}-0000-4000-8000-{self.config.seed:012x}"
+
+    def host_index(self, name: str) -> Optional[int]:
+        try:
+            index = int(name.split("-", 1)[0], 16)
+        except ValueError:
+            return None
+        if 0 <= index < self.config.hosts and self.host_name(index) == name:
+            return index
+        return None
+
+    def host_value(self, index: int, name: str) -> Any:
+        """Plain Python value of one host attribute (None if the host has no such field)."""
+        if name == "KLHST_WKS_HOSTNAME":
+            return self.host_name(index)
+        if name in ("KLHST_WKS_DN", "name"):
+            return f"WKS-{index:06d}"
+        if name == "id":
+            return index + 1
+        if name == "KLHST_WKS_GRP":
+            return self.moved.get(index, 1 + index % self.config.groups)
+        if name == "KLHST_WKS_STATUS":
+            return 0b11101
+        if name == "KLHST_WKS_STATUS_ID":
+            return 1 if index % 50 == 0 else 2 if index % 10 == 0 else 0
+        if name == "KLHST_WKS_IP":
+            # 10.x.y.z, little-endian as KSC stores it
+            return int.from_bytes(bytes([10, *(index + 1).to_bytes(3, "big")]), "little")
+        if name == "KLHST_WKS_RTP_STATE":
+            return 4 if index % 3 else 7
+        if name == "KLHST_WKS_LAST_INFOUDATE":
+            default = _EPOCH + timedelta(seconds=(index * 37) % (30 * 86400))
+            return self.touched.get(index, default)
+        return None
+
+    def host_row(self, index: int, fields: Sequence[str]) -> dict:
+        """One host in KLOAPI wire format, restricted to `fields`."""
+        row = {}
+        for name in fields:
+            value = self.host_value(index, name)
+            if value is None:
+                continue
+            if isinstance(value, datetime):
+                value = _datetime(value)
+            elif name in ("KLHST_WKS_GRP", "KLHST_WKS_IP"):
+                value = _long(value)
+            row[name] = value
+        return row
+
+    def find_hosts(self, wstr_filter: str) -> Sequence[int]:
+        predicate = _compile_filter(wstr_filter)
+        if predicate is None:
+            return range(self.config.hosts)
+        return [
+            i for i in range(self.config.hosts) if predicate(functools.partial(self.host_value, i))
+        ]
+
+    # Groups
+
+    def group_ids(self) -> List[int]:
+        return list(range(self.config.groups + 1))
+
+    def group_values(self, gid: int) -> Dict[str, Any]:
+        name = "Managed devices" if gid == 0 else f"Group {gid:03d}"
+        full_name = name if gid == 0 else f"Managed devices/{name}"
+        count = 0
+        if gid:
+            # Hosts are spread round-robin over groups 1..N
+            count = len(range(gid - 1, self.config.hosts, self.config.groups))
+        return {
+            "id": gid,
+            "name": name,
+            "grp_full_name": full_name,
+            "parentId": -1 if gid == 0 else 0,
+            "KLGRP_CHLDHST_CNT": count,
+        }
+
+    def find_groups(self, wstr_filter: str) -> Sequence[int]:
+        predicate = _compile_filter(wstr_filter)
+        return [
+            g for g in self.group_ids() if predicate is None or predicate(self.group_values(g).get)
+        ]
+
+    def group_row(self, gid: int, fields: Sequence[str]) -> dict:
+        values = self.group_values(gid)
+        return {name: values[name] for name in fields if name in values}
+
+    # Tasks
+
+    def task_ids(self, gid: int) -> List[str]:
+        return [f"task-{gid}-{k}" for k in range(self.config.tasks_per_group)]
+
+    def task_group(self, task_id: str) -> Optional[int]:
+        match = re.fullmatch(r"task-(\d+)-(\d+)", task_id)
+        if not match:
+            return None
+        gid, k = int(match.group(1)), int(match.group(2))
+        if gid > self.config.groups or k >= self.config.tasks_per_group:
+            return None
+        return gid
+
+    def task_display_name(self, task_id: str) -> str:
+        return "Task " + task_id.split("-", 1)[1]
+
+    def task_row(self, task_id: str, with_name: bool) -> dict:
+        gid = self.task_group(task_id)
+        info = {"PRTS_TASK_GROUPID": gid}
+        if with_name:
+            info["DisplayName"] = self.task_display_name(task_id)
+        return {
+            "TASK_UNIQUE_ID": task_id,
+            "TASK_NAME": "kldummy",
+            "TASKSCH_TYPE": 1,
+            "TASK_INFO_PARAMS": _params(info),
+        }
+
+
+@dataclass
+class _Accessor:
+    session: str
+    kind: str
+    rows: Sequence[int]
+    fields: List[str]
+    expires_at: float
+
+
+class FakeKsc:
+    """Server state plus the KLOAPI method handlers."""
+
+    def __init__(self, config: FakeKscConfig):
+        self.config = config
+        self.fleet = FakeFleet(config)
+        self.sessions: Dict[str, str] = {}
+        self.tokens: Dict[str, str] = {}
+        self.accessors: Dict[str, _Accessor] = {}
+        self.task_iterators: Dict[str, List[str]] = {}
+        # FindHostsAsync requests waiting for FindHostsAsyncGetAccessor
+        self.host_searches: Dict[str, dict] = {}
+        self.cancelled_searches = 0
+        self.actions: Counter = Counter()
+        self.calls: Counter = Counter()
+        self.started_tasks: Counter = Counter()
+        self._rng = random.Random(config.seed)
+
+    @property
+    def open_accessors(self) -> int:
+        now = time.time()
+        return sum(1 for accessor in self.accessors.values() if accessor.expires_at > now)
+
+    async def delay(self, method: str):
+        latency = self.config.method_latency.get(method, self.config.latency)
+        if self.config.jitter:
+            latency += self._rng.uniform(0, self.config.jitter)
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+    # Authentication
+
+    def login(self, authorization: str) -> Optional[str]:
+        """Validates an Authorization header, returns the account name."""
+        if authorization.startswith("KSCBasic "):
+            fields = dict(re.findall(r'(\w+)="([^"]*)"', authorization))
+            try:
+                user = base64.b64decode(fields.get("user", "")).decode("utf-8")
+                password = base64.b64decode(fields.get("pass", "")).decode("utf-8")
+            except ValueError:
+                return None
+            if user == self.config.username and password == self.config.password:
+                return user
+            return None
+        if authorization.startswith("KSCT "):
+            return self.tokens.get(authorization[5:])
+        return None
+
+    def expire_sessions(self):
+        """Drops every logged-in session, as KSC does with sessions idle for too long."""
+        self.sessions.clear()
+
+    # Helpers
+
+    def _accessor(self, session: str, str_accessor: str) -> _Accessor:
+        accessor = self.accessors.get(str_accessor)
+        if accessor is None or accessor.session != session or accessor.expires_at <= time.time():
+            raise KlsError(f"Accessor '{str_accessor}' not found")
+        return accessor
+
+    def _open(self, session: str, kind: str, rows, fields, lifetime) -> dict:
+        str_accessor = uuid.uuid4().hex
+        self.accessors[str_accessor] = _Accessor(
+            session=session,
+            kind=kind,
+            rows=rows,
+            fields=list(fields or []),
+            expires_at=time.time() + int(lifetime or 600),
+        )
+        return {"strAccessor": str_accessor, "PxgRetVal": len(rows)}
+
+    # KLOAPI methods: (session, params) -> response body
+
+    def HostGroup_FindHosts(self, session, p):
+        rows = self.fleet.find_hosts(p.get("wstrFilter", ""))
+        return self._open(session, "host", rows, p.get("vecFieldsToReturn"), p.get("lMaxLifeTime"))
+
+    def HostGroup_FindHostsAsync(self, session, p):
+        request_id = uuid.uuid4().hex
+        self.host_searches[request_id] = {"session": session, "params": p}
+        return {"strRequestId": request_id}
+
+    def _host_search(self, session, p) -> dict:
+        search = self.host_searches.get(str(p.get("strRequestId", "")))
+        if search is None or search["session"] != session:
+            raise KlsError(f"Request '{p.get('strRequestId')}' not found")
+        return search
+
+    def HostGroup_FindHostsAsyncCancel(self, session, p):
+        self._host_search(session, p)
+        del self.host_searches[p["strRequestId"]]
+        self.cancelled_searches += 1
+        return {}
+
+    def HostGroup_FindHostsAsyncGetAccessor(self, session, p):
+        self._host_search(session, p)
+        if self.actions[p["strRequestId"]] < self.config.action_polls:
+            raise KlsError("Search is not finished yet")
+        search = self.host_searches.pop(p["strRequestId"])
+        return self.HostGroup_FindHosts(session, search["params"]) | {"pFailedSlavesInfo": {}}
+
+    def HostGroup_FindGroups(self, session, p):
+        rows = self.fleet.find_groups(p.get("wstrFilter", ""))
+        return self._open(session, "group", rows, p.get("vecFieldsToReturn"), p.get("lMaxLifeTime"))
+
+    def HostGroup_GetHostInfo(self, session, p):
+        index = self.fleet.host_index(p.get("strHostName", ""))
+        if index is None:
+            raise KlsError(f"Host '{p.get('strHostName')}' not found", code=1184)
+        return {"PxgRetVal": self.fleet.host_row(index, p.get("pFields2Return") or [])}
+
+    def HostGroup_MoveHostsToGroup(self, session, p):
+        gid = int(p.get("nGroup", 0))
+        if gid not in self.fleet.group_ids():
+            raise KlsError(f"Group {gid} not found", code=1184)
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        for name in p.get("pHostNames") or []:
+            index = self.fleet.host_index(name)
+            if index is None:
+                raise KlsError(f"Host '{name}' not found", code=1184)
+            self.fleet.moved[index] = gid
+            self.fleet.touched[index] = now
+        return {}
+
+    def ChunkAccessor_GetItemsCount(self, session, p):
+        return {"PxgRetVal": len(self._accessor(session, p.get("strAccessor")).rows)}
+
+    def ChunkAccessor_GetItemsChunk(self, session, p):
+        accessor = self._accessor(session, p.get("strAccessor"))
+        start = max(int(p.get("nStart", 0)), 0)
+        count = max(int(p.get("nCount", 0)), 0)
+        indexes = accessor.rows[start : start + count]
+        if accessor.kind == "host":
+            items = [_params(self.fleet.host_row(i, accessor.fields)) for i in indexes]
+        else:
+            items = [_params(self.fleet.group_row(g, accessor.fields)) for g in indexes]
+        # Every access extends the accessor lifetime
+        accessor.expires_at = max(accessor.expires_at, time.time() + 600)
+        return {"pChunk": {"KLCSP_ITERATOR_ARRAY": items}, "PxgRetVal": len(items)}
+
+    def ChunkAccessor_Release(self, session, p):
+        self._accessor(session, p.get("strAccessor"))
+        del self.accessors[p.get("strAccessor")]
+        return {}
+
+    def Tasks_ResetTasksIterator(self, session, p):
+        gid = int(p.get("nGroupId", 0))
+        if not p.get("bGroupIdSignificant", True):
+            groups = self.fleet.group_ids()
+        elif gid not in self.fleet.group_ids():
+            raise KlsError(f"Group {gid} not found", code=1184)
+        else:
+            # Tasks of the root group are inherited by every subgroup
+            groups = [gid, 0] if gid and p.get("bIncludeSupergroups") else [gid]
+        iterator_id = uuid.uuid4().hex
+        self.task_iterators[iterator_id] = [t for g in groups for t in self.fleet.task_ids(g)]
+        return {"strTaskIteratorId": iterator_id}
+
+    def Tasks_GetNextTask(self, session, p):
+        pending = self.task_iterators.get(p.get("strTaskIteratorId"))
+        if pending is None:
+            raise KlsError("Task iterator not found")
+        if not pending:
+            return {"pTaskData": {}, "PxgRetVal": False}
+        row = self.fleet.task_row(pending.pop(0), self.config.task_names_in_iterator)
+        return {"pTaskData": row, "PxgRetVal": True}
+
+    def Tasks_ReleaseTasksIterator(self, session, p):
+        self.task_iterators.pop(p.get("strTaskIteratorId"), None)
+        return {}
+
+    def _task(self, p) -> str:
+        task_id = str(p.get("strTask", ""))
+        if self.fleet.task_group(task_id) is None:
+            raise KlsError(f"Task '{task_id}' not found", code=1184)
+        return task_id
+
+    def Tasks_GetTask(self, session, p):
+        task_id = self._task(p)
+        return {
+            "PxgRetVal": {
+                "TASK_UNIQUE_ID": task_id,
+                "DisplayName": self.fleet.task_display_name(task_id),
+                "TASKID_PRODUCT_NAME": "KES",
+                "TASK_INFO_PARAMS": _params({"PRTS_TASK_GROUPID": self.fleet.task_group(task_id)}),
+            }
+        }
+
+    def Tasks_RunTask(self, session, p):
+        self.started_tasks[self._task(p)] += 1
+        return {}
+
+    def Tasks_GetTaskStatistics(self, session, p):
+        task_id = self._task(p)
+        running = self.started_tasks[task_id] > 0
+        return {
+            "PxgRetVal": {
+                "nState": 4 if running else 0,
+                "nCompletion": 50 if running else 0,
+                "KLTSK_STAT_NUM_RUNNING": int(running),
+            }
+        }
+
+    def AsyncActionStateChecker_CheckActionState(self, session, p):
+        guid = str(p.get("wstrActionGuid", ""))
+        self.actions[guid] += 1
+        finalized = self.actions[guid] >= self.config.action_polls
+        return {
+            "bFinalized": finalized,
+            "bSuccededFinalized": finalized,
+            "lStateCode": 0,
+            "pStateData": {},
+            "lNextCheckDelay": 0 if finalized else 100,
+        }
+
+    def Session_Ping(self, session, p):
+        return {}
+
+    def Session_CreateToken(self, session, p):
+        token = base64.b64encode(uuid.uuid4().bytes).decode("ascii")
+        self.tokens[token] = self.sessions[session]
+        return {"PxgRetVal": token}
+
+    def Session_EndSession(self, session, p):
+        self.sessions.pop(session, None)
+        for key in [k for k, a in self.accessors.items() if a.session == session]:
+            del self.accessors[key]
+        return {}
+
+
+def create_app(config: Optional[FakeKscConfig] = None) -> FastAPI:
+    """FastAPI app serving /api/v1.0/login and /api/v1.0/<Class>.<Method>."""
+    state = FakeKsc(config or FakeKscConfig())
+    app = FastAPI(title="Fake KSC Administration Server")
+    app.state.ksc = state
+
+    @app.post("/api/v1.0/login")
+    async def login(request: Request):
+        await state.delay("login")
+        state.calls["login"] += 1
+        account = state.login(request.headers.get("authorization", ""))
+        if account is None:
+            return Response("Authentication failed", status_code=401)
+        session = uuid.uuid4().hex
+        state.sessions[session] = account
+        response = JSONResponse({})
+        response.set_cookie(SESSION_COOKIE, session)
+        return response
+
+    @app.post("/api/v1.0/{method}")
+    async def call(method: str, request: Request):
+        await state.delay(method)
+        state.calls[method] += 1
+        session = request.cookies.get(SESSION_COOKIE, "")
+        if session not in state.sessions:
+            return Response("Session is not authenticated", status_code=401)
+
+        handler = getattr(state, method.replace(".", "_"), None)
+        if handler is None:
+            return JSONResponse({"PxgError": {"code": 1186, "message": f"Unknown {method}"}})
+
+        body = await request.body()
+        try:
+            result = handler(session, json.loads(body) if body else {})
+        except KlsError as e:
+            return JSONResponse(
+                {"PxgError": {"code": e.code, "module": "KLSTD", "message": e.message}}
+            )
+        return Response(json.dumps(result), media_type="application/json")
+
+    return app
+
+
+class FakeKscServer:
+    """Runs the fake server with uvicorn in a background thread on a free local port."""
+
+    def __init__(
+        self, config: Optional[FakeKscConfig] = None, host: str = "127.0.0.1", port: int = 0
+    ):
+        self.app = create_app(config)
+        self.host = host
+        self.port = port
+        self._server: Optional[uvicorn.Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def state(self) -> FakeKsc:
+        return self.app.state.ksc
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "FakeKscServer":
+        config = uvicorn.Config(self.app, host=self.host, port=self.port, log_level="warning")
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError("Fake KSC server did not start")
+            time.sleep(0.01)
+        self.port = self._server.servers[0].sockets[0].getsockname()[1]
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.should_exit = True
+            self._thread.join(timeout=10)
+            self._server = None
+
+    def __enter__(self) -> "FakeKscServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake KSC Administration Server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=13299)
+    parser.add_argument("--hosts", type=int, default=FakeKscConfig.hosts)
+    parser.add_argument("--groups", type=int, default=FakeKscConfig.groups)
+    parser.add_argument("--tasks-per-group", type=int, default=FakeKscConfig.tasks_per_group)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--username", default=FakeKscConfig.username)
+    parser.add_argument("--password", default=FakeKscConfig.password)
+    args = parser.parse_args()
+
+    config = FakeKscConfig(
+        hosts=args.hosts,
+        groups=args.groups,
+        tasks_per_group=args.tasks_per_group,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        username=args.username,
+        password=args.password,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
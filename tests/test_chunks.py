@@ -0,0 +1,30 @@
+from server.ksc.chunks import ChunkSizer
+
+
+def test_chunks_grow_while_responses_are_fast():
+    sizer = ChunkSizer(initial=500, max_size=5000, target_seconds=1.0)
+    sizes = []
+    for _ in range(6):
+        size = sizer.next_size()
+        sizes.append(size)
+        sizer.observe(size, 0.05 + size * 0.0001)  # 50 ms round trip + 0.1 ms per row
+
+    # Doubling at most per response, up to the cap
+    assert sizes == [500, 1000, 2000, 4000, 5000, 5000]
+
+
+def test_chunks_shrink_to_time_and_byte_budgets():
+    sizer = ChunkSizer(initial=4000, max_size=8000, target_seconds=1.0)
+    sizer.observe(4000, 4.0)  # 1 ms per row -> 1000 rows per second
+    assert sizer.next_size() == 1000
+
+    sizer = ChunkSizer(initial=4000, max_size=8000, max_bytes=1024 * 1024)
+    sizer.observe(4000, 0.1, nbytes=4000 * 1024)  # 1 KiB per row
+    assert sizer.next_size() == 1024
+
+
+def test_small_chunks_are_not_observed():
+    sizer = ChunkSizer(initial=500, min_size=100)
+    sizer.observe(20, 0.5)  # a 20-row page: mostly round trip time
+    assert sizer.next_size() == 500
+    assert sizer.stats()["observations"] == 0
@@ -0,0 +1,52 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import anyio
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from server.ksc import deadline
+from server.ksc.errors import KscDeadlineError
+from server.ksc.limiter import AdaptiveLimiter, LimitedAdapter
+
+
+def test_nested_budget_can_only_shorten_the_enclosing_one():
+    with deadline.deadline(10) as outer:
+        with deadline.deadline(60) as inner:
+            assert inner is outer
+        with deadline.deadline(1) as inner:
+            assert inner is not outer
+            assert deadline.remaining() <= 1
+            deadline.mark_partial()
+        # Partial results of a nested step make the whole call partial
+        assert outer.partial
+    assert deadline.current() is None
+    with deadline.deadline(0) as none:
+        assert none is None
+
+
+async def test_budget_follows_the_call_into_worker_threads():
+    with deadline.deadline(5):
+        remaining = await anyio.to_thread.run_sync(deadline.remaining)
+    assert 0 < remaining <= 5
+
+
+def test_adapter_bounds_timeouts_by_deadline_and_stops_when_expired():
+    adapter = LimitedAdapter(AdaptiveLimiter(max_limit=4), timeout=(10, 120))
+    request = requests.Request("POST", "http://ksc.invalid/api/v1.0/Session.Ping").prepare()
+
+    with patch.object(HTTPAdapter, "send", return_value=MagicMock(status_code=200)) as send:
+        adapter.send(request)
+        assert send.call_args.kwargs["timeout"] == (10, 120)
+
+        with deadline.deadline(2):
+            adapter.send(request)
+        connect, read = send.call_args.kwargs["timeout"]
+        assert connect <= 2 and read <= 2
+
+        with deadline.deadline(0.01):
+            time.sleep(0.02)
+            with pytest.raises(KscDeadlineError):
+                adapter.send(request)
+        assert send.call_count == 2
@@ -0,0 +1,285 @@
+import time
+
+import pytest
+from KlAkOAPI.AdmServer import KlAkAdmServer
+from KlAkOAPI.ChunkAccessor import KlAkChunkAccessor
+from KlAkOAPI.Error import KlAkError, KlAkResponseError
+from KlAkOAPI.HostGroup import KlAkHostGroup
+from tests.fake_ksc import FakeKscConfig, FakeKscServer
+
+from server.ksc.errors import KscApiError
+from server.ksc.service import KscService
+from server.settings import settings
+
+
+@pytest.fixture
+def ksc_service(fake_ksc, monkeypatch):
+    monkeypatch.setattr(settings, "KSC_HOST", fake_ksc.url)
+    monkeypatch.setattr(settings, "KSC_USERNAME", "user")
+    monkeypatch.setattr(settings, "KSC_PASSWORD", "pass")
+    monkeypatch.setattr(settings, "KSC_CHUNK_SIZE", 100)
+    service = KscService()
+    yield service
+    service.close()
+
+
+def test_login_requires_valid_credentials(fake_ksc):
+    with pytest.raises(KlAkResponseError):
+        KlAkAdmServer.Create(fake_ksc.url, "user", "wrong", verify=False)
+
+    server = KlAkAdmServer.Create(fake_ksc.url, "user", "pass", verify=False)
+    assert server.connected
+
+
+def test_accessors_are_bound_to_their_session(fake_ksc):
+    owner = KlAkAdmServer.Create(fake_ksc.url, "user", "pass", verify=False)
+    other = KlAkAdmServer.Create(fake_ksc.url, "user", "pass", verify=False)
+
+    res = KlAkHostGroup(owner).FindHosts('(KLHST_WKS_DN="*")', ["KLHST_WKS_DN"], [], {}, 60)
+    assert res.RetVal() == 1000
+    assert fake_ksc.state.open_accessors == 1
+
+    with pytest.raises(KlAkError):
+        KlAkChunkAccessor(other).GetItemsCount(res.OutPar("strAccessor"))
+    KlAkChunkAccessor(owner).Release(res.OutPar("strAccessor"))
+    assert fake_ksc.state.open_accessors == 0
+
+
+async def test_service_end_to_end(ksc_service, fake_ksc):
+    page = await ksc_service.list_hosts_page(status="Critical", limit=15)
+    # Every 50th host is Critical
+    assert page.total == 20
+    assert [h.display_name for h in page.hosts[:2]] == ["WKS-000000", "WKS-000050"]
+    assert page.hosts[1].ip_address == "10.0.0.51"
+    page = await ksc_service.list_hosts_page(cursor=page.next_cursor, limit=15)
+    assert len(page.hosts) == 5 and page.next_cursor is None
+
+    groups = await ksc_service.list_groups()
+    assert len(groups) == 21
+    assert groups[1].full_name == "Managed devices/Group 001"
+    # The host search was read to the end, so its accessor was released too
+    assert fake_ksc.state.open_accessors == 0
+
+    host_id = page.hosts[0].id
+    assert (await ksc_service.get_host_details(host_id)).name == page.hosts[0].display_name
+    assert await ksc_service.move_host(host_id, 3)
+
+    tasks = await ksc_service.list_tasks(scan_all_groups=True)
+    assert len(tasks) == 21 * 3
+    assert {t.name for t in tasks} >= {"Task 0-0", "Task 20-2"}
+
+    await ksc_service.run_task("task-1-0")
+    state = await ksc_service.get_task_state("task-1-0")
+    assert state.percentage == 50
+
+
+async def test_new_connections_log_in_with_session_token(ksc_service, fake_ksc):
+    import anyio
+
+    async with anyio.create_task_group() as tg:
+        for i in range(3):
+            tg.start_soon(ksc_service.get_task_state, f"task-1-{i}")
+
+    # Only the first connection sends the password; the others reuse its token
+    assert ksc_service.auth_stats["password_logins"] == 1
+    assert ksc_service.auth_stats["token_logins"] >= 1
+    assert fake_ksc.state.calls["Session.CreateToken"] == 1
+
+
+async def test_expired_session_is_retried_once_after_relogin(ksc_service, fake_ksc):
+    await ksc_service.get_task_state("task-1-0")
+    fake_ksc.state.expire_sessions()
+
+    state = await ksc_service.get_task_state("task-1-0")
+
+    assert state.task_id == "task-1-0"
+    assert ksc_service.auth_stats["retries"] == 1
+    assert ksc_service.auth_stats["password_logins"] == 1
+
+
+async def test_task_scan_covers_every_group_chunk(monkeypatch):
+    config = FakeKscConfig(hosts=500, groups=250, tasks_per_group=1)
+    with FakeKscServer(config) as ksc:
+        monkeypatch.setattr(settings, "KSC_HOST", ksc.url)
+        monkeypatch.setattr(settings, "KSC_USERNAME", "user")
+        monkeypatch.setattr(settings, "KSC_PASSWORD", "pass")
+        monkeypatch.setattr(settings, "KSC_CHUNK_SIZE", 100)
+        service = KscService()
+        try:
+            groups = await service.list_groups()
+            assert len(groups) == 251
+            assert ksc.state.calls["ChunkAccessor.GetItemsChunk"] > 1
+
+            tasks = await service.list_tasks(scan_all_groups=True)
+            assert {t.name for t in tasks} >= {"Task 0-0", "Task 250-0"}
+        finally:
+            service.close()
+
+
+async def test_heartbeat_keeps_idle_sessions_and_drops_expired_ones(ksc_service, fake_ksc):
+    await ksc_service.ping()
+    assert ksc_service._pool.heartbeat(idle_for=0) == 1
+    assert ksc_service._pool.idle == 1
+    assert fake_ksc.state.calls["Session.Ping"] == 2
+
+    fake_ksc.state.expire_sessions()
+    assert ksc_service._pool.heartbeat(idle_for=0) == 1
+    assert ksc_service._pool.idle == 0
+
+
+async def test_deadline_returns_partial_page_that_can_be_resumed(monkeypatch):
+    from server.ksc.deadline import deadline
+
+    config = FakeKscConfig(method_latency={"ChunkAccessor.GetItemsChunk": 0.1})
+    with FakeKscServer(config) as ksc:
+        monkeypatch.setattr(settings, "KSC_HOST", ksc.url)
+        monkeypatch.setattr(settings, "KSC_USERNAME", "user")
+        monkeypatch.setattr(settings, "KSC_PASSWORD", "pass")
+        monkeypatch.setattr(settings, "KSC_CHUNK_SIZE", 100)
+        service = KscService()
+        try:
+            await service.ping()
+            with deadline(0.25) as budget:
+                page = await service.list_hosts_page(limit=1000)
+            assert budget.partial
+            assert page.partial
+            assert 0 < len(page.hosts) < 1000
+            assert page.next_cursor is not None
+            # Partial pages are not cached
+            assert len(service.cache) == 0
+
+            rest = await service.list_hosts_page(cursor=page.next_cursor, limit=1000)
+            assert not rest.partial
+            assert len(page.hosts) + len(rest.hosts) == 1000
+        finally:
+            service.close()
+
+
+async def test_shared_task_scan_is_partial_for_every_caller(monkeypatch):
+    import anyio
+
+    from server.ksc.deadline import deadline
+
+    config = FakeKscConfig(method_latency={"Tasks.GetNextTask": 0.05})
+    with FakeKscServer(config) as ksc:
+        monkeypatch.setattr(settings, "KSC_HOST", ksc.url)
+        monkeypatch.setattr(settings, "KSC_USERNAME", "user")
+        monkeypatch.setattr(settings, "KSC_PASSWORD", "pass")
+        service = KscService()
+        try:
+            await service.ping()
+            pages = {}
+
+            async def leader():
+                with deadline(0.3):
+                    pages["leader"] = await service.list_tasks_page(scan_all_groups=True)
+
+            async def follower():
+                # No deadline of its own: joins the leader's scan, which runs out of time
+                await anyio.sleep(0.05)
+                pages["follower"] = await service.list_tasks_page(scan_all_groups=True)
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(leader)
+                tg.start_soon(follower)
+
+            assert service.flights.coalesced == 1
+            assert pages["leader"].partial
+            assert pages["follower"].partial
+            assert pages["follower"].tasks == pages["leader"].tasks
+            assert service.cache.get(("list_tasks", "all")) is None
+        finally:
+            service.close()
+
+
+async def test_read_timeout_bounds_hung_calls(monkeypatch):
+    config = FakeKscConfig(method_latency={"Tasks.GetTaskStatistics": 2})
+    with FakeKscServer(config) as ksc:
+        monkeypatch.setattr(settings, "KSC_HOST", ksc.url)
+        monkeypatch.setattr(settings, "KSC_USERNAME", "user")
+        monkeypatch.setattr(settings, "KSC_PASSWORD", "pass")
+        monkeypatch.setattr(settings, "KSC_READ_TIMEOUT", 0.2)
+        service = KscService()
+        try:
+            started = time.monotonic()
+            with pytest.raises(KscApiError):
+                await service.get_task_state("task-1-0")
+            assert time.monotonic() - started < 1.5
+        finally:
+            service.close()
+
+
+async def test_long_walk_grows_chunks_and_keeps_row_order(ksc_service, fake_ksc):
+    page = await ksc_service.list_hosts_page(limit=1000)
+
+    assert [h.display_name for h in page.hosts] == [f"WKS-{i:06d}" for i in range(1000)]
+    # Chunks of 100, 200, 400 and the remaining 300 rows instead of ten of 100
+    assert fake_ksc.state.calls["ChunkAccessor.GetItemsChunk"] == 4
+    assert ksc_service.chunk_sizer.stats()["observations"] == 4
+    assert ksc_service.stats()["pool"]["in_use"] == 0
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+async def test_cancelled_host_search_is_cancelled_on_the_server(monkeypatch):
+    import anyio
+
+    # The search never finishes on its own: CheckActionState asks to poll again
+    with FakeKscServer(FakeKscConfig(action_polls=10_000)) as ksc:
+        monkeypatch.setattr(settings, "KSC_HOST", ksc.url)
+        monkeypatch.setattr(settings, "KSC_USERNAME", "user")
+        monkeypatch.setattr(settings, "KSC_PASSWORD", "pass")
+        service = KscService()
+        try:
+            with anyio.move_on_after(0.3) as scope:
+                await service.list_hosts_page(limit=10)
+            assert scope.cancelled_caught
+
+            assert _wait_for(lambda: ksc.state.cancelled_searches == 1)
+            assert ksc.state.host_searches == {}
+            assert ksc.state.open_accessors == 0
+        finally:
+            service.close()
+
+
+async def test_cancelled_task_scan_releases_its_iterators(monkeypatch):
+    import anyio
+
+    config = FakeKscConfig(method_latency={"Tasks.GetNextTask": 0.05})
+    with FakeKscServer(config) as ksc:
+        monkeypatch.setattr(settings, "KSC_HOST", ksc.url)
+        monkeypatch.setattr(settings, "KSC_USERNAME", "user")
+        monkeypatch.setattr(settings, "KSC_PASSWORD", "pass")
+        service = KscService()
+        try:
+            with anyio.move_on_after(0.3):
+                await service.list_tasks(scan_all_groups=True)
+            assert ksc.state.calls["Tasks.ResetTasksIterator"] > 0
+
+            # Workers stop after their current GetNextTask and release the iterators
+            assert _wait_for(lambda: ksc.state.task_iterators == {})
+            assert ksc.state.calls["Tasks.GetNextTask"] < 21 * 4
+        finally:
+            service.close()
+
+
+def test_injected_latency_and_large_fleet():
+    config = FakeKscConfig(hosts=500_000, method_latency={"HostGroup.FindHosts": 0.2})
+    with FakeKscServer(config) as ksc:
+        server = KlAkAdmServer.Create(ksc.url, "user", "pass", verify=False)
+
+        started = time.monotonic()
+        res = KlAkHostGroup(server).FindHosts('(KLHST_WKS_DN="*")', ["id"], [], {}, 60)
+        assert time.monotonic() - started >= 0.2
+        assert res.RetVal() == 500_000
+
+        chunk = KlAkChunkAccessor(server).GetItemsChunk(res.OutPar("strAccessor"), 499_990, 100)
+        rows = chunk.OutPar("pChunk")["KLCSP_ITERATOR_ARRAY"]
+        assert [row["id"] for row in rows] == list(range(499_991, 500_001))
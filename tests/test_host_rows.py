@@ -0,0 +1,62 @@
+import json
+
+from KlAkOAPI.Base import KlAkBase
+
+from server.ksc.host_rows import decode_hosts, ip_addresses, status_text
+
+
+def test_decodes_parsed_chunk_columns():
+    rows = [
+        {
+            "KLHST_WKS_DN": "Host 1",
+            "KLHST_WKS_HOSTNAME": "host-1",
+            "KLHST_WKS_GRP": {"type": "long", "value": 7},
+            "KLHST_WKS_STATUS": {"type": "long", "value": 13},
+            "KLHST_WKS_STATUS_ID": 1,
+            "KLHST_WKS_IP": {"type": "long", "value": 0x0A00A8C0},
+            "KLHST_WKS_RTP_STATE": 4,
+        },
+        # No network name, address or state attributes
+        {"KLHST_WKS_DN": "Host 2", "KLHST_WKS_GRP": 0},
+        {
+            "KLHST_WKS_DN": "Host 3",
+            "KLHST_WKS_HOSTNAME": "host-3",
+            "KLHST_WKS_STATUS": 29,
+            "KLHST_WKS_STATUS_ID": 5,
+            "KLHST_WKS_IP": -1062731775,
+            "KLHST_WKS_RTP_STATE": 42,
+        },
+    ]
+    items = [{"type": "params", "value": row} for row in rows]
+    body = json.dumps({"pChunk": {"KLCSP_ITERATOR_ARRAY": items}}).encode()
+    chunk = KlAkBase().ParseResponse(200, body).OutPar("pChunk")["KLCSP_ITERATOR_ARRAY"]
+
+    hosts = decode_hosts(chunk)
+    # Plain dict rows (already unwrapped) decode the same way
+    assert [h.model_dump() for h in decode_hosts(rows)] == [h.model_dump() for h in hosts]
+
+    first, second, third = hosts
+    assert first.model_dump() == {
+        "id": "host-1",
+        "name": "host-1",
+        "display_name": "Host 1",
+        "group_id": 7,
+        "group_name": "Unknown",
+        "status": "[Critical] Status: 13 (Visible, Agent Installed, Agent Active) | RTP: Running",
+        "ip_address": "192.168.0.10",
+        "products": [],
+    }
+    assert (second.id, second.name, second.group_name) == ("Host 2", "Unknown", "Managed Devices")
+    assert second.status == "[OK] Status: 0 (None) | RTP: Unknown"
+    assert second.ip_address is None
+    assert third.ip_address == "1.0.168.192"
+    assert third.status == (
+        "[5] Status: 29 (Visible, Agent Installed, Agent Active, RTP Installed) | RTP: 42"
+    )
+
+
+def test_values_outside_the_tables_are_kept_as_text():
+    ips = ip_addresses([None, 2**32, "n/a", 0x0100007F])
+    assert ips == [None, "4294967296", "n/a", "127.0.0.1"]
+    assert status_text("n/a", 0, 0) == "n/a"
+    assert status_text(1, "n/a", -1) == "[n/a] Status: 1 (Visible) | RTP: -1"
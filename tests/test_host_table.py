@@ -0,0 +1,54 @@
+import pytest
+
+from server.ksc.host_table import HostTable, parse_ip_range
+from server.models import HostInfo
+
+
+def _host(i):
+    return HostInfo(
+        id=f"host-{i:04d}",
+        name=f"host-{i:04d}",
+        display_name=f"Host {i}",
+        group_id=i % 4,
+        status="[OK] Status: 13 (Visible, Agent Installed, Agent Active) | RTP: Running",
+        ip_address=f"10.0.{i // 256}.{i % 256}" if i % 10 else None,
+    )
+
+
+@pytest.fixture
+def table():
+    table = HostTable({1: "Servers"})
+    table.extend((_host(i), i % 3) for i in range(1000))
+    table.append(_host(1000).model_copy(update={"ip_address": "fe80::1"}))
+    return table
+
+
+def test_filters_return_rows_in_table_order(table):
+    assert list(table.select(status_id=1, group_id=1))[:3] == [1, 13, 25]
+    assert list(table.select(ip_range="10.0.1.0/30")) == [256, 257, 258, 259]
+    assert list(table.select(ip_range="10.0.0.8 - 10.0.0.11")) == [8, 9, 11]
+    assert list(table.select(name="HOST-00*5", group_id=1)) == [5, 25, 45, 65, 85]
+    assert len(table.select(status_id=2, ip_range="10.0.0.0/8")) == 300
+    with pytest.raises(ValueError):
+        table.select(ip_range="10.0.0.300")
+
+
+def test_materializes_only_the_page(table):
+    hosts, total = table.query(group_id=1, limit=2, offset=1)
+    assert total == 250
+    assert [h.model_dump() for h in hosts] == [
+        _host(i).model_dump() | {"group_name": "Servers"} for i in (5, 9)
+    ]
+
+    hosts, total = table.query(name="host-1000")
+    assert total == 1
+    assert (hosts[0].ip_address, hosts[0].group_name) == ("fe80::1", "Managed Devices")
+    assert table.hosts([10])[0].ip_address is None
+
+
+def test_columns_are_compact(table):
+    # Equal strings (host ID and name, status texts) are stored once
+    assert table.ids[3] is table.names[3]
+    assert table.statuses[0] is table.statuses[1]
+    assert table.nbytes() / len(table) < 400
+    assert parse_ip_range("192.168.0.1") == (0xC0A80001, 0xC0A80001)
@@ -1,6 +1,7 @@
 import pytest
 import logging
 from server.ksc.service import ksc_service
+from server.settings import settings
 
 # Marked as integration test - skipped by default unless --run-integration is passed
 @pytest.mark.integration
@@ -11,7 +12,7 @@ class TestRealConnection:
         """
         Verifies real connectivity to the KSC server defined in .env.
         """
-        print(f"\nAttempting to connect to {ksc_service.server}...")
+        print(f"\nAttempting to connect to {settings.KSC_HOST}...")
         try:
             result = await ksc_service.ping()
             assert result == "pong"
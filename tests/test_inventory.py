@@ -0,0 +1,62 @@
+import pytest
+
+from server.ksc.inventory import HostInventory
+from server.models import GroupInfo, HostInfo
+
+
+def _host(i, group_id=1):
+    return HostInfo(
+        id=f"host-{i}", name=f"host-{i}", display_name=f"Host {i}", group_id=group_id
+    )
+
+
+@pytest.fixture
+def inventory(tmp_path):
+    inv = HostInventory(str(tmp_path / "inventory.db"))
+    yield inv
+    inv.close()
+
+
+def test_full_sync_then_query(inventory):
+    assert inventory.staleness() is None
+
+    generation = inventory.begin_full_sync()
+    inventory.replace_groups([GroupInfo(id=1, name="Servers", full_name="Servers")])
+    inventory.upsert_hosts(
+        [(_host(i), i % 3, f"2026-01-01 00:00:0{i}") for i in range(6)], generation
+    )
+    inventory.finish_sync(generation)
+
+    hosts, total = inventory.query_hosts(status_id=1, limit=1)
+    assert total == 2
+    assert [h.id for h in hosts] == ["host-1"]
+    assert hosts[0].group_name == "Servers"
+
+    hosts, total = inventory.query_hosts(name="host-*", limit=10, offset=4)
+    assert total == 6
+    assert [h.id for h in hosts] == ["host-4", "host-5"]
+
+    assert inventory.query_hosts(status_id=1, group_id=1)[1] == 2
+    assert inventory.query_hosts(group_id=2, ip_range="10.0.0.0/8")[1] == 0
+
+    assert inventory.high_water_mark == "2026-01-01 00:00:05"
+    assert inventory.staleness() < 5
+
+
+def test_full_sync_drops_removed_hosts(inventory):
+    generation = inventory.begin_full_sync()
+    inventory.upsert_hosts([(_host(i), 0, None) for i in range(3)], generation)
+    inventory.finish_sync(generation)
+
+    # Incremental update keeps everything and updates in place
+    inventory.upsert_hosts([(_host(0, group_id=2), 1, None)])
+    inventory.finish_sync()
+    hosts, total = inventory.query_hosts(status_id=1)
+    assert total == 1 and hosts[0].group_id == 2
+
+    generation = inventory.begin_full_sync()
+    inventory.upsert_hosts([(_host(1), 0, None)], generation)
+    inventory.finish_sync(generation)
+
+    hosts, total = inventory.query_hosts()
+    assert [h.id for h in hosts] == ["host-1"]
@@ -0,0 +1,82 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from server.ksc.errors import KscBusyError
+from server.ksc.limiter import AdaptiveLimiter, LimitedAdapter
+
+
+def test_limit_grows_additively_up_to_max():
+    limiter = AdaptiveLimiter(max_limit=4, initial_limit=2, latency_target=1)
+
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release(latency=0.01)
+
+    assert limiter.limit == 4
+    assert limiter.stats()["calls"] == 10
+
+
+def test_overload_halves_limit_once_per_latency_target():
+    limiter = AdaptiveLimiter(max_limit=8, latency_target=10)
+
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(latency=0.01, overloaded=True)
+
+    # A burst of 503s backs off once, not three times
+    assert limiter.limit == 4
+    assert limiter.stats()["overloads"] == 3
+
+    with patch("server.ksc.limiter.time.monotonic", return_value=time.monotonic() + 11):
+        limiter.acquire()
+        limiter.release(latency=11)  # too slow
+    assert limiter.limit == 2
+
+
+def test_calls_over_the_limit_queue_and_are_rejected_after_max_wait():
+    limiter = AdaptiveLimiter(max_limit=1, max_queue_wait=0.05)
+    limiter.acquire()
+
+    with pytest.raises(KscBusyError):
+        limiter.acquire()
+
+    stats = limiter.stats()
+    assert stats["rejected"] == 1
+    assert stats["max_queue_depth"] == 1
+    assert stats["queue_depth"] == 0
+
+    # A queued call proceeds as soon as the slot is released
+    waited = []
+
+    def waiter():
+        limiter.acquire(timeout=5)
+        waited.append(True)
+        limiter.release(latency=0.01)
+
+    thread = threading.Thread(target=waiter)
+    thread.start()
+    time.sleep(0.02)
+    limiter.release(latency=0.01)
+    thread.join()
+    assert waited == [True]
+
+
+def test_adapter_reports_http_503_as_overload():
+    limiter = AdaptiveLimiter(max_limit=8, latency_target=10)
+    adapter = LimitedAdapter(limiter)
+    request = requests.Request("POST", "http://ksc.invalid/api/v1.0/HostGroup.FindHosts").prepare()
+
+    with patch.object(HTTPAdapter, "send", return_value=MagicMock(status_code=503)):
+        adapter.send(request)
+    assert limiter.limit == 4
+
+    with patch.object(HTTPAdapter, "send", side_effect=requests.ConnectionError("refused")):
+        with pytest.raises(requests.ConnectionError):
+            adapter.send(request)
+    assert limiter.stats()["overloads"] == 2
+    assert limiter.stats()["in_flight"] == 0
@@ -0,0 +1,49 @@
+import json
+
+from starlette.testclient import TestClient
+
+from server import main
+from server.settings import settings
+
+MCP_HEADERS = {"accept": "application/json, text/event-stream"}
+
+
+def _rpc(client, method, params=None, session=None, id=1):
+    headers = dict(MCP_HEADERS)
+    if session:
+        headers["mcp-session-id"] = session
+    body = {"jsonrpc": "2.0", "id": id, "method": method, "params": params or {}}
+    response = client.post("/mcp", json=body, headers=headers)
+    assert response.status_code == 200
+    data = [line[5:] for line in response.text.splitlines() if line.startswith("data:")]
+    return response, json.loads(data[-1])
+
+
+def test_http_app_serves_tools_and_releases_ksc_on_shutdown(monkeypatch):
+    closed = []
+    monkeypatch.setattr(main.ksc_service, "close", lambda timeout=0: closed.append(timeout))
+    monkeypatch.setattr(settings, "KSC_HEARTBEAT_INTERVAL", 0)
+    app = main.create_app()
+
+    with TestClient(app, base_url="http://127.0.0.1:8000") as client:
+        response, init = _rpc(
+            client,
+            "initialize",
+            {
+                "protocolVersion": "2025-06-18",
+                "capabilities": {},
+                "clientInfo": {"name": "test", "version": "1"},
+            },
+        )
+        assert init["result"]["serverInfo"]["name"] == "ksc-mcp"
+        session = response.headers["mcp-session-id"]
+
+        _, tools = _rpc(client, "tools/list", session=session, id=2)
+        names = {tool["name"] for tool in tools["result"]["tools"]}
+        assert {"get_hosts", "list_tasks", "ksc_metrics"} <= names
+        # The service lives as long as the app, not as long as one MCP session
+        assert closed == []
+
+        assert "mcp_tool_duration_seconds" in client.get("/metrics").text
+
+    assert closed == [settings.MCP_SHUTDOWN_TIMEOUT]
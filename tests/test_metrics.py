@@ -0,0 +1,87 @@
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from server import metrics
+from server.ksc.errors import KscApiError
+from server.ksc.service import KscService
+from server.settings import settings
+
+
+def test_registry_renders_prometheus_text():
+    registry = metrics.Registry()
+    calls = registry.counter("calls_total", "Calls", ("method",))
+    latency = registry.histogram("latency_seconds", "Latency", ("method",), buckets=(0.1, 1))
+    registry.add_collector(
+        "ksc", lambda: {"flights": {"in_flight": 2, "coalesced_by_method": {"list_hosts": 5}}}
+    )
+
+    calls.inc(method="HostGroup.FindHosts")
+    calls.inc(2, method="HostGroup.FindHosts")
+    latency.observe(0.05, method='Odd"Name')
+    latency.observe(0.5, method='Odd"Name')
+    with pytest.raises(ValueError):
+        calls.inc(tool="x")
+
+    lines = registry.render().splitlines()
+    assert "# TYPE calls_total counter" in lines
+    assert 'calls_total{method="HostGroup.FindHosts"} 3' in lines
+    assert 'latency_seconds_bucket{method="Odd\\"Name",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{method="Odd\\"Name",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{method="Odd\\"Name",le="+Inf"} 2' in lines
+    assert 'latency_seconds_count{method="Odd\\"Name"} 2' in lines
+    assert "ksc_flights_in_flight 2" in lines
+    assert 'ksc_flights_coalesced{method="list_hosts"} 5' in lines
+
+
+async def test_ksc_requests_are_recorded_by_method(fake_ksc, monkeypatch):
+    monkeypatch.setattr(settings, "KSC_HOST", fake_ksc.url)
+    monkeypatch.setattr(settings, "KSC_USERNAME", "user")
+    monkeypatch.setattr(settings, "KSC_PASSWORD", "pass")
+    service = KscService()
+    chunks = metrics.KSC_REQUEST_SECONDS.count(method="ChunkAccessor.GetItemsChunk")
+    not_found = metrics.KSC_REQUEST_ERRORS.value(method="HostGroup.GetHostInfo", code="1184")
+    try:
+        await service.list_hosts_page(limit=10)
+        with pytest.raises(KscApiError):
+            await service.get_host_details("no-such-host")
+    finally:
+        service.close()
+
+    assert metrics.KSC_REQUEST_SECONDS.count(method="ChunkAccessor.GetItemsChunk") == chunks + 1
+    assert metrics.KSC_RESPONSE_BYTES.count(method="HostGroup.FindHostsAsync") > 0
+    errors = metrics.KSC_REQUEST_ERRORS.value(method="HostGroup.GetHostInfo", code="1184")
+    assert errors == not_found + 1
+
+    text = metrics.render()
+    assert 'ksc_request_duration_seconds_bucket{method="HostGroup.FindHostsAsync",le="' in text
+
+
+async def test_tools_record_latency_and_errors(monkeypatch):
+    from server.ksc.service import ksc_service
+    from server.tools import metrics as metrics_tools
+    from server.tools import tasks
+
+    mcp = FastMCP("test")
+    tasks.register(mcp)
+    metrics_tools.register(mcp)
+
+    # The decorator keeps the tool signatures: Context is still injected, not a parameter
+    schemas = {tool.name: tool.inputSchema for tool in await mcp.list_tools()}
+    assert set(schemas["list_tasks"]["properties"]) == {"group_id", "scan_all_groups", "fields"}
+
+    async def failing(task_id):
+        raise KscApiError("Failed to get task state")
+
+    monkeypatch.setattr(ksc_service, "get_task_state", failing)
+    calls = metrics.TOOL_SECONDS.count(tool="get_task_state")
+    with pytest.raises(Exception):
+        await mcp.call_tool("get_task_state", {"task_id": "task-1"})
+    assert metrics.TOOL_SECONDS.count(tool="get_task_state") == calls + 1
+    assert metrics.TOOL_ERRORS.value(tool="get_task_state", error="KscApiError") >= 1
+
+    calls = metrics.TOOL_SECONDS.count(tool="ksc_metrics")
+    content = await mcp.call_tool("ksc_metrics", {})
+    assert metrics.TOOL_SECONDS.count(tool="ksc_metrics") == calls + 1
+    text = content[0][0].text if isinstance(content, tuple) else content[0].text
+    assert "mcp_tool_duration_seconds_count" in text
+    assert "ksc_limiter_limit" in text
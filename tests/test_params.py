@@ -0,0 +1,156 @@
+import json
+from datetime import datetime
+
+import pytest
+from KlAkOAPI.Base import KlAkBase, KlAkResponse
+from KlAkOAPI.Codec import GetCodec, SetCodec
+from KlAkOAPI.Error import KlAkResponseError
+from KlAkOAPI.Params import (
+    KlAkArray,
+    KlAkArrayView,
+    KlAkParams,
+    KlAkParamsEncoder,
+    KlAkParamsView,
+    paramParams,
+)
+
+
+def _chunk_response(rows):
+    items = [
+        {
+            "type": "params",
+            "value": {
+                "KLHST_WKS_HOSTNAME": f"host-{i}",
+                "KLHST_WKS_LAST_INFOUDATE": {"type": "datetime", "value": "2024-01-02T03:04:05Z"},
+                "KLHST_WKS_STATUS": {"type": "long", "value": i},
+            },
+        }
+        for i in range(rows)
+    ]
+    return {"pChunk": {"KLCSP_ITERATOR_ARRAY": items}, "PxgRetVal": rows}
+
+
+def test_response_wraps_outpars_in_views_without_copying():
+    raw = _chunk_response(3)
+    response = KlAkResponse(raw)
+
+    chunk = response.OutPar("pChunk")
+    assert isinstance(chunk, KlAkParamsView)
+    items = chunk["KLCSP_ITERATOR_ARRAY"]
+    assert isinstance(items, KlAkArrayView)
+    # Shares the decoded JSON instead of copying it
+    assert items.data is raw["pChunk"]["KLCSP_ITERATOR_ARRAY"]
+
+    hosts = list(items)
+    assert [h["KLHST_WKS_HOSTNAME"] for h in hosts] == ["host-0", "host-1", "host-2"]
+    assert hosts[1]["KLHST_WKS_STATUS"] == 1
+    assert hosts[2]["KLHST_WKS_LAST_INFOUDATE"] == datetime(2024, 1, 2, 3, 4, 5)
+    assert items[-1]["KLHST_WKS_HOSTNAME"] == "host-2"
+
+
+def test_views_decode_like_eager_containers():
+    raw = _chunk_response(2)
+    lazy = KlAkResponse(json.loads(json.dumps(raw))).OutPar("pChunk")
+    eager = KlAkResponse(json.loads(json.dumps(raw)), lazy=False).OutPar("pChunk")
+    assert type(eager) is KlAkParams
+
+    for view, copy in zip(lazy["KLCSP_ITERATOR_ARRAY"], eager["KLCSP_ITERATOR_ARRAY"]):
+        for name in copy.GetNames():
+            assert view[name] == copy[name]
+            assert view.GetType(name) == copy.GetType(name)
+    assert lazy.PrintParsed() == eager.PrintParsed()
+
+
+def test_views_type_and_print_floats_and_untyped_dicts_like_eager_containers():
+    raw = {
+        "PxgRetVal": {
+            "ratio": 0.5,
+            "info": {"name": "host", "load": 1.5},
+            "rows": [2.5, {"id": 1}, {"type": "long", "value": 3}],
+        }
+    }
+    lazy = KlAkResponse(json.loads(json.dumps(raw))).RetVal()
+    eager = KlAkResponse(json.loads(json.dumps(raw)), lazy=False).RetVal()
+
+    for name in eager.GetNames():
+        assert lazy.GetType(name) == eager.GetType(name)
+    assert lazy.GetType("ratio") == "paramDouble"
+    assert lazy.GetType("info") == "paramParams"
+    assert lazy["info"].GetType("load") == eager["info"].GetType("load")
+    rows = lazy["rows"]
+    assert [rows.GetType(i) for i in range(-3, 3)] == [
+        eager["rows"].GetType(i) for i in range(-3, 3)
+    ]
+    assert str(lazy) == str(eager)
+
+
+def test_views_copy_on_write_into_containers():
+    raw = _chunk_response(1)
+    view = KlAkResponse(raw).OutPar("pChunk")
+    items = view["KLCSP_ITERATOR_ARRAY"]
+    host = items[0]
+
+    host["name"] = "x"
+    host.AddLong("id", 7)
+    assert type(host) is KlAkParams
+    assert (host["name"], host["id"], host["KLHST_WKS_STATUS"]) == ("x", 7, 0)
+    # The response's views and decoded JSON are unchanged
+    assert "name" not in items[0] and "name" not in raw["pChunk"]["KLCSP_ITERATOR_ARRAY"][0]
+
+    items.AddInt(1)
+    assert type(items) is KlAkArray and len(items) == 2
+    assert len(view["KLCSP_ITERATOR_ARRAY"]) == 1
+    del host["name"]
+    assert "name" not in host
+
+    editable = KlAkParams(host)
+    editable.AddString("name", "x")
+    assert "name" not in host
+    assert type(KlAkArray(view["KLCSP_ITERATOR_ARRAY"])) is KlAkArray
+
+    # Views are accepted wherever KlAkParams/KlAkArray are
+    assert paramParams(view)["value"] is view.data
+    assert json.loads(json.dumps({"p": view}, cls=KlAkParamsEncoder))["p"] == view.data
+
+
+def test_modified_result_matches_eager_container():
+    # The way samples/sample_user_eff_rights_report.py edits a report info before AddReport
+    raw = {"PxgRetVal": {"RPT_DN": "Default", "RPT_TYPE": {"type": "long", "value": 40}}}
+    results = [
+        KlAkResponse(json.loads(json.dumps(raw)), lazy=lazy).RetVal() for lazy in (True, False)
+    ]
+    extra = KlAkParams({})
+    extra.AddLong("KLRPT_TRUSTEE_ID", 5)
+    for info in results:
+        info["RPT_DN"] = "Sample RT_USERS_EFF_RIGHTS"
+        info.AddParams("RPT_EXTRA_DATA", extra)
+
+    lazy, eager = results
+    assert type(lazy) is KlAkParams
+    assert lazy.data == eager.data
+    assert lazy["RPT_EXTRA_DATA"]["KLRPT_TRUSTEE_ID"] == 5
+
+
+@pytest.mark.parametrize("name", ["json", "orjson"])
+def test_codecs_round_trip_params_and_bytes(name):
+    pytest.importorskip(name)
+    previous = SetCodec(name)
+    try:
+        codec = GetCodec()
+        params = KlAkParams({"name": "host"})
+        params.AddLong("id", 2**40)
+        body = KlAkBase().EncodeParams({"pParams": params, "vec": KlAkArray(["a", "b"]), "n": 1})
+        assert json.loads(body) == {"pParams": params.data, "vec": ["a", "b"], "n": 1}
+
+        raw = json.dumps(_chunk_response(2)).encode("utf-8")
+        parsed = KlAkBase().ParseResponse(200, raw)
+        assert parsed.OutPar("pChunk")["KLCSP_ITERATOR_ARRAY"][1]["KLHST_WKS_HOSTNAME"] == "host-1"
+        assert codec.loads(raw.decode("utf-8")) == codec.loads(raw)
+    finally:
+        SetCodec(previous)
+
+
+def test_parse_response_error_accepts_bytes():
+    with pytest.raises(KlAkResponseError) as exc:
+        KlAkBase().ParseResponse(500, "Внутренняя ошибка".encode("utf-8"))
+    assert "Внутренняя ошибка" in str(exc.value.data)
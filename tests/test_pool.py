@@ -0,0 +1,147 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests.exceptions import ReadTimeout
+
+from server.ksc.errors import KscApiError, KscBusyError, KscError
+from server.ksc.pool import KscSessionPool
+
+
+def _pool(**kwargs):
+    factory = MagicMock(side_effect=lambda: MagicMock(connected=True))
+    return KscSessionPool(factory, **kwargs), factory
+
+
+def test_concurrent_checkouts_get_distinct_sessions():
+    pool, factory = _pool(size=2)
+    first = pool.checkout()
+    second = pool.checkout()
+    assert first.server is not second.server
+    assert factory.call_count == 2
+
+    with pytest.raises(KscBusyError):
+        pool.checkout(timeout=0.01)
+
+    pool.checkin(first)
+    assert pool.checkout(timeout=0.01) is first
+
+
+def test_checkout_by_key_returns_owning_session():
+    pool, _ = _pool(size=2)
+    first = pool.checkout()
+    second = pool.checkout()
+    pool.checkin(second)
+    pool.checkin(first)
+
+    assert pool.checkout(key=second.key) is second
+
+    pool.checkin(second, discard=True)
+    with pytest.raises(KscError):
+        pool.checkout(key=second.key)
+
+
+def test_old_sessions_are_recycled():
+    pool, factory = _pool(size=1, max_age=0)
+    member = pool.checkout()
+    pool.checkin(member)
+
+    replacement = pool.checkout()
+    assert replacement is not member
+    member.server.Disconnect.assert_called_once()
+    assert factory.call_count == 2
+
+
+def test_failed_health_check_replaces_session():
+    pool, factory = _pool(size=1, health_check_interval=0)
+    member = pool.checkout()
+    pool.checkin(member)
+
+    with patch("server.ksc.pool.KlAkSession") as session_cls:
+        session_cls.return_value.Ping.side_effect = Exception("session expired")
+        replacement = pool.checkout()
+
+    assert replacement is not member
+    assert factory.call_count == 2
+
+
+def test_checkin_and_discard_hooks():
+    checked_in, discarded = [], []
+    factory = MagicMock(side_effect=lambda: MagicMock(connected=True))
+    pool = KscSessionPool(
+        factory, size=1, on_checkin=checked_in.append, on_discard=discarded.append
+    )
+
+    member = pool.checkout()
+    pool.checkin(member)
+    assert checked_in == [member]
+    assert pool.is_idle(member.key)
+
+    member = pool.checkout()
+    assert not pool.is_idle(member.key)
+    pool.checkin(member, discard=True)
+    assert discarded == [member]
+    assert checked_in == [member]
+
+
+def test_session_with_wrapped_connection_error_is_discarded():
+    discarded = []
+    factory = MagicMock(side_effect=lambda: MagicMock(connected=True))
+    pool = KscSessionPool(factory, size=1, on_discard=discarded.append)
+
+    with pytest.raises(KscApiError):
+        with pool.session() as member:
+            try:
+                raise ReadTimeout("read timed out")
+            except ReadTimeout as e:
+                raise KscApiError(f"Failed to list hosts: {e}")
+
+    assert discarded == [member]
+    with pytest.raises(KscApiError):
+        with pool.session() as other:
+            raise KscApiError("Failed to move host: no such group")
+    assert pool.is_idle(other.key)
+
+
+def test_drain_waits_for_busy_sessions():
+    import threading
+
+    pool, _ = _pool(size=2)
+    member = pool.checkout()
+    assert not pool.drain(0.05)
+
+    threading.Timer(0.1, pool.checkin, args=(member,)).start()
+    assert pool.drain(2)
+    assert pool.stats()["in_use"] == 0
+
+
+def test_release_wakes_the_waiter_for_that_session():
+    import threading
+    import time
+
+    pool, _ = _pool(size=2)
+    first = pool.checkout()
+    second = pool.checkout()
+    done = []
+
+    def use(key):
+        member = pool.checkout(key=key, timeout=2)
+        pool.checkin(member)
+        done.append(key)
+
+    # Waiting in this order, a single notify on first's check-in would only wake the
+    # waiter for second, and the others would sleep until the timeout
+    waiters = [threading.Thread(target=use, args=(key,)) for key in (second.key, first.key, None)]
+    for waiter in waiters:
+        waiter.start()
+        time.sleep(0.05)
+
+    started = time.monotonic()
+    pool.checkin(first)
+    waiters[1].join(1)
+    waiters[2].join(1)
+    assert time.monotonic() - started < 1
+    assert set(done) == {first.key, None}
+
+    pool.checkin(second)
+    waiters[0].join(1)
+    assert second.key in done
@@ -0,0 +1,60 @@
+import time
+from unittest.mock import patch
+
+from server.ksc.result_cache import ResultCache, approx_size
+from server.models import HostInfo
+
+
+def _host(i: int) -> HostInfo:
+    return HostInfo(id=f"host-{i}", name=f"host-{i}", display_name=f"Host {i}", group_id=1)
+
+
+def test_entries_expire_after_ttl():
+    cache = ResultCache()
+    cache.put("k", [_host(1)], ttl=10)
+    assert cache.get("k")[0].id == "host-1"
+
+    with patch("server.ksc.result_cache.time.monotonic", return_value=time.monotonic() + 11):
+        assert cache.get("k") is None
+    assert len(cache) == 0
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_entries_are_evicted_over_budget():
+    entry_size = approx_size([_host(0)])
+    cache = ResultCache(max_bytes=entry_size * 3)
+    for i in range(3):
+        cache.put(i, [_host(i)], ttl=60)
+    cache.get(0)  # 1 is now the least recently used
+
+    cache.put(3, [_host(3)], ttl=60)
+
+    assert cache.get(1) is None
+    assert all(cache.get(i) is not None for i in (0, 2, 3))
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] <= cache.max_bytes
+    # A single value over the whole budget is not cached at all
+    assert not cache.put("huge", [_host(i) for i in range(10)], ttl=60)
+
+
+def test_invalidate_drops_entries_by_tag():
+    cache = ResultCache()
+    cache.put("page", [_host(1), _host(2)], ttl=60, tags=[("host", "host-1"), ("host", "host-2")])
+    cache.put("details", _host(1), ttl=60, tags=[("host", "host-1")])
+    cache.put("other", _host(3), ttl=60, tags=[("host", "host-3")])
+
+    assert cache.invalidate(("host", "host-1")) == 2
+    assert cache.get("page") is None
+    assert cache.get("details") is None
+    assert cache.get("other") is not None
+    assert cache.peek_tagged(("host", "host-2")) == []
+
+
+def test_result_computed_before_invalidation_is_not_stored():
+    cache = ResultCache()
+    generation = cache.generation
+    cache.invalidate(("host", "host-1"))
+
+    assert not cache.put("details", _host(1), ttl=60, generation=generation)
+    assert cache.put("details", _host(1), ttl=60, generation=cache.generation)
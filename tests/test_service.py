@@ -1,7 +1,16 @@
+import time
+
 import pytest
-from unittest.mock import AsyncMock, patch
-from server.models import HostInfo
+from unittest.mock import AsyncMock, MagicMock, patch
+from KlAkOAPI.Error import KlAkResponseError
+from server.models import GroupInfo, HostInfo
+from server.ksc.chunks import ChunkSizer
+from server.ksc.cursor import HostCursor
+from server.ksc.errors import KscCursorError
+from server.ksc.inventory import HostInventory
+from server.ksc.pool import KscSessionPool
 from server.ksc.service import KscService
+from server.settings import settings
 
 @pytest.fixture
 def mock_ksc_service():
@@ -26,3 +35,324 @@ async def test_run_task(mock_ksc_service):
     mock_ksc_service.run_task.return_value = "Task started"
     result = await mock_ksc_service.run_task("task-123")
     assert result == "Task started"
+
+
+class _FakeResponse:
+    def __init__(self, retval=None, outpars=None):
+        self._retval = retval
+        self._outpars = outpars or {}
+
+    def RetVal(self):
+        return self._retval
+
+    def OutPar(self, name):
+        return self._outpars.get(name)
+
+
+def _fake_chunk_accessor(rows):
+    accessor = MagicMock()
+    accessor.GetItemsCount.return_value = _FakeResponse(retval=len(rows))
+    accessor.GetItemsChunk.side_effect = lambda acc, start, count: _FakeResponse(
+        outpars={"pChunk": {"KLCSP_ITERATOR_ARRAY": rows[start : start + count]}}
+    )
+    return accessor
+
+
+@pytest.fixture
+def paging_service():
+    rows = [{"KLHST_WKS_HOSTNAME": f"host-{i}", "KLHST_WKS_DN": f"Host {i}"} for i in range(7)]
+    accessor = _fake_chunk_accessor(rows)
+    host_group = MagicMock()
+    host_group.FindHostsAsyncGetAccessor.return_value = _FakeResponse(
+        outpars={"strAccessor": "acc-1"}
+    )
+    host_group.FindGroups.return_value = _FakeResponse(outpars={"strAccessor": "acc-1"})
+
+    service = KscService()
+    service.chunk_sizer = ChunkSizer(initial=2, min_size=2, max_size=2)
+    service._pool = KscSessionPool(
+        MagicMock,
+        size=1,
+        on_checkin=service._release_accessors,
+        on_discard=lambda member: service.accessors.forget_session(member.key),
+    )
+    checker = MagicMock()
+    checker.CheckActionState.return_value = _FakeResponse(
+        outpars={"bFinalized": True, "bSuccededFinalized": True}
+    )
+    with (
+        patch("server.ksc.service.KlAkHostGroup", return_value=host_group),
+        patch("server.ksc.service.KlAkAsyncActionStateChecker", return_value=checker),
+        patch("server.ksc.service.KlAkChunkAccessor", return_value=accessor),
+        patch.object(settings, "KSC_CHUNK_SIZE", 2),
+    ):
+        yield service, host_group, accessor
+
+
+def test_list_hosts_pages_with_cursor(paging_service):
+    service, host_group, accessor = paging_service
+
+    page = service._list_hosts_sync(limit=5)
+    assert [h.id for h in page.hosts] == [f"host-{i}" for i in range(5)]
+    assert page.total == 7
+    assert page.next_cursor is not None
+    # 5 rows in chunks of 2 -> 3 round trips
+    assert accessor.GetItemsChunk.call_count == 3
+
+    page = service._list_hosts_sync(limit=5, cursor=page.next_cursor)
+    assert [h.id for h in page.hosts] == ["host-5", "host-6"]
+    assert page.next_cursor is None
+    # Resuming must not run the search again
+    assert host_group.FindHostsAsyncGetAccessor.call_count == 1
+    # Reading the last row releases the accessor
+    assert service.accessors.open_count == 0
+    accessor.Release.assert_called_once_with("acc-1")
+
+
+def test_evicted_cursor_runs_the_search_again(paging_service):
+    service, host_group, accessor = paging_service
+    service.accessors.max_open = 1
+    accessors = iter(["acc-1", "acc-2", "acc-3"])
+    host_group.FindHostsAsyncGetAccessor.side_effect = lambda request_id: _FakeResponse(
+        outpars={"strAccessor": next(accessors)}
+    )
+
+    page = service._list_hosts_sync(status="Critical", limit=5)
+    # Another search evicts the cursor's accessor
+    service._list_hosts_sync(limit=2)
+    accessor.Release.assert_called_once_with("acc-1")
+
+    page = service._list_hosts_sync(limit=5, cursor=page.next_cursor)
+    assert [h.id for h in page.hosts] == ["host-5", "host-6"]
+    assert page.next_cursor is None
+    assert host_group.FindHostsAsync.call_count == 3
+    assert host_group.FindHostsAsync.call_args.kwargs["wstrFilter"] == (
+        service._host_filter(None, "Critical")
+    )
+
+
+def test_projected_host_search_requests_only_needed_attributes(paging_service):
+    service, host_group, _ = paging_service
+
+    page = service._list_hosts_sync(limit=5, fields=["display_name"])
+    assert page.fields == ["id", "display_name"]
+    vec_fields = host_group.FindHostsAsync.call_args.kwargs["vecFieldsToReturn"]
+    assert vec_fields == ["KLHST_WKS_DN", "KLHST_WKS_HOSTNAME"]
+
+    # The projection sticks to the cursor; an unprojected search needs its own accessor
+    page = service._list_hosts_sync(limit=5, cursor=page.next_cursor)
+    assert page.fields == ["id", "display_name"]
+    assert service._list_hosts_sync(limit=5).fields is None
+    assert host_group.FindHostsAsync.call_count == 2
+
+
+def test_list_hosts_rejects_expired_cursor(paging_service):
+    service, _, _ = paging_service
+    expired = HostCursor(
+        session="s", accessor="acc-1", offset=5, total=7, expires_at=time.time() - 1
+    )
+
+    with pytest.raises(KscCursorError):
+        service._list_hosts_sync(cursor=expired.encode())
+
+
+def test_list_groups_releases_accessor(paging_service):
+    service, host_group, accessor = paging_service
+
+    service._list_groups_sync(fields=["id", "name"])
+
+    assert host_group.FindGroups.call_args.kwargs["vecFieldsToReturn"] == ["id", "name"]
+    accessor.Release.assert_called_once_with("acc-1")
+    assert service.accessors.open_count == 0
+
+
+def test_identical_host_search_reuses_accessor_until_close(paging_service):
+    service, host_group, accessor = paging_service
+
+    first = service._list_hosts_sync(limit=5)
+    second = service._list_hosts_sync(limit=5)
+
+    assert [h.id for h in second.hosts] == [h.id for h in first.hosts]
+    assert host_group.FindHostsAsyncGetAccessor.call_count == 1
+    assert service.accessors.stats()["reused"] == 1
+    assert service.accessors.open_count == 1
+    accessor.Release.assert_not_called()
+
+    service.close()
+    accessor.Release.assert_called_once_with("acc-1")
+    assert service.accessors.open_count == 0
+
+
+async def test_concurrent_identical_host_searches_are_coalesced(paging_service):
+    import anyio
+
+    service, host_group, accessor = paging_service
+    find_hosts = host_group.FindHostsAsyncGetAccessor.return_value
+    host_group.FindHostsAsyncGetAccessor.side_effect = (
+        lambda *a, **kw: time.sleep(0.05) or find_hosts
+    )
+    pages = []
+
+    async def call(status):
+        pages.append(await service.list_hosts_page(status=status, limit=5))
+
+    async with anyio.create_task_group() as tg:
+        for status in ("Critical", "critical", "CRITICAL"):
+            tg.start_soon(call, status)
+
+    # One FindHosts and one read of the first page serve all three callers
+    assert host_group.FindHostsAsyncGetAccessor.call_count == 1
+    assert accessor.GetItemsChunk.call_count == 3
+    assert all(page is pages[0] for page in pages)
+    assert service.flights.stats()["coalesced_by_method"] == {"list_hosts": 2}
+
+
+async def test_read_results_are_cached_until_a_move_invalidates_them(paging_service):
+    service, host_group, accessor = paging_service
+    host_group.FindHostsAsyncGetAccessor.return_value = _FakeResponse(
+        outpars={"strAccessor": "acc-hosts"}
+    )
+    service.accessors.lookup = lambda query, available=None: None  # no accessor reuse
+    groups = [GroupInfo(id=i, name=f"g{i}", full_name=f"g{i}") for i in (1, 2, 3)]
+    list_groups_sync = MagicMock(return_value=groups)
+    service._list_groups_sync = list_groups_sync
+
+    await service.list_hosts_page(limit=5)
+    await service.list_hosts_page(limit=5)
+    await service.list_groups(group_name="g1")
+    await service.list_groups(group_name="g3")
+    await service.list_groups(group_name="g3")
+    assert host_group.FindHostsAsyncGetAccessor.call_count == 1
+    assert list_groups_sync.call_count == 2
+
+    # host-2 was listed in group 0; moving it to group 3 drops the page and both
+    # group listings (their host counts changed)
+    await service.move_host("host-2", 3)
+    await service.list_hosts_page(limit=5)
+    await service.list_groups(group_name="g3")
+    assert host_group.FindHostsAsyncGetAccessor.call_count == 2
+    assert list_groups_sync.call_count == 3
+
+
+def test_list_hosts_served_from_inventory(paging_service, tmp_path):
+    service, host_group, _ = paging_service
+    service.inventory = HostInventory(str(tmp_path / "inventory.db"))
+
+    service._sync_inventory_sync(full=True)
+    assert host_group.FindHostsAsyncGetAccessor.call_count == 1
+
+    page = service._list_hosts_sync(limit=4)
+    assert [h.id for h in page.hosts] == [f"host-{i}" for i in range(4)]
+    assert page.total == 7
+    assert page.staleness_seconds is not None
+
+    page = service._list_hosts_sync(limit=4, cursor=page.next_cursor)
+    assert [h.id for h in page.hosts] == ["host-4", "host-5", "host-6"]
+    assert page.next_cursor is None
+    # Served locally: no further KSC searches
+    assert host_group.FindHostsAsyncGetAccessor.call_count == 1
+
+
+class _FakeTasks:
+    """Per-group task iterators; the global task is visible from every group."""
+
+    def __init__(self, server):
+        self._iters = {}
+
+    def ResetTasksIterator(self, nGroupId, **kwargs):
+        tasks = [f"task-{nGroupId}", "task-global"]
+        self._iters[str(nGroupId)] = iter(tasks)
+        return _FakeResponse(outpars={"strTaskIteratorId": str(nGroupId)})
+
+    def GetNextTask(self, iter_id):
+        task = next(self._iters[iter_id], None)
+        data = {"TASK_UNIQUE_ID": task, "TASK_NAME": task} if task else None
+        return _FakeResponse(outpars={"pTaskData": data})
+
+    get_task_calls = 0
+
+    def GetTask(self, task_id):
+        _FakeTasks.get_task_calls += 1
+        return _FakeResponse(retval={"DisplayName": f"Display {task_id}"})
+
+    def ReleaseTasksIterator(self, iter_id):
+        pass
+
+
+async def test_list_tasks_scans_groups_in_parallel_and_dedups():
+    service = KscService()
+    service._pool = KscSessionPool(MagicMock, size=4)
+    service.list_groups = AsyncMock(
+        return_value=[GroupInfo(id=i, name=f"g{i}", full_name=f"g{i}") for i in range(1, 6)]
+    )
+    progress = []
+
+    async def on_progress(done, total, tasks):
+        progress.append((done, total, len(tasks)))
+
+    with patch("server.ksc.service.KlAkTasks", _FakeTasks):
+        tasks = await service.list_tasks(scan_all_groups=True, on_progress=on_progress)
+
+    ids = [t.id for t in tasks]
+    assert sorted(ids) == sorted([f"task-{i}" for i in range(1, 6)] + ["task--1", "task-global"])
+    assert len(ids) == len(set(ids))
+    assert tasks[0].name.startswith("Display ")
+    # One notification per group (5 groups + global), reporting 7 unique tasks overall
+    assert [p[0] for p in progress] == list(range(1, 7))
+    assert all(p[1] == 6 for p in progress)
+    assert sum(p[2] for p in progress) == 7
+
+
+class _ExpiringTasks(_FakeTasks):
+    """The session expires on the second GetNextTask, after one task was read."""
+
+    reads = 0
+
+    def GetNextTask(self, iter_id):
+        _ExpiringTasks.reads += 1
+        if _ExpiringTasks.reads == 2:
+            raise KlAkResponseError("Session is not authenticated", status_code=401)
+        return super().GetNextTask(iter_id)
+
+
+async def test_list_tasks_relogin_retry_keeps_tasks_read_before_the_failure():
+    service = KscService()
+    service._pool = KscSessionPool(MagicMock, size=1)
+    _ExpiringTasks.reads = 0
+
+    with (
+        patch("server.ksc.service.KlAkTasks", _ExpiringTasks),
+        patch.object(settings, "KSC_CACHE_TTL_TASKS", 0),
+    ):
+        tasks = await service.list_tasks(group_id=1)
+
+    assert service.auth_stats["retries"] == 1
+    assert [t.id for t in tasks] == ["task-1", "task-global"]
+
+
+async def test_list_tasks_resolves_names_from_task_catalog():
+    service = KscService()
+    service._pool = KscSessionPool(MagicMock, size=1)
+    _FakeTasks.get_task_calls = 0
+
+    with (
+        patch("server.ksc.service.KlAkTasks", _FakeTasks),
+        # Bypass the result cache so the repeated listing reaches the catalog
+        patch.object(settings, "KSC_CACHE_TTL_TASKS", 0),
+    ):
+        first = await service.list_tasks(group_id=1)
+        assert _FakeTasks.get_task_calls == 2
+        second = await service.list_tasks(group_id=1)
+
+    # The repeated listing is served from the catalog without any GetTask round trip
+    assert _FakeTasks.get_task_calls == 2
+    assert [t.name for t in second] == [t.name for t in first]
+    assert service.task_catalog.hits == 2
+
+    service.task_catalog.invalidate("task-1")
+    with (
+        patch("server.ksc.service.KlAkTasks", _FakeTasks),
+        patch.object(settings, "KSC_CACHE_TTL_TASKS", 0),
+    ):
+        await service.list_tasks(group_id=1)
+    assert _FakeTasks.get_task_calls == 3
@@ -0,0 +1,155 @@
+import anyio
+import pytest
+
+from server.ksc.singleflight import SingleFlight
+
+
+async def test_concurrent_identical_calls_share_one_execution():
+    flights = SingleFlight()
+    executions = 0
+
+    async def fetch():
+        nonlocal executions
+        executions += 1
+        await anyio.sleep(0.05)
+        return ["host-1"]
+
+    results = []
+
+    async def call():
+        results.append(await flights.do(("list_hosts", "(KLHST_WKS_STATUS_ID=1)"), fetch))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(call)
+
+    assert executions == 1
+    assert results == [["host-1"]] * 5
+    assert flights.stats() == {
+        "calls": 5,
+        "executed": 1,
+        "coalesced": 4,
+        "in_flight": 0,
+        "coalesced_by_method": {"list_hosts": 4},
+    }
+
+    # Once the call has finished, the next one goes to KSC again
+    await flights.do(("list_hosts", "(KLHST_WKS_STATUS_ID=1)"), fetch)
+    assert executions == 2
+
+
+async def test_different_keys_do_not_coalesce():
+    flights = SingleFlight()
+
+    async def fetch():
+        await anyio.sleep(0.01)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(flights.do, ("get_task_state", "a"), fetch)
+        tg.start_soon(flights.do, ("get_task_state", "b"), fetch)
+
+    assert flights.executed == 2
+    assert flights.coalesced == 0
+
+
+async def test_error_is_shared_by_all_waiters():
+    flights = SingleFlight()
+    errors = []
+
+    async def fail():
+        await anyio.sleep(0.02)
+        raise RuntimeError("boom")
+
+    async def call():
+        with pytest.raises(RuntimeError) as excinfo:
+            await flights.do(("list_groups", None, None), fail)
+        errors.append(excinfo.value)
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(call)
+
+    assert len(errors) == 3
+    assert flights.executed == 1
+
+
+async def test_progress_reaches_every_caller_including_late_joiners():
+    flights = SingleFlight()
+    step = anyio.Event()
+    seen = {"first": [], "second": []}
+
+    async def scan(publish):
+        await publish(1, 2)
+        await step.wait()
+        await publish(2, 2)
+        return "done"
+
+    def listener(name):
+        async def on_progress(done, total):
+            seen[name].append(done)
+
+        return on_progress
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(flights.do_with_progress, ("list_tasks", "all"), scan, listener("first"))
+        await anyio.sleep(0.01)
+        tg.start_soon(flights.do_with_progress, ("list_tasks", "all"), scan, listener("second"))
+        await anyio.sleep(0.01)
+        step.set()
+
+    assert seen == {"first": [1, 2], "second": [1, 2]}
+    assert flights.coalesced == 1
+
+
+async def test_cancelled_follower_stops_receiving_progress():
+    flights = SingleFlight()
+    step = anyio.Event()
+    seen = []
+
+    async def scan(publish):
+        await step.wait()
+        await publish(1, 1)
+        return "done"
+
+    async def on_progress(done, total):
+        seen.append(done)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(flights.do_with_progress, ("list_tasks", "all"), scan)
+        await anyio.sleep(0.01)
+        with anyio.move_on_after(0.01):
+            await flights.do_with_progress(("list_tasks", "all"), scan, on_progress)
+        step.set()
+
+    assert seen == []
+
+
+async def test_waiters_take_over_when_leader_is_cancelled():
+    flights = SingleFlight()
+    executions = 0
+
+    async def fetch():
+        nonlocal executions
+        executions += 1
+        await anyio.sleep(0.05)
+        return executions
+
+    results = []
+    leader_scope = anyio.CancelScope()
+
+    async def leader():
+        with leader_scope:
+            await flights.do(("get_task_state", "t"), fetch)
+
+    async def follower():
+        results.append(await flights.do(("get_task_state", "t"), fetch))
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(leader)
+        await anyio.sleep(0.01)
+        tg.start_soon(follower)
+        await anyio.sleep(0.01)
+        leader_scope.cancel()
+
+    assert executions == 2
+    assert results == [2]
@@ -0,0 +1,87 @@
+import json
+
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from server.models import GroupInfo, HostInfo, HostPage, projection
+from server.settings import settings
+from server.tools import groups, hosts
+from server.tools.output import render_compact
+
+
+def _mcp(monkeypatch) -> FastMCP:
+    from server.ksc.service import ksc_service
+
+    async def list_hosts_page(**kwargs):
+        host = HostInfo(
+            id="host-1",
+            name="host-1",
+            display_name="Host\t1",
+            group_id=2,
+            status="[OK] Status: 1 (Visible) | RTP: Running",
+        )
+        fields = projection(kwargs.get("fields"), HostInfo)
+        return HostPage(hosts=[host], total=3, next_cursor="abc", fields=fields)
+
+    async def list_groups(**kwargs):
+        return [GroupInfo(id=1, name="Servers", full_name="Servers", host_count=4)]
+
+    monkeypatch.setattr(ksc_service, "list_hosts_page", list_hosts_page)
+    monkeypatch.setattr(ksc_service, "list_groups", list_groups)
+    mcp = FastMCP("test")
+    hosts.register(mcp)
+    groups.register(mcp)
+    return mcp
+
+
+async def test_listings_return_structured_content(monkeypatch):
+    mcp = _mcp(monkeypatch)
+    schemas = {tool.name: tool.outputSchema for tool in await mcp.list_tools()}
+    # Plain objects: clients run jsonschema over every result, rows would cost per row
+    assert "properties" not in schemas["get_hosts"]
+    assert "hosts (list of HostInfo: id, name," in schemas["get_hosts"]["description"]
+    assert "result (list of GroupInfo: id," in schemas["list_groups"]["description"]
+
+    monkeypatch.setattr(settings, "MCP_TOOL_TEXT", "none")
+    # The client checks structured content against the advertised output schema
+    async with create_connected_server_and_client_session(mcp) as client:
+        result = await client.call_tool("get_hosts", {"query": {"limit": 1}})
+        assert not result.isError
+        assert result.content == []
+        assert result.structuredContent["total"] == 3
+        assert result.structuredContent["hosts"][0]["display_name"] == "Host\t1"
+
+        monkeypatch.setattr(settings, "MCP_TOOL_TEXT", "json")
+        result = await client.call_tool("list_groups", {"query": {}})
+        assert json.loads(result.content[0].text) == result.structuredContent
+        assert result.structuredContent["result"][0]["host_count"] == 4
+
+        monkeypatch.setattr(settings, "MCP_TOOL_TEXT", "compact")
+        result = await client.call_tool("get_hosts", {"query": {"limit": 1}})
+        assert result.content[0].text == (
+            "total: 3\nnext_cursor: abc\npartial: false\nhosts:\n"
+            "id\tname\tdisplay_name\tgroup_id\tgroup_name\tstatus\n"
+            "host-1\thost-1\tHost 1\t2\tUnknown\t[OK] Status: 1 (Visible) | RTP: Running"
+        )
+
+
+async def test_listings_trim_projected_fields(monkeypatch):
+    mcp = _mcp(monkeypatch)
+    monkeypatch.setattr(settings, "MCP_TOOL_TEXT", "compact")
+    async with create_connected_server_and_client_session(mcp) as client:
+        result = await client.call_tool("get_hosts", {"query": {"fields": ["name"]}})
+        assert not result.isError
+        assert result.structuredContent["hosts"] == [{"id": "host-1", "name": "host-1"}]
+        assert result.content[0].text.endswith("hosts:\nid\tname\nhost-1\thost-1")
+
+        result = await client.call_tool("list_groups", {"query": {"fields": ["host_count"]}})
+        assert result.structuredContent == {"result": [{"id": 1, "host_count": 4}]}
+
+        result = await client.call_tool("get_hosts", {"query": {"fields": ["serial"]}})
+        assert result.isError
+
+
+def test_compact_rendering_of_lists():
+    assert render_compact({"result": []}) == "result: none"
+    rows = [{"id": 1, "tags": ["a", "b"], "note": None}, {"id": 2, "tags": [], "note": None}]
+    assert render_compact({"result": rows}) == 'id\ttags\n1\t["a","b"]\n2\t'
@@ -0,0 +1,83 @@
+import json
+
+from mcp.server.fastmcp import FastMCP
+
+from server import tracing
+from server.ksc.service import KscService
+from server.settings import settings
+
+
+def _spans(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_spans_nest_and_record_errors(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracing.configure("file", str(path))
+    try:
+        with tracing.span("outer", **{"ksc.group_id": 3}) as outer:
+            outer.set_attribute("ksc.items", 2)
+            try:
+                with tracing.span("inner"):
+                    raise ValueError("boom")
+            except ValueError:
+                pass
+    finally:
+        tracing.configure("none")
+
+    inner, outer = _spans(path)
+    assert inner["parent_id"] == outer["context"]["span_id"]
+    assert inner["context"]["trace_id"] == outer["context"]["trace_id"]
+    assert outer["parent_id"] is None
+    assert outer["attributes"] == {"ksc.group_id": 3, "ksc.items": 2}
+    assert outer["status"] == {"status_code": "OK"}
+    assert inner["status"] == {"status_code": "ERROR", "description": "ValueError: boom"}
+    assert tracing.current_span() is tracing.NOOP_SPAN
+
+
+async def test_tool_call_is_traced_down_to_kloapi_requests(fake_ksc, monkeypatch, tmp_path):
+    from server.tools import hosts
+
+    monkeypatch.setattr(settings, "KSC_HOST", fake_ksc.url)
+    monkeypatch.setattr(settings, "KSC_USERNAME", "user")
+    monkeypatch.setattr(settings, "KSC_PASSWORD", "pass")
+    service = KscService()
+    monkeypatch.setattr(hosts, "ksc_service", service)
+    mcp = FastMCP("test")
+    hosts.register(mcp)
+
+    path = tmp_path / "traces.jsonl"
+    tracing.configure("file", str(path))
+    try:
+        await mcp.call_tool("get_hosts", {"query": {"status": "Critical", "limit": 5}})
+    finally:
+        tracing.configure("none")
+        service.close()
+
+    spans = _spans(path)
+    by_id = {span["context"]["span_id"]: span for span in spans}
+
+    def ancestry(span):
+        names = []
+        while span is not None:
+            names.append(span["name"])
+            span = by_id.get(span["parent_id"])
+        return names
+
+    assert len({span["context"]["trace_id"] for span in spans}) == 1
+    request = next(s for s in spans if s["name"] == "ChunkAccessor.GetItemsChunk")
+    assert ancestry(request) == [
+        "ChunkAccessor.GetItemsChunk",
+        "read_chunk",
+        "KscService.list_hosts_page",
+        "tool get_hosts",
+    ]
+    assert request["attributes"]["http.response.status_code"] == 200
+    assert request["attributes"]["http.response.body.size"] > 0
+    chunk = by_id[request["parent_id"]]
+    assert chunk["attributes"] == {"ksc.offset": 0, "ksc.count": 5, "ksc.items": 5}
+    search = next(s for s in spans if s["name"] == "find_hosts")
+    assert search["attributes"]["ksc.total"] == 20
+    service_span = next(s for s in spans if s["name"] == "KscService.list_hosts_page")
+    assert service_span["attributes"]["ksc.items"] == 5
+    assert service_span["attributes"]["ksc.cache_hit"] is False